@@ -15,7 +15,6 @@ import re
 import os
 import sys
 import argparse
-import copy
 from pathlib import Path
 from collections import Counter
 import yaml
@@ -55,6 +54,8 @@ DEFAULT_FILTERS = {
 class SRTSegment:
     """Represents a single SRT subtitle segment"""
 
+    __slots__ = ('index', 'start_time', 'end_time', 'text')
+
     def __init__(self, index, start_time, end_time, text):
         self.index = index
         self.start_time = start_time
@@ -86,38 +87,60 @@ class SRTSegment:
         return f"{self.index}\n{self.start_time} --> {self.end_time}\n{self.text}\n"
 
 
-def load_srt(file_path):
-    """Load SRT file into segments"""
+def _parse_block(lines):
+    """Build an SRTSegment from one block's lines, or None if it isn't a valid cue"""
+    if len(lines) < 3:
+        return None
+    try:
+        index = int(lines[0])
+    except ValueError:
+        return None
+    times = lines[1]
+    if '-->' not in times:
+        return None
+    start, end = times.split('-->', 1)
+    return SRTSegment(index, start.strip(), end.strip(), '\n'.join(lines[2:]))
+
+
+def iter_srt(file_path):
+    """Yield segments from an SRT file as it is read, one block at a time"""
     with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    segments = []
-    blocks = re.split(r'\n\s*\n', content.strip())
-
-    for block in blocks:
-        lines = block.strip().split('\n')
-        if len(lines) >= 3:
-            try:
-                index = int(lines[0])
-                times = lines[1]
-                text = '\n'.join(lines[2:])
-
-                if '-->' in times:
-                    start, end = times.split('-->')
-                    segment = SRTSegment(index, start.strip(), end.strip(), text)
-                    segments.append(segment)
-            except (ValueError, IndexError):
+        lines = []
+        for line in f:
+            line = line.rstrip('\n')
+            if line.strip():
+                lines.append(line)
                 continue
+            # Blank (or whitespace-only) line ends a block
+            if lines:
+                segment = _parse_block(lines)
+                if segment is not None:
+                    yield segment
+                lines = []
+        if lines:
+            segment = _parse_block(lines)
+            if segment is not None:
+                yield segment
 
-    return segments
 
+def load_srt(file_path):
+    """Load SRT file into segments"""
+    return list(iter_srt(file_path))
 
-def save_srt(segments, file_path):
-    """Save segments to SRT file"""
+
+def write_srt_stream(segments, file_path):
+    """Write segments to an SRT file as they are produced, renumbering from 1; returns the count"""
+    count = 0
     with open(file_path, 'w', encoding='utf-8') as f:
-        for i, seg in enumerate(segments, 1):
-            seg.index = i  # Reindex
+        for count, seg in enumerate(segments, 1):
+            seg.index = count  # Reindex
             f.write(str(seg) + '\n')
+    return count
+
+
+def save_srt(segments, file_path):
+    """Save segments to SRT file"""
+    write_srt_stream(segments, file_path)
 
 
 def analyze_repetition(text):
@@ -133,40 +156,104 @@ def analyze_repetition(text):
     return most_common / len(words)
 
 
+# Compiled form of each filters dict in use, keyed by id() (the dict is kept alongside
+# so a recycled id can't return another dict's patterns)
+_compiled_filters = {}
+
+
+def _compile_patterns(patterns):
+    """Compile regex filters; invalid ones fall back to substring matching (None)"""
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append((pattern, re.compile(pattern, re.IGNORECASE)))
+        except re.error:
+            compiled.append((pattern, None))
+    return compiled
+
+
+def compile_filters(filters):
+    """Return filters with phrases lowercased and patterns compiled, cached per dict"""
+    cached = _compiled_filters.get(id(filters))
+    if cached is not None and cached[0] is filters:
+        return cached[1]
+
+    # All bad phrases in one alternation (longest first), so a segment is checked in a
+    # single regex pass rather than one substring test per phrase
+    phrases = {phrase.lower(): phrase for phrase in filters.get('bad_phrases', []) if phrase}
+    phrase_re = None
+    if phrases:
+        phrase_re = re.compile('|'.join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)))
+
+    compiled = {
+        'bad_phrases': (phrase_re, phrases),
+        'garbage_patterns': _compile_patterns(filters.get('garbage_patterns', [])),
+        'repeated_patterns': _compile_patterns(filters.get('repeated_patterns', [])),
+    }
+    if len(_compiled_filters) >= 32:
+        _compiled_filters.clear()
+    _compiled_filters[id(filters)] = (filters, compiled)
+    return compiled
+
+
+def _find_phrase(bad_phrases, text_lower):
+    """A bad phrase contained in text_lower, or None"""
+    phrase_re, phrases = bad_phrases
+    if phrase_re is None:
+        return None
+    match = phrase_re.search(text_lower)
+    return phrases[match.group(0)] if match else None
+
+
+def _find_pattern(patterns, text, text_lower):
+    """First pattern matching text, or None"""
+    for pattern, regex in patterns:
+        if regex is None:
+            if pattern.lower() in text_lower:
+                return pattern
+        elif regex.search(text):
+            return pattern
+    return None
+
+
+# Repetitions that shorten_repeated_patterns collapses (word 5+ times, 3-15 letter
+# word 4+ times, character 11+ times)
+_WORD_REP_RE = re.compile(r'(\b\w+\b)((?:,?\s*\1){4,})', re.IGNORECASE)
+_PHRASE_REP_RE = re.compile(r'(\b\w{3,15}\b)((?:\s+\1){3,})', re.IGNORECASE)
+_CHAR_REP_RE = re.compile(r'(\w)\1{10,}')
+
+
 def shorten_repeated_patterns(text):
     """Shorten repeated patterns in text instead of removing completely"""
     modified = False
     original_text = text
 
     # Pattern 1: Word repeated 5+ times (e.g., "je, je, je, je, je" -> "je, je")
-    pattern1 = r'(\b\w+\b)((?:,?\s*\1){4,})'
     def replace_word_rep(match):
         word = match.group(1)
         # Keep 1-2 instances instead of all
         return f"{word}, {word} [repeated]"
 
-    text = re.sub(pattern1, replace_word_rep, text, flags=re.IGNORECASE)
+    text = _WORD_REP_RE.sub(replace_word_rep, text)
     if text != original_text:
         modified = True
         original_text = text
 
     # Pattern 2: Short syllables repeated excessively (e.g., "Privećajuće" repeated)
-    pattern2 = r'(\b\w{3,15}\b)((?:\s+\1){3,})'
     def replace_phrase_rep(match):
         phrase = match.group(1)
         return f"{phrase} {phrase} [repeated]"
 
-    text = re.sub(pattern2, replace_phrase_rep, text, flags=re.IGNORECASE)
+    text = _PHRASE_REP_RE.sub(replace_phrase_rep, text)
     if text != original_text:
         modified = True
 
     # Pattern 3: Single character repeated many times (e.g., "aaaaaaaa" -> "aa")
-    pattern3 = r'(\w)\1{10,}'
     def replace_char_rep(match):
         char = match.group(1)
         return f"{char}{char} [repeated]"
 
-    text = re.sub(pattern3, replace_char_rep, text)
+    text = _CHAR_REP_RE.sub(replace_char_rep, text)
     if text != original_text:
         modified = True
 
@@ -174,15 +261,15 @@ def shorten_repeated_patterns(text):
 
 
 def clean_segment_text(segment, filters):
-    """Clean segment text by shortening repeated patterns"""
+    """Clean segment text by shortening repeated patterns (never mutates segment)"""
     text = segment.text
 
     # First, try to shorten repeated patterns
     cleaned_text, was_modified = shorten_repeated_patterns(text)
 
     if was_modified:
-        segment.text = cleaned_text
-        return segment, 'shortened', 'Repeated pattern shortened'
+        shortened = SRTSegment(segment.index, segment.start_time, segment.end_time, cleaned_text)
+        return shortened, 'shortened', 'Repeated pattern shortened'
 
     # Check for completely bad content that should be removed
     text_lower = text.lower()
@@ -191,15 +278,17 @@ def clean_segment_text(segment, filters):
     if segment.duration < filters.get('min_segment_duration', 0.3):
         return None, 'removed', "Too short duration"
 
+    compiled = compile_filters(filters)
+
     # Check bad phrases (these are removed completely)
-    for phrase in filters.get('bad_phrases', []):
-        if phrase.lower() in text_lower:
-            return None, 'removed', f"Contains bad phrase: {phrase}"
+    phrase = _find_phrase(compiled['bad_phrases'], text_lower)
+    if phrase is not None:
+        return None, 'removed', f"Contains bad phrase: {phrase}"
 
     # Check garbage patterns (these are removed completely)
-    for pattern in filters.get('garbage_patterns', []):
-        if re.search(pattern, text, re.IGNORECASE):
-            return None, 'removed', f"Matches garbage pattern: {pattern}"
+    pattern = _find_pattern(compiled['garbage_patterns'], text, text_lower)
+    if pattern is not None:
+        return None, 'removed', f"Matches garbage pattern: {pattern}"
 
     # Check for very short meaningless text
     if len(text.split()) <= 1 and len(text) < 8:
@@ -218,20 +307,22 @@ def is_hallucination(segment, filters):
     if segment.duration < filters.get('min_segment_duration', 0.3):
         return True, "Too short"
 
+    compiled = compile_filters(filters)
+
     # Check bad phrases
-    for phrase in filters.get('bad_phrases', []):
-        if phrase.lower() in text_lower:
-            return True, f"Contains bad phrase: {phrase}"
+    phrase = _find_phrase(compiled['bad_phrases'], text_lower)
+    if phrase is not None:
+        return True, f"Contains bad phrase: {phrase}"
 
     # Check repeated patterns (for detection, not removal)
-    for pattern in filters.get('repeated_patterns', []):
-        if re.search(pattern, text, re.IGNORECASE):
-            return True, f"Matches repeated pattern: {pattern}"
+    pattern = _find_pattern(compiled['repeated_patterns'], text, text_lower)
+    if pattern is not None:
+        return True, f"Matches repeated pattern: {pattern}"
 
     # Check garbage patterns
-    for pattern in filters.get('garbage_patterns', []):
-        if re.search(pattern, text, re.IGNORECASE):
-            return True, f"Matches garbage pattern: {pattern}"
+    pattern = _find_pattern(compiled['garbage_patterns'], text, text_lower)
+    if pattern is not None:
+        return True, f"Matches garbage pattern: {pattern}"
 
     # Check repetition ratio
     repetition = analyze_repetition(text)
@@ -296,13 +387,10 @@ def cleanup_srt(input_path, output_path=None, filters=None, dry_run=False):
     shortened = 0
 
     for seg in segments:
-        # Make a copy to avoid modifying original
-        seg_copy = copy.deepcopy(seg)
-
-        result_seg, action, reason = clean_segment_text(seg_copy, filters)
+        result_seg, action, reason = clean_segment_text(seg, filters)
 
         if action == 'kept':
-            clean_segments.append(seg_copy)
+            clean_segments.append(seg)
         elif action == 'shortened':
             clean_segments.append(result_seg)
             shortened += 1
@@ -323,13 +411,46 @@ def cleanup_srt(input_path, output_path=None, filters=None, dry_run=False):
     return clean_segments, issues
 
 
+def clean_one_file(file_path, filters):
+    """
+    Clean an SRT file in place, returning (shortened, removed, kept) counts.
+    Segments stream from the file into a temporary sibling that then replaces it,
+    so only one segment is held in memory at a time.
+    """
+    counts = {'shortened': 0, 'removed': 0}
+
+    def cleaned():
+        for seg in iter_srt(file_path):
+            result_seg, action, reason = clean_segment_text(seg, filters)
+            if action == 'removed':
+                counts['removed'] += 1
+                continue
+            if action == 'shortened':
+                counts['shortened'] += 1
+            yield result_seg
+
+    tmp_path = file_path + '.tmp'
+    try:
+        kept = write_srt_stream(cleaned(), tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return counts['shortened'], counts['removed'], kept
+
+
+def filters_from_dict(config):
+    """Get hallucination filters from an already-parsed config dict"""
+    return (config or {}).get('hallucination_filters', DEFAULT_FILTERS)
+
+
 def load_custom_filters(config_path='config.yaml'):
     """Load custom filters from config file"""
     if os.path.exists(config_path):
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                return config.get('hallucination_filters', DEFAULT_FILTERS)
+                return filters_from_dict(yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)))
         except Exception as e:
             print(f"⚠️  Warning: Failed to load custom filters: {e}")
 
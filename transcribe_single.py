@@ -20,11 +20,14 @@ Examples:
 import os
 import sys
 import argparse
+import asyncio
+import functools
 import subprocess
-import datetime
+import time
 import logging
 import logging.handlers
 import re
+import threading
 from pathlib import Path
 
 # Dependency checks
@@ -48,20 +51,57 @@ except ImportError:
     TRANSCRIBE_AVAILABLE = False
 
 
+_ERROR_MARKERS = ("❌", "error", "failed")
+_WARNING_MARKERS = ("⚠️", "warning")
+
+# Set once setup_logging() has attached a handler; None means "ask the root logger"
+_has_log_handlers = None
+_logging_initialized = False
+_logging_lock = threading.Lock()
+
+# (epoch second, formatted "%H:%M:%S") so log() formats the clock at most once per second
+_ts_cache = [0, ""]
+
+
+def _timestamp():
+    """Return the current HH:MM:SS string, reformatted only when the second changes"""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _ts_cache[1]
+
+
 def log(msg: str):
     """Print timestamped message to stdout and logger"""
-    ts = datetime.datetime.now().strftime("%H:%M:%S")
-    print(f"[{ts}] {msg}", flush=True)
-    if logging.getLogger().hasHandlers():
+    print(f"[{_timestamp()}] {msg}", flush=True)
+    has_handlers = _has_log_handlers
+    if has_handlers is None:
+        has_handlers = logging.getLogger().hasHandlers()
+    if has_handlers:
         msg_lower = msg.lower()
-        if "❌" in msg or "error" in msg_lower or "failed" in msg_lower:
+        if any(m in msg_lower for m in _ERROR_MARKERS):
             logging.error(msg)
-        elif "⚠️" in msg or "warning" in msg_lower:
+        elif any(m in msg_lower for m in _WARNING_MARKERS):
             logging.warning(msg)
         else:
             logging.info(msg)
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_exists(path, dir_mtime_ns):
+    return os.path.exists(path)
+
+
+def _exists(path):
+    """Cached os.path.exists, invalidated whenever the parent directory changes"""
+    try:
+        dir_mtime_ns = os.stat(os.path.dirname(path) or '.').st_mtime_ns
+    except OSError:
+        return False
+    return _cached_exists(path, dir_mtime_ns)
+
+
 def load_config():
     """Load config.yaml if available"""
     if yaml and os.path.exists("config.yaml"):
@@ -74,7 +114,9 @@ def load_config():
 
 
 def setup_logging(config):
-    """Setup file logging based on config"""
+    """Setup file logging based on config (safe to call more than once)"""
+    global _logging_initialized, _has_log_handlers
+
     log_config = config.get("logging", {})
     if not log_config.get("enabled", True):
         return
@@ -84,16 +126,27 @@ def setup_logging(config):
     max_size = log_config.get("max_size_mb", 10) * 1024 * 1024
     backup_count = log_config.get("backup_count", 3)
 
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    with _logging_lock:
+        if _logging_initialized:
+            return
 
-    handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=max_size, backupCount=backup_count, encoding='utf-8'
-    )
-    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        logger = logging.getLogger()
+        log_path = os.path.abspath(log_file)
+        # Another caller may already have attached a handler for the same file
+        if not any(isinstance(h, logging.handlers.RotatingFileHandler)
+                   and getattr(h, 'baseFilename', None) == log_path
+                   for h in logger.handlers):
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+
+            handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_size, backupCount=backup_count, encoding='utf-8'
+            )
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            logger.addHandler(handler)
 
-    logger = logging.getLogger()
-    logger.setLevel(log_level)
-    logger.addHandler(handler)
+        logger.setLevel(log_level)
+        _has_log_handlers = True
+        _logging_initialized = True
 
 
 def extract_video_id(url):
@@ -135,6 +188,72 @@ def get_video_file(video_id, download_dir):
     return None
 
 
+# yt-dlp output template puts the video ID in brackets: "%(title)s [%(id)s].%(ext)s"
+_BRACKETED_ID_RE = re.compile(r'\[([0-9A-Za-z_-]{11})\]')
+
+
+def _index_files(index, root, files, video_id=None):
+    """Add .mp4/.srt files from one directory listing to a video ID index.
+
+    Files are indexed by their last bracketed "[id]". A name that contains video_id
+    anywhere else (another output template, or a title with its own brackets) is indexed
+    under video_id instead, as the old per-ID scans matched it.
+    """
+    for file in files:
+        # The template's "[id]" comes last; titles can hold bracketed words of the same shape
+        match = None
+        for match in _BRACKETED_ID_RE.finditer(file):
+            pass
+        if video_id and video_id in file and (match is None or match.group(1) != video_id):
+            file_id = video_id
+            match = None
+        elif match:
+            file_id = match.group(1)
+        else:
+            continue
+        if file.endswith('.mp4'):
+            index['videos'].setdefault(file_id, os.path.join(root, file))
+        elif file.endswith('.srt'):
+            # "Title [id].sr.srt" -> "sr", "Title [id].srt" -> None; unknown without brackets
+            lang = None
+            if match:
+                suffix = file[match.end():-len('.srt')]
+                lang = suffix[1:] if suffix.startswith('.') else (suffix or None)
+            index['srts'].setdefault(file_id, {}).setdefault(lang, os.path.join(root, file))
+
+
+def _build_id_index(download_dir, video_id=None):
+    """Walk download_dir once and map video IDs to their video and subtitle files
+    (see _index_files for how video_id widens the match)"""
+    index = {'videos': {}, 'srts': {}}
+    for root, dirs, files in os.walk(download_dir):
+        _index_files(index, root, files, video_id)
+    return index
+
+
+def refresh_id(index, video_id, parent_dir):
+    """Drop cached entries for video_id and re-index only parent_dir"""
+    index['videos'].pop(video_id, None)
+    index['srts'].pop(video_id, None)
+    try:
+        with os.scandir(parent_dir) as it:
+            names = [entry.name for entry in it if video_id in entry.name]
+    except OSError:
+        return
+    _index_files(index, parent_dir, names, video_id)
+
+
+def get_downloaded_path(ydl, info, video_id, download_dir):
+    """Return the final file path yt-dlp reported for a finished download"""
+    # yt-dlp records the post-merge path itself, so no directory scan is needed
+    requested = info.get('requested_downloads') or [{}]
+    video_file = requested[0].get('filepath') or info.get('_filename') or ydl.prepare_filename(info)
+    if video_file and os.path.exists(video_file):
+        return video_file
+    # Fall back to scanning the download directory
+    return get_video_file(video_id, download_dir)
+
+
 def download_video(url, video_id, download_dir, cookie_file=None):
     """Download a single video using yt-dlp"""
     log(f"📥 Downloading video: {video_id}")
@@ -150,7 +269,7 @@ def download_video(url, video_id, download_dir, cookie_file=None):
         "no_warnings": False,
     }
 
-    if cookie_file and os.path.exists(cookie_file):
+    if cookie_file and _exists(cookie_file):
         ytdlp_opts["cookiefile"] = cookie_file
         log(f"🍪 Using cookies: {cookie_file}")
 
@@ -159,7 +278,7 @@ def download_video(url, video_id, download_dir, cookie_file=None):
             info = ydl.extract_info(url, download=True)
             if info:
                 # Get the downloaded file path
-                video_file = get_video_file(video_id, download_dir)
+                video_file = get_downloaded_path(ydl, info, video_id, download_dir)
                 if video_file:
                     log(f"✅ Download complete: {os.path.basename(video_file)}")
                     return video_file
@@ -171,17 +290,32 @@ def download_video(url, video_id, download_dir, cookie_file=None):
         return None
 
 
+def find_srt_for_video(vp, lang):
+    """Return the SRT next to a video (language-suffixed first, then legacy), or None"""
+    # One directory listing instead of a stat() per candidate
+    try:
+        with os.scandir(vp.parent) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        return None
+    for candidate in (f"{vp.stem}.{lang}.srt", f"{vp.stem}.srt"):
+        if candidate in names:
+            return str(vp.parent / candidate)
+    return None
+
+
 def transcribe_video(video_path, transcriber, transcriber_args=None):
     """Transcribe a video file using the specified transcriber script (subprocess fallback)"""
     if not os.path.exists(video_path):
         log(f"❌ Video file not found: {video_path}")
         return False
 
-    if not os.path.exists(transcriber):
+    if not _exists(transcriber):
         log(f"❌ Transcriber script not found: {transcriber}")
         return False
 
-    log(f"🎙️  Starting transcription: {os.path.basename(video_path)}")
+    vp = Path(video_path)
+    log(f"🎙️  Starting transcription: {vp.name}")
 
     # Build command
     cmd = [sys.executable, transcriber, video_path]
@@ -200,9 +334,9 @@ def transcribe_video(video_path, transcriber, transcriber_args=None):
         )
 
         if result.returncode == 0:
-            srt_path = os.path.splitext(video_path)[0] + ".srt"
-            if os.path.exists(srt_path):
-                log(f"✅ Transcription complete: {os.path.basename(srt_path)}")
+            srt = vp.with_suffix(".srt")
+            if _exists(str(srt)):
+                log(f"✅ Transcription complete: {srt.name}")
                 return True
             else:
                 log(f"⚠️  Transcription finished but .srt file not found")
@@ -279,12 +413,17 @@ def transcribe_single_video(
 
     report_progress(5, f"📹 Video ID: {video_id}")
 
+    # One walk of the download directory answers both "transcribed?" and "downloaded?"
+    id_index = _build_id_index(download_dir, video_id)
+
     # Check if already transcribed
     if not force:
-        is_done, srt_path = is_video_transcribed(video_id, download_dir)
-        if is_done:
+        existing_srts = id_index['srts'].get(video_id)
+        if existing_srts:
+            srt_path = next(iter(existing_srts.values()))
+            log(f"✅ Video {video_id} already transcribed: {os.path.basename(srt_path)}")
             # Get video file
-            video_file = get_video_file(video_id, download_dir)
+            video_file = id_index['videos'].get(video_id)
             if video_file:
                 report_progress(100, f"✅ Video already transcribed")
                 return {
@@ -295,7 +434,7 @@ def transcribe_single_video(
                 }
 
     # Check if video file exists
-    video_file = get_video_file(video_id, download_dir)
+    video_file = id_index['videos'].get(video_id)
     video_title = None
 
     if not video_file:
@@ -313,24 +452,20 @@ def transcribe_single_video(
             "no_warnings": True,
         }
 
-        if cookie_file and os.path.exists(cookie_file):
+        if cookie_file and _exists(cookie_file):
             ytdlp_opts["cookiefile"] = cookie_file
             report_progress(12, f"🍪 Using cookies: {cookie_file}")
 
         # Add progress hook
         def download_progress_hook(d):
-            if d['status'] == 'downloading':
-                try:
-                    if 'downloaded_bytes' in d and 'total_bytes' in d:
-                        percent = (d['downloaded_bytes'] / d['total_bytes']) * 30  # Map to 10-40%
-                        report_progress(10 + int(percent), f"📥 Downloading: {10 + percent:.1f}%")
-                    elif '_percent_str' in d:
-                        percent_str = d['_percent_str'].strip().replace('%', '')
-                        percent = float(percent_str) * 0.3  # Map to 10-40%
-                        report_progress(10 + int(percent), f"📥 Downloading: {percent_str}")
-                except:
-                    pass
-            elif d['status'] == 'finished':
+            status = d.get('status')
+            if status == 'downloading':
+                downloaded = d.get('downloaded_bytes')
+                total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                if downloaded and total:
+                    percent = (downloaded / total) * 30  # Map to 10-40%
+                    report_progress(10 + int(percent), f"📥 Downloading: {10 + percent:.1f}%")
+            elif status == 'finished':
                 report_progress(40, "✅ Download complete")
 
         ytdlp_opts['progress_hooks'] = [download_progress_hook]
@@ -341,17 +476,21 @@ def transcribe_single_video(
                 if info:
                     video_title = info.get('title', 'Unknown')
                     # Get the downloaded file path
-                    video_file = get_video_file(video_id, download_dir)
+                    video_file = get_downloaded_path(ydl, info, video_id, download_dir)
                     if not video_file:
                         raise RuntimeError("Video downloaded but file not found")
-                    report_progress(40, f"✅ Downloaded: {os.path.basename(video_file)}")
+                    vp = Path(video_file)
+                    report_progress(40, f"✅ Downloaded: {vp.name}")
                 else:
                     raise RuntimeError("Failed to extract video info")
         except Exception as e:
             raise RuntimeError(f"Download failed: {e}")
     else:
-        report_progress(40, f"✅ Video already downloaded: {os.path.basename(video_file)}")
-        video_title = os.path.basename(video_file)
+        vp = Path(video_file)
+        report_progress(40, f"✅ Video already downloaded: {vp.name}")
+        video_title = vp.name
+
+    vname = vp.name
 
     # Transcribe the video
     report_progress(45, f"🎙️ Starting transcription...")
@@ -386,7 +525,7 @@ def transcribe_single_video(
                 'video_id': video_id,
                 'video_path': video_file,
                 'srt_path': srt_path,
-                'video_title': video_title or os.path.basename(video_file)
+                'video_title': video_title or vname
             }
 
         except Exception as e:
@@ -396,28 +535,28 @@ def transcribe_single_video(
         report_progress(50, "🎙️ Using subprocess transcription (fallback)...")
 
         transcriber = "faster_whisper_latin.py"
-        if not os.path.exists(transcriber):
+        if not _exists(transcriber):
             raise RuntimeError(f"Transcriber script not found: {transcriber}")
 
         success = transcribe_video(video_file, transcriber, None)
 
         if success:
-            # Find the generated SRT file
-            base_name = os.path.splitext(video_file)[0]
-            # Try language-suffixed version first
+            # Find the generated SRT file: language-suffixed first, then legacy
             lang = trans_params.get('language', 'sr')
-            srt_path = f"{base_name}.{lang}.srt"
-            if not os.path.exists(srt_path):
-                # Try legacy version
-                srt_path = f"{base_name}.srt"
-
-            if os.path.exists(srt_path):
+            refresh_id(id_index, video_id, str(vp.parent))
+            srts = id_index['srts'].get(video_id, {})
+            srt_path = srts.get(lang) or srts.get(None)
+            if not srt_path:
+                # File name without a bracketed ID (e.g. renamed by hand)
+                srt_path = find_srt_for_video(vp, lang)
+
+            if srt_path:
                 report_progress(100, f"✅ Transcription complete")
                 return {
                     'video_id': video_id,
                     'video_path': video_file,
                     'srt_path': srt_path,
-                    'video_title': video_title or os.path.basename(video_file)
+                    'video_title': video_title or vname
                 }
             else:
                 raise RuntimeError("Transcription finished but .srt file not found")
@@ -425,6 +564,20 @@ def transcribe_single_video(
             raise RuntimeError("Transcription subprocess failed")
 
 
+async def transcribe_single_video_async(video_url, **kwargs):
+    """
+    Async variant of transcribe_single_video for callers running an event loop.
+
+    The download and Whisper inference run in the default thread pool executor,
+    so the loop stays free to report progress for other jobs meanwhile.
+    Accepts the same keyword arguments and returns the same dict.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(transcribe_single_video, video_url, **kwargs)
+    )
+
+
 def main():
     log("=" * 60)
     log("Single Video Transcription Started")
@@ -4,24 +4,81 @@ Provides a simple UI for submitting transcription jobs and monitoring progress
 """
 
 import os
+import errno
 import json
 import sqlite3
 import logging
 import yaml
 import subprocess
+import shutil
+import stat
+import sys
+import traceback
+import codecs
+import copy
+import shlex
+import platform
+import string
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from urllib.parse import unquote
 from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
 from werkzeug.utils import secure_filename
 import threading
+import queue
 import re
-import uuid
+import secrets
 import signal
+import time
 import psutil
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Title cleanup patterns for video filenames
+_YT_ID_RE = re.compile(r'\s*\[[a-zA-Z0-9_-]{11}\]$')  # Trailing " [VIDEO_ID]"
+_NUM_RE = re.compile(r'\s*\(\d+\)$')  # Trailing " (1)" numbering
+
+# Progress/output patterns for yt-dlp, transcriber and ffmpeg subprocess lines
+_DL_PCT_RE = re.compile(r'\[download\]\s+(\d+\.?\d*)%')
+_DESTINATION_RE = re.compile(r'Destination:\s+(.+?)(?:\r|\n|$)')
+_MERGED_INTO_RE = re.compile(r'into\s+"(.+?)"')
+_BATCH_POS_RE = re.compile(r'\[(\d+)/(\d+)\]')
+# FFmpeg -progress keys carrying the output timestamp (out_time_ms is actually in microseconds)
+_FFMPEG_TIME_MS_PREFIX = 'out_time_ms='
+_FFMPEG_TIME_PREFIX = 'out_time='
+
+def _new_job_id():
+    """Time-ordered job ID (ns timestamp + random suffix) so jobs.db PK inserts stay append-only.
+
+    The leading digits are shared by every job created within a few seconds, so never
+    shorten an ID for display or file names; use it whole.
+    """
+    return f"{time.time_ns():016x}{secrets.token_hex(6)}"
+
+
+# (epoch second, its isoformat string) - job timestamps only need second resolution
+_now_iso_cache = (0, '')
+
+
+def _now_iso():
+    """Current local time as an ISO string, formatted at most once per second"""
+    global _now_iso_cache
+    second = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second).isoformat())
+        _now_iso_cache = cached
+    return cached[1]
+
 
 # Global dictionary to track active processes for job cancellation
 active_job_processes = {}
+# Per-job cancellation flags, set by the cancel endpoint and polled by job loops
+cancel_events = {}
 
 # Translation library (with fallback)
 try:
@@ -32,6 +89,20 @@ except ImportError:
     print("Warning: googletrans not installed. Translation features will be disabled.")
     print("Install with: pip install googletrans==4.0.0rc1")
 
+# pysrt for streaming SRT parsing (falls back to a minimal parser)
+try:
+    import pysrt
+    PYSRT_AVAILABLE = True
+except ImportError:
+    PYSRT_AVAILABLE = False
+
+# charset-normalizer for single-pass subtitle encoding detection (falls back to trying encodings in turn)
+try:
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
 # Import transcription module
 try:
     from faster_whisper_latin import transcribe_file
@@ -48,6 +119,35 @@ except ImportError:
     YTDLP_AVAILABLE = False
     print("Warning: yt-dlp module not found. Downloads will use subprocess fallback.")
 
+# Eventlet for the Socket.IO server (falls back to threading)
+try:
+    import eventlet.tpool
+    EVENTLET_AVAILABLE = True
+except ImportError:
+    EVENTLET_AVAILABLE = False
+
+# orjson for faster JSON responses, socket events and stored parameters (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# PyAV for in-process media probing (falls back to the ffprobe CLI)
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+# FFmpeg binaries, resolved once at startup instead of on every job
+FFMPEG_PATH = shutil.which('ffmpeg')
+FFPROBE_PATH = shutil.which('ffprobe')
+FFMPEG_AVAILABLE = FFMPEG_PATH is not None
+
+# SRT cleanup helpers (local module, no optional dependencies)
+import srt_cleanup
+
 # Import transcribe_single module
 try:
     from transcribe_single import transcribe_single_video
@@ -59,17 +159,76 @@ except ImportError:
 # Set up comprehensive logging using basicConfig (more reliable)
 os.makedirs('logs', exist_ok=True)
 
+CONFIG_PATH = 'config.yaml'
+
+# libyaml's C loader/dumper run several times faster when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# ((mtime_ns, size), parsed dict) for config.yaml
+_config_cache = (None, {})
+_config_cache_lock = threading.Lock()
+
+
+def load_config():
+    """Return parsed config.yaml, re-parsing only when the file has changed.
+
+    The dict is shared with every other caller, so treat it as read-only; take a
+    copy.deepcopy() before modifying it. If config.yaml can't be parsed, the error is
+    logged and the last good config is returned.
+    """
+    global _config_cache
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return {}
+    # Size as well, in case an edit lands within the filesystem's timestamp granularity
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _config_cache_lock:
+        if _config_cache[0] != key:
+            try:
+                with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+                    config = yaml.load(f, Loader=_YAML_LOADER) or {}
+                if not isinstance(config, dict):
+                    raise yaml.YAMLError(f"top level is a {type(config).__name__}, not a mapping")
+            except (OSError, yaml.YAMLError) as e:
+                # Remember the key so a broken file is reported once, not on every call
+                logging.getLogger('whisper_web').error(f"✗ Could not load {CONFIG_PATH}, keeping previous settings: {e}")
+                config = _config_cache[1]
+            _config_cache = (key, config)
+        return _config_cache[1]
+
+
+def invalidate_config():
+    """Force config.yaml to be re-read after writing it (the current dict stays as the fallback)"""
+    global _config_cache
+    with _config_cache_lock:
+        _config_cache = (None, _config_cache[1])
+
+
+def save_config(config):
+    """Write config.yaml atomically: dump to a temp file, fsync, then swap it in"""
+    tmp_path = CONFIG_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        yaml.dump(config, f, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CONFIG_PATH)
+    invalidate_config()
+
+
 # Read logging configuration and storage settings
 log_config = {}
 storage_config = {}
-if os.path.exists('config.yaml'):
-    try:
-        with open('config.yaml', 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-            log_config = config.get('web_server_logging', {})
-            storage_config = config.get('storage', {})
-    except Exception as e:
-        print(f"Warning: Could not read logging config: {e}")
+jobs_config = {}
+try:
+    config = load_config()
+    log_config = config.get('web_server_logging', {})
+    storage_config = config.get('storage', {})
+    jobs_config = config.get('jobs', {})
+except Exception as e:
+    print(f"Warning: Could not read logging config: {e}")
 
 # Get configuration values
 log_file = log_config.get('log_file', 'logs/web_server.log')
@@ -96,7 +255,50 @@ logger.info("="*80)
 logger.info("Whisper Web Server Starting")
 logger.info("="*80)
 
+def dumps_json(obj):
+    """Serialize obj to a JSON string, via orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
+
+def loads_json(s):
+    """Parse a JSON str or bytes, via orjson when available (errors are json.JSONDecodeError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; unsupported types fall back to Flask's default()"""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class _ORJSONSocketIO:
+    """json-module shim so python-socketio encodes event payloads with orjson"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return dumps_json(obj)
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['DOWNLOAD_FOLDER'] = storage_config.get('data_dir', 'yt_downloads')  # Read from config.yaml storage.data_dir
@@ -105,7 +307,19 @@ app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024 * 1024  # 10GB max upload (f
 # Log the configured data storage location
 logger.info(f"Data storage directory: {app.config['DOWNLOAD_FOLDER']}")
 
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Request handlers and websockets share one event loop under eventlet. Job threads
+# stay real OS threads (no monkey patching) so Whisper inference can't stall the hub.
+SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE') or ('eventlet' if EVENTLET_AVAILABLE else 'threading')
+socketio = SocketIO(app, async_mode=SOCKETIO_ASYNC_MODE, cors_allowed_origins="*",
+                    json=_ORJSONSocketIO if ORJSON_AVAILABLE else json)
+logger.info(f"Socket.IO async mode: {socketio.async_mode}")
+
+
+def run_blocking(func, *args, **kwargs):
+    """Run a blocking call from a request handler without freezing the event loop"""
+    if socketio.async_mode == 'eventlet':
+        return eventlet.tpool.execute(func, *args, **kwargs)
+    return func(*args, **kwargs)
 
 # Error handlers to ensure JSON responses for API endpoints
 @app.errorhandler(413)
@@ -135,9 +349,30 @@ os.makedirs(app.config['DOWNLOAD_FOLDER'], exist_ok=True)
 os.makedirs('logs', exist_ok=True)
 
 # Database setup for job tracking
+def configure_connection(conn):
+    """Apply per-connection performance PRAGMAs to a new jobs.db connection"""
+    try:
+        conn.execute('PRAGMA synchronous=NORMAL')
+        # Wait out another process's write lock rather than failing with "database is locked"
+        conn.execute('PRAGMA busy_timeout=30000')
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA foreign_keys=ON')
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Could not apply SQLite PRAGMAs: {e}")
+    return conn
+
+
 def init_db():
-    conn = sqlite3.connect('jobs.db')
+    conn = configure_connection(sqlite3.connect('jobs.db'))
     c = conn.cursor()
+    try:
+        # WAL is stored in the database file, so switching once here covers every connection
+        c.execute('PRAGMA journal_mode=WAL')
+        c.execute('PRAGMA wal_autocheckpoint=1000')
+    except sqlite3.OperationalError as e:
+        # e.g. read-only databases that can't switch journal mode
+        logger.warning(f"Could not enable WAL mode: {e}")
     c.execute('''CREATE TABLE IF NOT EXISTS jobs
                  (id TEXT PRIMARY KEY,
                   url TEXT NOT NULL,
@@ -153,23 +388,21 @@ def init_db():
                   video_path TEXT)''')
 
     # Add new columns to existing database if they don't exist
-    try:
-        c.execute("ALTER TABLE jobs ADD COLUMN job_type TEXT DEFAULT 'transcribe'")
-        logger.info("Added job_type column to jobs table")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-
-    try:
-        c.execute("ALTER TABLE jobs ADD COLUMN parent_job_id TEXT")
-        logger.info("Added parent_job_id column to jobs table")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-
-    try:
-        c.execute("ALTER TABLE jobs ADD COLUMN video_path TEXT")
-        logger.info("Added video_path column to jobs table")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
+    existing = {row[1] for row in c.execute("PRAGMA table_info(jobs)")}
+    for col, ddl in (('job_type', "TEXT DEFAULT 'transcribe'"),
+                     ('parent_job_id', 'TEXT'),
+                     ('video_path', 'TEXT')):
+        if col not in existing:
+            c.execute(f"ALTER TABLE jobs ADD COLUMN {col} {ddl}")
+            logger.info(f"Added {col} column to jobs table")
+
+    # Indexes for status filtering/cleanup, child-job lookups and the job list ordering.
+    # (status, created_at) serves clear_jobs and the status-filtered job list; the older
+    # (status, updated_at) index had to be rewritten on every progress update
+    c.execute("DROP INDEX IF EXISTS idx_jobs_status_updated")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at DESC)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_parent ON jobs(parent_job_id) WHERE parent_job_id IS NOT NULL")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC)")
 
     conn.commit()
     conn.close()
@@ -177,10 +410,81 @@ def init_db():
 init_db()
 
 
-def get_db():
-    conn = sqlite3.connect('jobs.db')
-    conn.row_factory = sqlite3.Row
-    return conn
+class ConnectionPool:
+    """Single shared writer connection plus a pool of read-only connections to jobs.db"""
+
+    def __init__(self, db_path, readers=None):
+        self.db_path = db_path
+        # Autocommit mode: writer() issues BEGIN IMMEDIATE itself so the write lock is taken upfront
+        self._writer = self._connect(isolation_level=None)
+        self._writer_lock = threading.Lock()
+        self._readers = queue.Queue()
+        for _ in range(readers or os.cpu_count() or 4):
+            conn = self._connect()
+            conn.execute('PRAGMA query_only=1')
+            self._readers.put(conn)
+
+    def _connect(self, **kwargs):
+        conn = configure_connection(sqlite3.connect(self.db_path, check_same_thread=False, **kwargs))
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def writer(self):
+        """Run statements in a BEGIN IMMEDIATE transaction; commits on success, rolls back on error"""
+        with self._writer_lock:
+            conn = self._writer
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+    @contextmanager
+    def reader(self):
+        """Borrow a read-only connection (WAL lets readers run alongside the writer)"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+
+db_pool = ConnectionPool('jobs.db')
+
+
+_JOB_INSERT_SQL = '''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type, parent_job_id, video_path)
+                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+
+
+def insert_job(row):
+    """Insert and commit one jobs row (id, url, status, created_at, updated_at, parameters,
+    job_type, parent_job_id, video_path); raises if the insert fails"""
+    with db_pool.writer() as conn:
+        conn.execute(_JOB_INSERT_SQL, row)
+
+
+def emit_job_created(job_id, url, created_at, params_json, job_type, parent_job_id=None):
+    """Tell clients about a newly queued job"""
+    try:
+        socketio.emit('job_created', {
+            'id': job_id,
+            'url': url,
+            'status': 'queued',
+            'progress': 0,
+            'created_at': created_at,
+            'updated_at': created_at,
+            'parameters': params_json,
+            'job_type': job_type,
+            'parent_job_id': parent_job_id,
+            'result': None,
+            'error': None
+        })
+        app.logger.debug(f"Emitted job_created event for {job_type} job {job_id}")
+    except Exception as e:
+        app.logger.warning(f"Failed to emit job creation event: {e}")
 
 
 @app.route('/')
@@ -190,17 +494,14 @@ def index():
     return render_template('index.html')
 
 
-@app.route('/api/logger-test')
-def logger_test():
-    """Test endpoint to verify logger is working"""
-    logger.debug("DEBUG test message")
-    logger.info("INFO test message")
-    logger.warning("WARNING test message")
+# Logger/handler metadata for /api/logger-test; built on first request, rebuilt with ?refresh=1
+_LOGGER_SNAPSHOT = None
 
-    # Get root logger handlers since we're using basicConfig
-    root_logger = logging.getLogger()
 
-    return jsonify({
+def _build_logger_snapshot():
+    """Describe our logger and the root handlers (we're using basicConfig)"""
+    root_logger = logging.getLogger()
+    return {
         'status': 'ok',
         'logger_name': logger.name,
         'logger_level': logging.getLevelName(logger.level),
@@ -211,7 +512,142 @@ def logger_test():
                 'level': logging.getLevelName(h.level)
             } for h in root_logger.handlers
         ]
-    })
+    }
+
+
+@app.route('/api/logger-test')
+def logger_test():
+    """Test endpoint to verify logger is working"""
+    logger.debug("DEBUG test message")
+    logger.info("INFO test message")
+    logger.warning("WARNING test message")
+
+    global _LOGGER_SNAPSHOT
+    if _LOGGER_SNAPSHOT is None or request.args.get('refresh') == '1':
+        _LOGGER_SNAPSHOT = _build_logger_snapshot()
+
+    return jsonify(_LOGGER_SNAPSHOT)
+
+
+class LRUCache:
+    """Thread-safe mapping that keeps the maxsize most recently used entries"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the value for key (marking it recently used), or default"""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# Probe results keyed by (path, mtime_ns, size), so re-probing an unchanged file (the UI
+# asks again on preview, track selection and submit) skips the container parse/ffprobe
+PROBE_CACHE_SIZE = 512
+_probe_cache = LRUCache(PROBE_CACHE_SIZE)
+
+
+def probe_audio_streams(path):
+    """List audio streams in a media file (see _probe_audio_streams), cached per file version.
+
+    The returned list is shared with the cache; treat it as read-only.
+    """
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    streams = _probe_cache.get(key)
+    if streams is None:
+        streams = _probe_audio_streams(path)
+        _probe_cache.put(key, streams)
+    return streams
+
+
+def _probe_audio_streams(path):
+    """
+    List audio streams in a media file as ffprobe-style dicts
+    (index, codec_name, channels, channel_layout, sample_rate, tags).
+
+    Uses PyAV to read the container headers in-process when available,
+    otherwise runs ffprobe. Raises RuntimeError if the file can't be analyzed.
+    """
+    if AV_AVAILABLE:
+        try:
+            with av.open(path) as container:
+                streams = []
+                for stream in container.streams.audio:
+                    ctx = stream.codec_context
+                    streams.append({
+                        'index': stream.index,
+                        'codec_name': ctx.name,
+                        'channels': ctx.channels,
+                        'channel_layout': ctx.layout.name if ctx.layout else None,
+                        'sample_rate': str(ctx.sample_rate),
+                        'tags': dict(stream.metadata),
+                    })
+                return streams
+        except Exception as e:
+            app.logger.warning(f"PyAV probe failed for {path}, falling back to ffprobe: {e}")
+
+    cmd = [
+        FFPROBE_PATH or 'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'a',
+        '-show_entries', 'stream=index,codec_name,channels,channel_layout,sample_rate:stream_tags=language,title',
+        '-of', 'json',
+        path
+    ]
+
+    # Raw bytes straight into the JSON parser, no intermediate str decode
+    result = subprocess.run(cmd, capture_output=True)
+
+    if result.returncode != 0:
+        raise RuntimeError('Failed to analyze file')
+
+    return loads_json(result.stdout).get('streams', [])
+
+
+# Copy buffer for uploads; large chunks keep syscall count low on multi-GB files
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def save_upload(file_storage, path):
+    """
+    Write an uploaded file to disk.
+
+    Large uploads are spooled by Werkzeug to a real temp file, which lets us use
+    os.sendfile for a zero-copy transfer; otherwise copy in UPLOAD_CHUNK_SIZE blocks.
+    """
+    stream = file_storage.stream
+    start = stream.tell()
+    with open(path, 'wb') as dst:
+        if hasattr(os, 'sendfile'):
+            try:
+                in_fd = stream.fileno()
+                offset = start
+                while True:
+                    sent = os.sendfile(dst.fileno(), in_fd, offset, UPLOAD_CHUNK_SIZE)
+                    if sent == 0:
+                        return
+                    offset += sent
+            except (AttributeError, OSError, ValueError):
+                # In-memory stream or sendfile unsupported - restart with a plain copy
+                dst.seek(0)
+                dst.truncate()
+                stream.seek(start)
+        shutil.copyfileobj(stream, dst, UPLOAD_CHUNK_SIZE)
 
 
 @app.route('/api/detect-audio-tracks', methods=['POST'])
@@ -227,30 +663,14 @@ def detect_audio_tracks():
     # Save temporarily
     filename = secure_filename(file.filename)
     temp_path = os.path.join(app.config['UPLOAD_FOLDER'], f'temp_{filename}')
-    file.save(temp_path)
+    save_upload(file, temp_path)
 
     try:
-        # Use ffprobe to detect audio streams
-        import subprocess
-        import json as json_module
-
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'a',
-            '-show_entries', 'stream=index,codec_name,channels,channel_layout,sample_rate:stream_tags=language,title',
-            '-of', 'json',
-            temp_path
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
+        try:
+            streams = run_blocking(probe_audio_streams, temp_path)
+        except RuntimeError:
             return jsonify({'error': 'Failed to analyze file'}), 500
 
-        data = json_module.loads(result.stdout)
-        streams = data.get('streams', [])
-
         audio_tracks = []
         for i, stream in enumerate(streams):
             tags = stream.get('tags', {})
@@ -283,91 +703,101 @@ def handle_config():
     return get_config()
 
 
+# Static option lists served by /api/config; only storage_path changes at runtime
+CONFIG_OPTIONS = {
+    'models': [
+        {'value': 'tiny', 'label': 'Tiny (Fastest, ~1GB VRAM)'},
+        {'value': 'small', 'label': 'Small (Fast, ~2GB VRAM)'},
+        {'value': 'medium', 'label': 'Medium (Balanced, ~4GB VRAM)'},
+        {'value': 'large-v2', 'label': 'Large-v2 (Accurate, ~8GB VRAM)'},
+        {'value': 'large-v3', 'label': 'Large-v3 (Best, ~8GB VRAM)'}
+    ],
+    'devices': [
+        {'value': 'cuda', 'label': 'GPU (CUDA)'},
+        {'value': 'cpu', 'label': 'CPU (Slower)'}
+    ],
+    'languages': [
+        {'value': 'auto', 'label': 'Auto-detect'},
+        {'value': 'en', 'label': 'English'},
+        {'value': 'sr', 'label': 'Serbian'},
+        {'value': 'ru', 'label': 'Russian'},
+        {'value': 'es', 'label': 'Spanish'},
+        {'value': 'fr', 'label': 'French'},
+        {'value': 'de', 'label': 'German'},
+        {'value': 'it', 'label': 'Italian'},
+        {'value': 'pt', 'label': 'Portuguese'},
+        {'value': 'pl', 'label': 'Polish'},
+        {'value': 'uk', 'label': 'Ukrainian'},
+        {'value': 'tr', 'label': 'Turkish'},
+        {'value': 'nl', 'label': 'Dutch'},
+        {'value': 'ar', 'label': 'Arabic'},
+        {'value': 'zh', 'label': 'Chinese'},
+        {'value': 'ja', 'label': 'Japanese'},
+        {'value': 'ko', 'label': 'Korean'},
+        {'value': 'hi', 'label': 'Hindi'},
+        {'value': 'cs', 'label': 'Czech'},
+        {'value': 'sk', 'label': 'Slovak'},
+        {'value': 'bg', 'label': 'Bulgarian'},
+        {'value': 'hr', 'label': 'Croatian'},
+        {'value': 'sl', 'label': 'Slovenian'},
+        {'value': 'mk', 'label': 'Macedonian'}
+    ],
+    'beam_sizes': [
+        {'value': 1, 'label': '1 (Fastest, greedy)'},
+        {'value': 3, 'label': '3 (Very Fast)'},
+        {'value': 5, 'label': '5 (Fast)'},
+        {'value': 7, 'label': '7 (Good)'},
+        {'value': 10, 'label': '10 (Balanced)'},
+        {'value': 12, 'label': '12 (Better)'},
+        {'value': 15, 'label': '15 (Great)'},
+        {'value': 20, 'label': '20 (Excellent)'},
+        {'value': 25, 'label': '25 (Best Quality)'}
+    ],
+    'workers': [
+        {'value': 1, 'label': '1 (Sequential)'},
+        {'value': 2, 'label': '2 (Parallel)'},
+        {'value': 3, 'label': '3 (Parallel)'},
+        {'value': 4, 'label': '4 (Parallel)'}
+    ],
+    'vad_options': [
+        {'value': 'false', 'label': 'Disabled'},
+        {'value': 'true', 'label': 'Enabled (Better quality)'}
+    ],
+    'compute_types': [
+        {'value': 'float16', 'label': 'Float16 (Fastest, GPU)'},
+        {'value': 'float32', 'label': 'Float32 (CPU compatible)'},
+        {'value': 'int8_float16', 'label': 'Int8 (Fastest, quantized)'}
+    ],
+    'temperatures': [
+        {'value': 0.0, 'label': '0.0 (Deterministic, no randomness)'},
+        {'value': 0.1, 'label': '0.1 (Very low)'},
+        {'value': 0.2, 'label': '0.2 (Recommended)'},
+        {'value': 0.3, 'label': '0.3 (Slightly creative)'},
+        {'value': 0.4, 'label': '0.4 (Noisy speech)'},
+        {'value': 0.5, 'label': '0.5 (Moderate)'},
+        {'value': 0.6, 'label': '0.6 (Very noisy)'},
+        {'value': 0.7, 'label': '0.7 (High noise tolerance)'},
+        {'value': 0.8, 'label': '0.8 (Extreme noise)'}
+    ]
+}
+
+# (storage_path, encoded JSON body) for the last /api/config response
+_config_payload = (None, b'')
+
+
 def get_config():
     """Get available configuration options"""
-    config = {
-        'models': [
-            {'value': 'tiny', 'label': 'Tiny (Fastest, ~1GB VRAM)'},
-            {'value': 'small', 'label': 'Small (Fast, ~2GB VRAM)'},
-            {'value': 'medium', 'label': 'Medium (Balanced, ~4GB VRAM)'},
-            {'value': 'large-v2', 'label': 'Large-v2 (Accurate, ~8GB VRAM)'},
-            {'value': 'large-v3', 'label': 'Large-v3 (Best, ~8GB VRAM)'}
-        ],
-        'devices': [
-            {'value': 'cuda', 'label': 'GPU (CUDA)'},
-            {'value': 'cpu', 'label': 'CPU (Slower)'}
-        ],
-        'languages': [
-            {'value': 'auto', 'label': 'Auto-detect'},
-            {'value': 'en', 'label': 'English'},
-            {'value': 'sr', 'label': 'Serbian'},
-            {'value': 'ru', 'label': 'Russian'},
-            {'value': 'es', 'label': 'Spanish'},
-            {'value': 'fr', 'label': 'French'},
-            {'value': 'de', 'label': 'German'},
-            {'value': 'it', 'label': 'Italian'},
-            {'value': 'pt', 'label': 'Portuguese'},
-            {'value': 'pl', 'label': 'Polish'},
-            {'value': 'uk', 'label': 'Ukrainian'},
-            {'value': 'tr', 'label': 'Turkish'},
-            {'value': 'nl', 'label': 'Dutch'},
-            {'value': 'ar', 'label': 'Arabic'},
-            {'value': 'zh', 'label': 'Chinese'},
-            {'value': 'ja', 'label': 'Japanese'},
-            {'value': 'ko', 'label': 'Korean'},
-            {'value': 'hi', 'label': 'Hindi'},
-            {'value': 'cs', 'label': 'Czech'},
-            {'value': 'sk', 'label': 'Slovak'},
-            {'value': 'bg', 'label': 'Bulgarian'},
-            {'value': 'hr', 'label': 'Croatian'},
-            {'value': 'sl', 'label': 'Slovenian'},
-            {'value': 'mk', 'label': 'Macedonian'}
-        ],
-        'beam_sizes': [
-            {'value': 1, 'label': '1 (Fastest, greedy)'},
-            {'value': 3, 'label': '3 (Very Fast)'},
-            {'value': 5, 'label': '5 (Fast)'},
-            {'value': 7, 'label': '7 (Good)'},
-            {'value': 10, 'label': '10 (Balanced)'},
-            {'value': 12, 'label': '12 (Better)'},
-            {'value': 15, 'label': '15 (Great)'},
-            {'value': 20, 'label': '20 (Excellent)'},
-            {'value': 25, 'label': '25 (Best Quality)'}
-        ],
-        'workers': [
-            {'value': 1, 'label': '1 (Sequential)'},
-            {'value': 2, 'label': '2 (Parallel)'},
-            {'value': 3, 'label': '3 (Parallel)'},
-            {'value': 4, 'label': '4 (Parallel)'}
-        ],
-        'vad_options': [
-            {'value': 'false', 'label': 'Disabled'},
-            {'value': 'true', 'label': 'Enabled (Better quality)'}
-        ],
-        'compute_types': [
-            {'value': 'float16', 'label': 'Float16 (Fastest, GPU)'},
-            {'value': 'float32', 'label': 'Float32 (CPU compatible)'},
-            {'value': 'int8_float16', 'label': 'Int8 (Fastest, quantized)'}
-        ],
-        'temperatures': [
-            {'value': 0.0, 'label': '0.0 (Deterministic, no randomness)'},
-            {'value': 0.1, 'label': '0.1 (Very low)'},
-            {'value': 0.2, 'label': '0.2 (Recommended)'},
-            {'value': 0.3, 'label': '0.3 (Slightly creative)'},
-            {'value': 0.4, 'label': '0.4 (Noisy speech)'},
-            {'value': 0.5, 'label': '0.5 (Moderate)'},
-            {'value': 0.6, 'label': '0.6 (Very noisy)'},
-            {'value': 0.7, 'label': '0.7 (High noise tolerance)'},
-            {'value': 0.8, 'label': '0.8 (Extreme noise)'}
-        ],
-        'storage_path': app.config['DOWNLOAD_FOLDER']
-    }
-    return jsonify(config)
+    global _config_payload
+    storage_path = app.config['DOWNLOAD_FOLDER']
+    cached_path, payload = _config_payload
+    if cached_path != storage_path:
+        payload = dumps_json({**CONFIG_OPTIONS, 'storage_path': storage_path}).encode('utf-8')
+        _config_payload = (storage_path, payload)
+    return app.response_class(payload, mimetype='application/json')
 
 
 def update_config():
     """Update storage configuration"""
-    import yaml
 
     data = request.get_json()
     storage_path = data.get('storage_path', '').strip()
@@ -375,14 +805,9 @@ def update_config():
     if not storage_path:
         return jsonify({'error': 'Storage path cannot be empty'}), 400
 
-    config_path = 'config.yaml'
-
     try:
-        # Load existing config
-        config = {}
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
+        # Load existing config (a copy, since the cached dict is shared)
+        config = copy.deepcopy(load_config())
 
         # Update storage section
         if 'storage' not in config:
@@ -391,8 +816,7 @@ def update_config():
         config['storage']['data_dir'] = storage_path
 
         # Save updated config
-        with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        save_config(config)
 
         # Update app config immediately (no restart needed)
         app.config['DOWNLOAD_FOLDER'] = storage_path
@@ -412,6 +836,41 @@ def update_config():
         return jsonify({'error': str(e)}), 500
 
 
+# YoutubeDL instances for metadata-only lookups, keyed by (cookiefile, extract_flat).
+# Building one loads every extractor, so reuse them; the lock serializes use since
+# YoutubeDL isn't safe to share between threads.
+_YDL_CACHE = {}
+_ydl_cache_lock = threading.Lock()
+
+
+@contextmanager
+def get_ydl(cookie_file=None, flat='in_playlist'):
+    """Yield a cached metadata-only YoutubeDL for this cookie file / extract_flat mode"""
+    key = (cookie_file, flat)
+    # Cookies are read once per instance, so rebuild when the cookie file is re-uploaded
+    cookie_mtime = os.stat(cookie_file).st_mtime_ns if cookie_file else None
+    with _ydl_cache_lock:
+        ydl, built_mtime = _YDL_CACHE.get(key, (None, None))
+        if ydl is None or built_mtime != cookie_mtime:
+            ydl_opts = {
+                'quiet': True,
+                'no_warnings': True,
+                'skip_download': True,
+                'extract_flat': flat  # Don't download playlist entries
+            }
+            if cookie_file:
+                ydl_opts['cookiefile'] = cookie_file
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            _YDL_CACHE[key] = (ydl, cookie_mtime)
+        yield ydl
+
+
+def extract_info_cached(url, cookie_file=None):
+    """Fetch yt-dlp metadata for url (no download) using the cached YoutubeDL"""
+    with get_ydl(cookie_file) as ydl:
+        return ydl.extract_info(url, download=False)
+
+
 @app.route('/api/submit', methods=['POST'])
 def submit_job():
     """Submit a new transcription job"""
@@ -451,9 +910,13 @@ def submit_job():
                 filename = f"{name}_{timestamp}{ext}"
                 final_path = os.path.join(app.config['DOWNLOAD_FOLDER'], filename)
 
-            # Move file
-            import shutil
-            shutil.move(temp_file_path, final_path)
+            # Move file (rename in place; copy only when crossing filesystems)
+            try:
+                os.replace(temp_file_path, final_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(temp_file_path, final_path)
             upload_path = final_path
         else:
             # Handle direct file upload (legacy path)
@@ -467,7 +930,7 @@ def submit_job():
             # Save uploaded file
             filename = secure_filename(file.filename)
             upload_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(upload_path)
+            save_upload(file, upload_path)
 
         url = f'file://{upload_path}'  # Use file:// protocol for local files
     elif source_type == 'existing':
@@ -477,8 +940,10 @@ def submit_job():
         if not existing_file_path:
             return jsonify({'error': 'No file selected'}), 400
 
-        # Construct full path
-        full_path = os.path.join(app.config['DOWNLOAD_FOLDER'], existing_file_path)
+        # Construct full path (None if it points outside the downloads folder)
+        full_path = safe_download_path(existing_file_path, allow_root=False)
+        if full_path is None:
+            return jsonify({'error': 'Invalid file path'}), 400
 
         if not os.path.exists(full_path):
             return jsonify({'error': 'File not found'}), 404
@@ -520,8 +985,7 @@ def submit_job():
     }
 
     # Create job ID
-    import uuid
-    job_id = str(uuid.uuid4())
+    job_id = _new_job_id()
 
     # Extract video title
     video_title = "Unknown Video"
@@ -530,35 +994,28 @@ def submit_job():
     try:
         if source_type == 'youtube':
             # Try to extract title from YouTube using yt-dlp
-            from yt_dlp import YoutubeDL
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'skip_download': True,
-                'extract_flat': 'in_playlist'  # Don't download playlist entries
-            }
-            if parameters.get('cookie_file') and os.path.exists(parameters['cookie_file']):
-                ydl_opts['cookiefile'] = parameters['cookie_file']
+            cookie_file = parameters.get('cookie_file')
+            if not (cookie_file and os.path.exists(cookie_file)):
+                cookie_file = None
 
             try:
-                with YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-
-                    # Check if this is a playlist
-                    if info.get('_type') == 'playlist':
-                        # It's a playlist, get playlist title
-                        video_title = info.get('title', info.get('playlist_title', 'YouTube Playlist'))
-                        video_count = len(info.get('entries', []))
-                        video_title = f"{video_title} ({video_count} videos)"
-                        app.logger.info(f"Extracted playlist title: {video_title}")
-                    else:
-                        # It's a single video
-                        video_title = info.get('title', 'Unknown')
-                        # Add channel name if available
-                        channel = info.get('uploader', info.get('channel', ''))
-                        if channel:
-                            video_title = f"{video_title} - {channel}"
-                        app.logger.info(f"Extracted video title: {video_title}")
+                info = run_blocking(extract_info_cached, url, cookie_file)
+
+                # Check if this is a playlist
+                if info.get('_type') == 'playlist':
+                    # It's a playlist, get playlist title
+                    video_title = info.get('title', info.get('playlist_title', 'YouTube Playlist'))
+                    video_count = len(info.get('entries', []))
+                    video_title = f"{video_title} ({video_count} videos)"
+                    app.logger.info(f"Extracted playlist title: {video_title}")
+                else:
+                    # It's a single video
+                    video_title = info.get('title', 'Unknown')
+                    # Add channel name if available
+                    channel = info.get('uploader', info.get('channel', ''))
+                    if channel:
+                        video_title = f"{video_title} - {channel}"
+                    app.logger.info(f"Extracted video title: {video_title}")
             except Exception as e:
                 app.logger.warning(f"Could not extract YouTube title: {e}")
                 # Try to get some info from URL
@@ -569,14 +1026,9 @@ def submit_job():
         elif source_type in ('upload', 'existing'):
             # Extract filename without extension and clean it up
             file_path = url.replace('file://', '')
-            # Normalize path separators
-            file_path = file_path.replace('\\', '/').replace('//', '/')
-            video_title = os.path.splitext(os.path.basename(file_path))[0]
-            # Remove common patterns like [VIDEO_ID] from filename
-            import re
-            video_title = re.sub(r'\s*\[[a-zA-Z0-9_-]{11}\]$', '', video_title)  # Remove YouTube ID
-            video_title = re.sub(r'\s*\(\d+\)$', '', video_title)  # Remove (1) numbering
-            video_title = video_title.strip()
+            video_title = PurePosixPath(file_path.replace('\\', '/')).stem
+            # Remove common patterns like [VIDEO_ID] and (1) numbering from filename
+            video_title = _NUM_RE.sub('', _YT_ID_RE.sub('', video_title)).strip()
             if video_title:  # Only update if we got a valid title
                 app.logger.info(f"Extracted local file title: {video_title}")
             else:
@@ -588,7 +1040,7 @@ def submit_job():
     parameters['video_title'] = video_title
 
     app.logger.info(f"Created job ID: {job_id}")
-    app.logger.debug(f"Parameters: {json.dumps(parameters, indent=2)}")
+    app.logger.debug("Parameters: %s", parameters)
 
     # Determine job type based on source
     # For YouTube URLs: Create download job first
@@ -602,24 +1054,21 @@ def submit_job():
 
     # Save to database
     try:
-        conn = get_db()
         now = datetime.now().isoformat()
-        app.logger.debug(f"Inserting job into database - ID: {job_id}, Status: queued, Type: {job_type}")
+        app.logger.debug("Inserting job into database - ID: %s, Status: queued, Type: %s", job_id, job_type)
 
-        conn.execute('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type, parent_job_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-                     (job_id, url, 'queued', now, now, json.dumps(parameters), job_type, None))
-        conn.commit()
+        with db_pool.writer() as conn:
+            conn.execute('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type, parent_job_id)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                         (job_id, url, 'queued', now, now, dumps_json(parameters), job_type, None))
 
         # Verify insertion
-        verify_cursor = conn.execute('SELECT id, status FROM jobs WHERE id = ?', (job_id,))
-        verify_row = verify_cursor.fetchone()
+        with db_pool.reader() as conn:
+            verify_row = conn.execute('SELECT id, status FROM jobs WHERE id = ?', (job_id,)).fetchone()
         if verify_row:
             app.logger.info(f"✓ Job inserted into database: {dict(verify_row)}")
         else:
             app.logger.error(f"✗ Job NOT found in database after insert!")
-
-        conn.close()
     except Exception as e:
         app.logger.error(f"✗ Database insertion failed: {e}", exc_info=True)
         return jsonify({'error': f'Database error: {str(e)}'}), 500
@@ -630,7 +1079,7 @@ def submit_job():
         thread = threading.Thread(target=run_job, args=(job_id, url, parameters, job_type), daemon=True)
         thread.start()
         app.logger.info(f"✓ Thread started successfully for job {job_id}")
-        app.logger.debug(f"   Thread ID: {thread.ident}, Daemon: {thread.daemon}, Alive: {thread.is_alive()}")
+        app.logger.debug("   Thread ID: %s, Daemon: %s, Alive: %s", thread.ident, thread.daemon, thread.is_alive())
     except Exception as e:
         app.logger.error(f"✗ Failed to start job thread: {e}", exc_info=True)
         update_job_status(job_id, 'failed', 0, str(e))
@@ -648,23 +1097,44 @@ def submit_job():
             'progress': 0,
             'created_at': now,
             'updated_at': now,
-            'parameters': json.dumps(parameters),
+            'parameters': dumps_json(parameters),
             'job_type': job_type,
             'parent_job_id': None,
             'result': None,
             'error': None
         })
-        app.logger.debug(f"Emitted job_created event for {job_id}")
+        app.logger.debug("Emitted job_created event for %s", job_id)
     except Exception as e:
         app.logger.warning(f"Failed to emit job creation event: {e}")
 
     return jsonify({'job_id': job_id, 'status': 'queued'})
 
 
+def _walk_recent(root, suffixes, cutoff, exclude=None):
+    """Yield paths of files under root ending in suffixes and modified after cutoff (skips hidden dirs)"""
+    pending = deque([root])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.'):
+                            pending.append(entry.path)
+                    elif (entry.is_file() and entry.name.endswith(suffixes)
+                          and not (exclude and exclude in entry.name)
+                          and entry.stat().st_mtime > cutoff):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _walk_srt(root, cutoff):
+    """Yield paths of un-cleaned .srt files under root modified after cutoff"""
+    return _walk_recent(root, '.srt', cutoff, exclude='_clean')
+
+
 def auto_cleanup_subtitles(url, parameters):
     """Auto-cleanup generated subtitle files"""
-    from pathlib import Path
-    import srt_cleanup
 
     # Determine where to look for SRT files
     source_type = parameters.get('source_type', 'youtube')
@@ -672,7 +1142,7 @@ def auto_cleanup_subtitles(url, parameters):
     if source_type == 'upload' and url.startswith('file://'):
         # For uploaded files, SRT will be next to the video file
         file_path = url.replace('file://', '')
-        srt_path = file_path.replace('.mp4', '.srt').replace('.mkv', '.srt').replace('.avi', '.srt')
+        srt_path = os.path.splitext(file_path)[0] + '.srt'
 
         if os.path.exists(srt_path):
             srt_files = [srt_path]
@@ -680,58 +1150,32 @@ def auto_cleanup_subtitles(url, parameters):
             return None
     else:
         # For YouTube, SRT files are in yt_downloads
-        download_dir = Path(app.config['DOWNLOAD_FOLDER'])
         # Find recently created SRT files (within last 5 minutes)
-        import time
         cutoff_time = time.time() - 300  # 5 minutes ago
-        srt_files = [
-            str(f) for f in download_dir.rglob('*.srt')
-            if f.stat().st_mtime > cutoff_time and '_clean' not in f.name
-        ]
+        srt_files = list(_walk_srt(app.config['DOWNLOAD_FOLDER'], cutoff_time))
 
     if not srt_files:
         return '✨ No subtitle files found for cleanup'
 
     # Load filters from config
-    filters = srt_cleanup.load_custom_filters('config.yaml')
+    filters = srt_cleanup.filters_from_dict(load_config())
 
-    # Clean each file
+    # Clean each file (overwrites original)
     total_shortened = 0
     total_removed = 0
     files_cleaned = 0
 
     for srt_file in srt_files:
         try:
-            # Clean the file (overwrites original)
-            segments = srt_cleanup.load_srt(srt_file)
-
-            clean_segments = []
-            removed = 0
-            shortened = 0
-
-            for seg in segments:
-                import copy
-                seg_copy = copy.deepcopy(seg)
-                result_seg, action, reason = srt_cleanup.clean_segment_text(seg_copy, filters)
-
-                if action == 'kept':
-                    clean_segments.append(seg_copy)
-                elif action == 'shortened':
-                    clean_segments.append(result_seg)
-                    shortened += 1
-                elif action == 'removed':
-                    removed += 1
-
-            # Save cleaned version (overwrite original)
-            srt_cleanup.save_srt(clean_segments, srt_file)
-
-            total_shortened += shortened
-            total_removed += removed
-            files_cleaned += 1
-
+            shortened, removed, _ = srt_cleanup.clean_one_file(srt_file, filters)
         except Exception as e:
+            app.logger.warning(f"⚠️ Auto-cleanup failed for {srt_file}: {e}")
             continue
 
+        total_shortened += shortened
+        total_removed += removed
+        files_cleaned += 1
+
     # Return summary
     return f'''✨ Auto-Cleanup Results:
    📄 Files processed: {files_cleaned}
@@ -742,7 +1186,6 @@ def auto_cleanup_subtitles(url, parameters):
 
 def setup_job_logging(job_id):
     """Create a dedicated log file for a specific job"""
-    import logging
 
     # Create logs/jobs directory if it doesn't exist
     log_dir = Path('logs/jobs')
@@ -789,68 +1232,167 @@ def run_job(job_id, url, parameters, job_type):
         update_job_status(job_id, 'failed', 0, None, f"Unknown job type: {job_type}")
 
 
-def create_transcription_job(parent_job_id, video_path, parameters):
-    """Create a transcription job for a downloaded video"""
-    import uuid
+def create_transcription_jobs(parent_job_id, video_paths, parameters):
+    """Create transcription jobs for downloaded videos, inserting them all in one transaction.
+
+    Returns the list of created job ids (empty if the insert failed).
+    """
 
-    job_id = str(uuid.uuid4())
     now = datetime.now().isoformat()
+    jobs = []
+    for video_path in video_paths:
+        job_id = _new_job_id()
 
-    # Extract video title from filename
-    video_title = os.path.splitext(os.path.basename(video_path))[0]
-    import re
-    video_title = re.sub(r'\s*\[[a-zA-Z0-9_-]{11}\]$', '', video_title)
-    video_title = video_title.strip() or "Downloaded Video"
+        # Extract video title from filename
+        video_title = Path(video_path).stem
+        video_title = _YT_ID_RE.sub('', video_title).strip() or "Downloaded Video"
 
-    # Update parameters with video title and file path
-    params = parameters.copy()
-    params['video_title'] = video_title
-    params['source_type'] = 'existing'
+        # Update parameters with video title and file path
+        params = parameters.copy()
+        params['video_title'] = video_title
+        params['source_type'] = 'existing'
 
-    # Convert local file path to file:// URL
-    file_url = f"file://{video_path}"
+        # Convert local file path to file:// URL
+        file_url = f"file://{video_path}"
 
-    app.logger.info(f"Creating transcription job {job_id} for video: {video_title}")
+        app.logger.info(f"Creating transcription job {job_id} for video: {video_title}")
+        jobs.append((job_id, file_url, params, video_path, dumps_json(params)))
+
+    if not jobs:
+        return []
 
     try:
-        conn = get_db()
-        conn.execute('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type, parent_job_id, video_path)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                     (job_id, file_url, 'queued', now, now, json.dumps(params), 'transcribe', parent_job_id, video_path))
-        conn.commit()
-        conn.close()
+        with db_pool.writer() as conn:
+            conn.executemany('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type, parent_job_id, video_path)
+                                VALUES (?, ?, 'queued', ?, ?, ?, 'transcribe', ?, ?)''',
+                             [(job_id, file_url, now, now, params_json, parent_job_id, video_path)
+                              for job_id, file_url, _, video_path, params_json in jobs])
+    except Exception as e:
+        app.logger.error(f"Failed to create transcription jobs: {e}", exc_info=True)
+        return []
 
+    job_ids = []
+    for job_id, file_url, params, video_path, params_json in jobs:
         # Emit socketio event to notify UI of new job
-        try:
-            socketio.emit('job_created', {
-                'id': job_id,
-                'url': file_url,
-                'status': 'queued',
-                'progress': 0,
-                'created_at': now,
-                'updated_at': now,
-                'parameters': json.dumps(params),
-                'job_type': 'transcribe',
-                'parent_job_id': parent_job_id,
-                'result': None,
-                'error': None
-            })
-            app.logger.debug(f"Emitted job_created event for new transcription job {job_id}")
-        except Exception as emit_error:
-            app.logger.warning(f"Failed to emit socketio event: {emit_error}")
+        emit_job_created(job_id, file_url, now, params_json, 'transcribe', parent_job_id)
 
         # Start transcription job in background
         thread = threading.Thread(target=run_transcription_job, args=(job_id, file_url, params), daemon=True)
         thread.start()
 
         app.logger.info(f"✓ Transcription job {job_id} created and started, thread: {thread.ident}")
-        return job_id
+        job_ids.append(job_id)
+
+    return job_ids
+
+
+# yt-dlp output filename template; the [id] suffix is how downloads are matched back to videos
+_OUTTMPL_SUFFIX = '%(title)s [%(id)s].%(ext)s'
+
+
+def _build_outtmpl(download_dir):
+    """yt-dlp output template for files saved under download_dir"""
+    return os.path.join(download_dir, _OUTTMPL_SUFFIX)
 
-    except Exception as e:
-        app.logger.error(f"Failed to create transcription job: {e}", exc_info=True)
-        import traceback
-        app.logger.error(traceback.format_exc())
-        return None
+
+# ydl_opts keys that are the same for every download job (or not worth logging)
+_STATIC_YDL_KEYS = frozenset({'format', 'merge_output_format', 'quiet', 'no_warnings', 'logger'})
+
+
+def progress_throttle(interval=0.25):
+    """Return should_update(percent): True when the integer percent changes or interval seconds passed"""
+    last_pct = [-1]
+    last_update_ts = [0.0]
+
+    def should_update(percent):
+        now = time.monotonic()
+        pct = int(percent)
+        if pct != last_pct[0] or now - last_update_ts[0] >= interval:
+            last_pct[0] = pct
+            last_update_ts[0] = now
+            return True
+        return False
+
+    return should_update
+
+
+def iter_output_batches(process, chunk_size=65536):
+    """
+    Yield lists of output lines from a text-mode Popen's stdout as they arrive.
+
+    Reads the pipe in large chunks so a burst of output costs one read and one
+    batch instead of a readline per line. Windows pipes fall back to readline.
+    """
+    if os.name == 'nt':
+        for line in process.stdout:
+            yield [line]
+        return
+
+    fd = process.stdout.fileno()
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    pending = ''
+    while True:
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            break
+        text = pending + decoder.decode(chunk)
+        # Hold back a trailing \r in case its \n arrives in the next chunk
+        if text.endswith('\r'):
+            text, pending = text[:-1], '\r'
+        else:
+            pending = ''
+        # Universal newlines, as text-mode iteration would give us
+        lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        pending = lines.pop() + pending
+        if lines:
+            yield [line + '\n' for line in lines]
+
+    tail = (pending + decoder.decode(b'', final=True)).replace('\r', '\n').rstrip('\n')
+    if tail:
+        yield [line + '\n' for line in tail.split('\n')]
+
+
+# Environment for job subprocesses (the app never mutates os.environ after startup)
+_CHILD_ENV = {**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+
+# Transcriber output phrases -> overall progress (download = 0-33%, transcription = 34-100%)
+_TRANSCRIBE_MILESTONES = (
+    (('starting transcription', 'transcription started'), 34, 'Starting transcription', '🎙️ Transcribing: Starting...'),
+    (('processing audio', 'detect language'), 45, 'Processing audio', '🎙️ Transcribing: Processing audio...'),
+    (('transcribing', 'segments'), 60, 'Transcribing segments', '🎙️ Transcribing: Generating segments...'),
+    (('transcription complete', 'transcription completed'), 90, 'Transcription complete', '🎙️ Transcribing: Finalizing...'),
+)
+
+
+def stream_subprocess(cmd, job_logger, handle_line):
+    """
+    Run cmd with UTF-8 stdout/stderr merged, logging output in batches and calling
+    handle_line(line, output_lines) for each line. Returns (returncode, output_lines),
+    where output_lines is a deque holding only the most recent lines.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding='utf-8',
+        errors='replace',  # Replace invalid characters instead of crashing
+        bufsize=1,
+        env=_CHILD_ENV
+    )
+
+    # Only the last few lines are ever shown (status messages use at most 20)
+    output_lines = deque(maxlen=32)
+    # Local bindings for the per-line loop
+    log_info = job_logger.info
+    append = output_lines.append
+    for batch in iter_output_batches(process):
+        log_info("OUTPUT batch:\n%s", ''.join(batch).rstrip('\n'))
+        for line in batch:
+            append(line)
+            handle_line(line, output_lines)
+
+    process.wait()
+    return process.returncode, output_lines
 
 
 def run_download_job(job_id, url, parameters):
@@ -861,7 +1403,8 @@ def run_download_job(job_id, url, parameters):
     job_logger.info("="*60)
     job_logger.info(f"DOWNLOAD JOB STARTING: {job_id}")
     job_logger.info(f"URL: {url}")
-    job_logger.info(f"Parameters: {json.dumps(parameters, indent=2)}")
+    if job_logger.isEnabledFor(logging.INFO):
+        job_logger.info("Parameters:\n%s", json.dumps(parameters, indent=2))
     job_logger.info("="*60)
 
     # Update status to running
@@ -871,13 +1414,29 @@ def run_download_job(job_id, url, parameters):
     download_dir = parameters.get('download_dir', app.config['DOWNLOAD_FOLDER'])
     os.makedirs(download_dir, exist_ok=True)
 
+    # Downloaded files in order, with a set for O(1) dedup (hooks/output report files repeatedly)
+    downloaded_files = []
+    seen_files = set()
+    should_update = progress_throttle()
+
+    def add_downloaded(filename):
+        """Record a downloaded file once, keeping download order"""
+        if filename and filename not in seen_files:
+            seen_files.add(filename)
+            downloaded_files.append(filename)
+            return True
+        return False
+
     if YTDLP_AVAILABLE:
         # Use direct yt-dlp Python API (new method)
         job_logger.info("Using direct yt-dlp Python API")
 
-        downloaded_files = []
+        def final_filename(ydl, entry):
+            """Post-merge output path yt-dlp recorded for entry, else the templated name"""
+            requested = entry.get('requested_downloads') or [{}]
+            return requested[-1].get('filepath') or ydl.prepare_filename(entry)
 
-        # Progress hook for yt-dlp
+        # Progress hook for yt-dlp (status writes coalesced; yt-dlp fires many events per second)
         def progress_hook(d):
             if d['status'] == 'downloading':
                 try:
@@ -889,6 +1448,9 @@ def run_download_job(job_id, url, parameters):
                     else:
                         percent = 0
 
+                    if not should_update(percent):
+                        return
+
                     speed_str = d.get('_speed_str', 'N/A')
                     eta_str = d.get('_eta_str', 'N/A')
 
@@ -896,17 +1458,17 @@ def run_download_job(job_id, url, parameters):
                     update_job_status(job_id, 'running', int(percent), message)
 
                 except Exception as e:
-                    job_logger.debug(f"Progress parsing error: {e}")
+                    job_logger.debug("Progress parsing error: %s", e)
 
             elif d['status'] == 'finished':
                 filename = d.get('filename', '')
-                if filename and filename not in downloaded_files:
-                    downloaded_files.append(filename)
+                update_job_status(job_id, 'running', 100, f"📥 Downloaded: {os.path.basename(filename)}")
+                if add_downloaded(filename):
                     job_logger.info(f"✓ Downloaded: {filename}")
 
         # Configure yt-dlp options
         cookie_file = parameters.get('cookie_file')
-        outtmpl = os.path.join(download_dir, '%(title)s [%(id)s].%(ext)s')
+        outtmpl = _build_outtmpl(download_dir)
 
         ydl_opts = {
             'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/mp4',
@@ -921,7 +1483,8 @@ def run_download_job(job_id, url, parameters):
         if cookie_file and os.path.exists(cookie_file):
             ydl_opts['cookiefile'] = cookie_file
 
-        job_logger.info(f"yt-dlp options: {json.dumps({k: str(v) for k, v in ydl_opts.items() if k != 'logger'}, indent=2)}")
+        if job_logger.isEnabledFor(logging.DEBUG):
+            job_logger.debug("yt-dlp options: %s", {k: v for k, v in ydl_opts.items() if k not in _STATIC_YDL_KEYS})
 
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -934,29 +1497,25 @@ def run_download_job(job_id, url, parameters):
                     job_logger.info(f"Playlist detected with {len(info['entries'])} videos")
                     for entry in info['entries']:
                         if entry:
-                            filename = ydl.prepare_filename(entry)
-                            if filename and filename not in downloaded_files:
-                                downloaded_files.append(filename)
+                            add_downloaded(final_filename(ydl, entry))
                 else:
                     # Single video
-                    filename = ydl.prepare_filename(info)
-                    if filename and filename not in downloaded_files:
-                        downloaded_files.append(filename)
+                    add_downloaded(final_filename(ydl, info))
 
                 job_logger.info(f"✓ Download completed successfully")
                 job_logger.info(f"Downloaded {len(downloaded_files)} file(s)")
 
-                # Create transcription jobs for each downloaded file
-                transcription_jobs = []
+                # Create transcription jobs for all downloaded files in one batch
+                video_paths = []
                 for video_path in downloaded_files:
                     if os.path.exists(video_path):
                         job_logger.info(f"Creating transcription job for: {video_path}")
-                        transcribe_job_id = create_transcription_job(job_id, video_path, parameters)
-                        if transcribe_job_id:
-                            transcription_jobs.append(transcribe_job_id)
-                            job_logger.info(f"✓ Created transcription job: {transcribe_job_id}")
+                        video_paths.append(video_path)
                     else:
                         job_logger.warning(f"File does not exist: {video_path}")
+                transcription_jobs = create_transcription_jobs(job_id, video_paths, parameters)
+                for transcribe_job_id in transcription_jobs:
+                    job_logger.info(f"✓ Created transcription job: {transcribe_job_id}")
 
                 result_message = f"✅ Download complete!\n📥 Downloaded {len(downloaded_files)} video(s)\n🎙️ Created {len(transcription_jobs)} transcription job(s)"
                 update_job_status(job_id, 'completed', 100, result_message)
@@ -968,7 +1527,6 @@ def run_download_job(job_id, url, parameters):
 
         except Exception as e:
             job_logger.error(f"Download failed: {e}", exc_info=True)
-            import traceback
             error_msg = f"{type(e).__name__}: {str(e)}\n\n{traceback.format_exc()}"
             update_job_status(job_id, 'failed', 0, None, error_msg)
 
@@ -980,12 +1538,10 @@ def run_download_job(job_id, url, parameters):
     # Fallback to subprocess if yt-dlp API not available
     else:
         job_logger.info("Using subprocess fallback (yt-dlp CLI)")
-        import subprocess
-        import sys
 
         python_exe = sys.executable
         cookie_file = parameters.get('cookie_file')
-        outtmpl = os.path.join(download_dir, '%(title)s [%(id)s].%(ext)s')
+        outtmpl = _build_outtmpl(download_dir)
 
         cmd = [
             python_exe, '-m', 'yt_dlp',
@@ -1000,98 +1556,69 @@ def run_download_job(job_id, url, parameters):
         if cookie_file and os.path.exists(cookie_file):
             cmd.extend(['--cookies', cookie_file])
 
-        job_logger.info(f"Executing command: {' '.join(cmd)}")
+        job_logger.info("Executing: %s (+%d args)", cmd[0], len(cmd) - 1)
+        if job_logger.isEnabledFor(logging.DEBUG):
+            job_logger.debug("Executing command: %s", shlex.join(cmd))
 
         try:
-            # Run download process
-            import os as os_module
-            env = os_module.environ.copy()
-            env['PYTHONIOENCODING'] = 'utf-8'
-
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1,
-                env=env
-            )
-
-            output_lines = []
-            downloaded_files = []
-
-            for line in process.stdout:
-                output_lines.append(line)
-                job_logger.info(f"OUTPUT: {line.strip()}")
-
+            def handle_line(line, output_lines):
                 # Parse download progress
                 if '[download]' in line and '%' in line:
                     try:
-                        import re
-                        match = re.search(r'\[download\]\s+(\d+\.?\d*)%', line)
-                        if match:
+                        match = _DL_PCT_RE.search(line)
+                        if match and should_update(float(match.group(1))):
                             download_pct = float(match.group(1))
                             phase_message = f"📥 Downloading: {download_pct:.1f}%\n\n{line.strip()}"
                             update_job_status(job_id, 'running', int(download_pct), phase_message)
                     except Exception as e:
-                        job_logger.debug(f"Failed to parse progress: {e}")
+                        job_logger.debug("Failed to parse progress: %s", e)
 
                 # Detect completed downloads - multiple patterns
                 if '[download] Destination:' in line or 'has already been downloaded' in line:
                     # Extract file path from output
-                    import re
-                    match = re.search(r'Destination:\s+(.+?)(?:\r|\n|$)', line)
+                    match = _DESTINATION_RE.search(line)
                     if match:
                         file_path = match.group(1).strip()
-                        if file_path not in downloaded_files:
-                            downloaded_files.append(file_path)
-                            job_logger.info(f"Detected download: {file_path}")
+                        if add_downloaded(file_path):
+                            job_logger.info("Detected download: %s", file_path)
 
                 # Also detect merged files (after video+audio merge)
                 if '[Merger] Merging formats into' in line or '[ExtractAudio]' in line:
-                    import re
-                    match = re.search(r'into\s+"(.+?)"', line)
+                    match = _MERGED_INTO_RE.search(line)
                     if match:
                         file_path = match.group(1).strip()
-                        if file_path not in downloaded_files:
-                            downloaded_files.append(file_path)
-                            job_logger.info(f"Detected merged file: {file_path}")
+                        if add_downloaded(file_path):
+                            job_logger.info("Detected merged file: %s", file_path)
 
-            process.wait()
-            job_logger.info(f"Download process completed, return code: {process.returncode}")
+            returncode, output_lines = stream_subprocess(cmd, job_logger, handle_line)
+            job_logger.info(f"Download process completed, return code: {returncode}")
 
-            if process.returncode == 0:
+            if returncode == 0:
                 job_logger.info(f"✓ Download completed successfully")
                 job_logger.info(f"Detected {len(downloaded_files)} file(s) from output")
 
                 # If no files detected from output, scan download directory for recent files
                 if len(downloaded_files) == 0:
                     job_logger.warning("No files detected from output, scanning download directory...")
-                    import time
-                    current_time = time.time()
-                    for root, dirs, files in os.walk(download_dir):
-                        for file in files:
-                            if file.endswith('.mp4') or file.endswith('.mkv') or file.endswith('.webm'):
-                                file_path = os.path.join(root, file)
-                                # Check if file was modified in last 5 minutes
-                                if current_time - os.path.getmtime(file_path) < 300:
-                                    downloaded_files.append(file_path)
-                                    job_logger.info(f"Found recent file: {file_path}")
+                    # Videos modified in the last 5 minutes
+                    cutoff_time = time.time() - 300
+                    for file_path in _walk_recent(download_dir, ('.mp4', '.mkv', '.webm'), cutoff_time):
+                        add_downloaded(file_path)
+                        job_logger.info(f"Found recent file: {file_path}")
 
                 job_logger.info(f"Total files to transcribe: {len(downloaded_files)}")
 
-                # Create transcription jobs for each downloaded file
-                transcription_jobs = []
+                # Create transcription jobs for all downloaded files in one batch
+                video_paths = []
                 for video_path in downloaded_files:
                     if os.path.exists(video_path):
                         job_logger.info(f"Creating transcription job for: {video_path}")
-                        transcribe_job_id = create_transcription_job(job_id, video_path, parameters)
-                        if transcribe_job_id:
-                            transcription_jobs.append(transcribe_job_id)
-                            job_logger.info(f"✓ Created transcription job: {transcribe_job_id}")
+                        video_paths.append(video_path)
                     else:
                         job_logger.warning(f"File does not exist: {video_path}")
+                transcription_jobs = create_transcription_jobs(job_id, video_paths, parameters)
+                for transcribe_job_id in transcription_jobs:
+                    job_logger.info(f"✓ Created transcription job: {transcribe_job_id}")
 
                 result_message = f"✅ Download complete!\n📥 Downloaded {len(downloaded_files)} video(s)\n🎙️ Created {len(transcription_jobs)} transcription job(s)"
                 update_job_status(job_id, 'completed', 100, result_message)
@@ -1100,8 +1627,8 @@ def run_download_job(job_id, url, parameters):
                 job_logger.info("DOWNLOAD JOB COMPLETED")
                 job_logger.info("="*60)
             else:
-                job_logger.error(f"Download failed with return code {process.returncode}")
-                update_job_status(job_id, 'failed', 0, None, '\n'.join(output_lines[-20:]))
+                job_logger.error(f"Download failed with return code {returncode}")
+                update_job_status(job_id, 'failed', 0, None, '\n'.join(list(output_lines)[-20:]))
 
                 job_logger.info("="*60)
                 job_logger.info("DOWNLOAD JOB FAILED")
@@ -1109,7 +1636,6 @@ def run_download_job(job_id, url, parameters):
 
         except Exception as e:
             job_logger.error(f"Download job failed with exception: {type(e).__name__}: {str(e)}", exc_info=True)
-            import traceback
             error_msg = f"{type(e).__name__}: {str(e)}\n\n{traceback.format_exc()}"
             update_job_status(job_id, 'failed', 0, None, error_msg)
 
@@ -1120,8 +1646,6 @@ def run_download_job(job_id, url, parameters):
 
 def run_transcription_job(job_id, url, parameters):
     """Run transcription job in background"""
-    import subprocess
-    import sys
 
     # Set up dedicated logging for this job
     job_logger, log_file = setup_job_logging(job_id)
@@ -1130,7 +1654,8 @@ def run_transcription_job(job_id, url, parameters):
     job_logger.info(f"TRANSCRIPTION JOB STARTING: {job_id}")
     job_logger.info(f"Thread ID: {threading.current_thread().ident}")
     job_logger.info(f"URL: {url}")
-    job_logger.info(f"Parameters: {json.dumps(parameters, indent=2)}")
+    if job_logger.isEnabledFor(logging.INFO):
+        job_logger.info("Parameters:\n%s", json.dumps(parameters, indent=2))
     job_logger.info(f"Log file: {log_file}")
 
     # Also log to main app logger
@@ -1203,16 +1728,10 @@ def run_transcription_job(job_id, url, parameters):
                     except Exception as cleanup_error:
                         job_logger.warning(f"Auto-cleanup failed: {cleanup_error}")
 
-                # Force cleanup of resources to release file handles
-                import gc
-                gc.collect()
-                job_logger.debug("Released file handles and cleaned up resources")
-
                 return
 
             except Exception as e:
                 job_logger.error(f"Direct transcription failed: {e}", exc_info=True)
-                import traceback
                 error_msg = f"{type(e).__name__}: {str(e)}\n\n{traceback.format_exc()}"
                 update_job_status(job_id, 'failed', 0, None, error_msg)
 
@@ -1319,7 +1838,6 @@ def run_transcription_job(job_id, url, parameters):
 
                 except Exception as e:
                     job_logger.error(f"Direct transcription failed: {e}", exc_info=True)
-                    import traceback
                     error_msg = f"{type(e).__name__}: {str(e)}\n\n{traceback.format_exc()}"
                     update_job_status(job_id, 'failed', 0, None, error_msg)
 
@@ -1371,40 +1889,22 @@ def run_transcription_job(job_id, url, parameters):
 
     try:
         # Log the full command for debugging
-        job_logger.info(f"Executing command: {' '.join(cmd)}")
+        job_logger.info("Executing: %s (+%d args)", cmd[0], len(cmd) - 1)
+        if job_logger.isEnabledFor(logging.DEBUG):
+            job_logger.debug("Executing command: %s", shlex.join(cmd))
 
         # Update progress before starting
         job_logger.info("Starting transcription process...")
         update_job_status(job_id, 'running', 10, '📥 Preparing to download...')
 
-        # Run process with UTF-8 encoding
-        # Using encoding parameter instead of universal_newlines to ensure UTF-8 on Windows
-        import os as os_module
-        env = os_module.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            encoding='utf-8',
-            errors='replace',  # Replace invalid characters instead of crashing
-            bufsize=1,
-            env=env
-        )
-
         # Monitor progress
-        output_lines = []
         last_progress = 0
         line_count = 0
 
-        for line in process.stdout:
-            output_lines.append(line)
+        def handle_line(line, output_lines):
+            nonlocal last_progress, line_count
             line_count += 1
 
-            # Write to job log file
-            job_logger.info(f"OUTPUT: {line.strip()}")
-
             # Try to extract progress info from different sources
             progress_updated = False
 
@@ -1412,9 +1912,8 @@ def run_transcription_job(job_id, url, parameters):
             # Map download to 0-33% range (download = 1/3 of total job)
             if '[download]' in line and '%' in line:
                 try:
-                    import re
                     # Match patterns like "[download]  33.9%" or "[download] 100.0%"
-                    match = re.search(r'\[download\]\s+(\d+\.?\d*)%', line)
+                    match = _DL_PCT_RE.search(line)
                     if match:
                         download_pct = float(match.group(1))
                         # Map download progress to 0-33% of overall job
@@ -1423,12 +1922,12 @@ def run_transcription_job(job_id, url, parameters):
 
                         if overall_progress > last_progress:
                             phase_message = f"📥 Downloading: {download_pct:.1f}%\n\n{line.strip()}"
-                            job_logger.info(f"Download progress: {download_pct:.1f}% → Overall: {overall_progress}%")
+                            job_logger.info("Download progress: %.1f%% → Overall: %d%%", download_pct, overall_progress)
                             update_job_status(job_id, 'running', overall_progress, phase_message)
                             last_progress = overall_progress
                             progress_updated = True
                 except Exception as e:
-                    job_logger.debug(f"Failed to parse download progress: {e}")
+                    job_logger.debug("Failed to parse download progress: %s", e)
 
             # Periodic update every 20 lines to keep the UI refreshed
             if not progress_updated and line_count % 20 == 0 and last_progress < 80:
@@ -1443,8 +1942,8 @@ def run_transcription_job(job_id, url, parameters):
                         phase_icon = "🎙️"
                         phase_name = "Transcribing"
 
-                    phase_message = f"{phase_icon} {phase_name}: {new_progress}%\n\n" + '\n'.join(output_lines[-5:])
-                    job_logger.info(f"Periodic progress update: {new_progress}%")
+                    phase_message = f"{phase_icon} {phase_name}: {new_progress}%\n\n" + '\n'.join(list(output_lines)[-5:])
+                    job_logger.info("Periodic progress update: %d%%", new_progress)
                     update_job_status(job_id, 'running', new_progress, phase_message)
                     last_progress = new_progress
                     progress_updated = True
@@ -1452,12 +1951,11 @@ def run_transcription_job(job_id, url, parameters):
             # Pattern 1: Playlist progress "[3/10]"
             if '/' in line and any(emoji in line for emoji in ['🎙️', '✅', '⏭️']):
                 try:
-                    import re
-                    match = re.search(r'\[(\d+)/(\d+)\]', line)
+                    match = _BATCH_POS_RE.search(line)
                     if match:
                         current, total = int(match.group(1)), int(match.group(2))
                         progress = int((current / total) * 100)
-                        update_job_status(job_id, 'running', progress, '\n'.join(output_lines[-10:]))
+                        update_job_status(job_id, 'running', progress, '\n'.join(list(output_lines)[-10:]))
                         last_progress = progress
                         progress_updated = True
                 except:
@@ -1465,43 +1963,22 @@ def run_transcription_job(job_id, url, parameters):
 
             # Pattern 2: Milestone-based progress for transcription phase
             # Download = 0-33%, Transcription = 34-100%
-            if not progress_updated:
+            # yt-dlp [download] frames never carry a milestone, so skip lowercasing them
+            if not progress_updated and not line.startswith('[download]'):
                 line_lower = line.lower()
-                if 'starting transcription' in line_lower or 'transcription started' in line_lower:
-                    # Transcription starts at 34% (after download)
-                    if last_progress < 34:
-                        phase_message = f"🎙️ Transcribing: Starting...\n\n{line.strip()}"
-                        job_logger.info("Progress milestone - Starting transcription (34%)")
-                        update_job_status(job_id, 'running', 34, phase_message)
-                        last_progress = 34
-                elif 'processing audio' in line_lower or 'detect language' in line_lower:
-                    # Audio processing at 45%
-                    if last_progress < 45:
-                        phase_message = f"🎙️ Transcribing: Processing audio...\n\n{line.strip()}"
-                        job_logger.info("Progress milestone - Processing audio (45%)")
-                        update_job_status(job_id, 'running', 45, phase_message)
-                        last_progress = 45
-                elif 'transcribing' in line_lower or 'segments' in line_lower:
-                    # Transcribing segments at 60%
-                    if last_progress < 60:
-                        phase_message = f"🎙️ Transcribing: Generating segments...\n\n{line.strip()}"
-                        job_logger.info("Progress milestone - Transcribing segments (60%)")
-                        update_job_status(job_id, 'running', 60, phase_message)
-                        last_progress = 60
-                elif 'transcription complete' in line_lower or 'transcription completed' in line_lower:
-                    # Transcription complete at 90%
-                    if last_progress < 90:
-                        phase_message = f"🎙️ Transcribing: Finalizing...\n\n{line.strip()}"
-                        job_logger.info("Progress milestone - Transcription complete (90%)")
-                        update_job_status(job_id, 'running', 90, phase_message)
-                        last_progress = 90
-
-        process.wait()
-        job_logger.info(f"Transcription process completed, return code: {process.returncode}")
-
-        if process.returncode == 0:
+                for phrases, pct, label, message in _TRANSCRIBE_MILESTONES:
+                    if last_progress < pct and any(phrase in line_lower for phrase in phrases):
+                        job_logger.info("Progress milestone - %s (%d%%)", label, pct)
+                        update_job_status(job_id, 'running', pct, f"{message}\n\n{line.strip()}")
+                        last_progress = pct
+                        break
+
+        returncode, output_lines = stream_subprocess(cmd, job_logger, handle_line)
+        job_logger.info(f"Transcription process completed, return code: {returncode}")
+
+        if returncode == 0:
             job_logger.info("✓ Job completed successfully")
-            result_output = '\n'.join(output_lines[-20:])
+            result_output = '\n'.join(list(output_lines)[-20:])
 
             # Auto-cleanup if enabled
             if parameters.get('auto_cleanup', False):
@@ -1520,15 +1997,14 @@ def run_transcription_job(job_id, url, parameters):
             job_logger.info("JOB COMPLETED SUCCESSFULLY")
             job_logger.info("="*60)
         else:
-            job_logger.warning(f"✗ Job failed with return code {process.returncode}")
-            update_job_status(job_id, 'failed', 0, None, '\n'.join(output_lines[-20:]))
+            job_logger.warning(f"✗ Job failed with return code {returncode}")
+            update_job_status(job_id, 'failed', 0, None, '\n'.join(list(output_lines)[-20:]))
             job_logger.info("="*60)
             job_logger.info("JOB FAILED")
             job_logger.info("="*60)
 
     except Exception as e:
         job_logger.error(f"✗ Job failed with exception: {type(e).__name__}: {str(e)}", exc_info=True)
-        import traceback
         error_msg = f"{type(e).__name__}: {str(e)}\n\n{traceback.format_exc()}"
         update_job_status(job_id, 'failed', 0, None, error_msg)
         job_logger.info("="*60)
@@ -1536,151 +2012,299 @@ def run_transcription_job(job_id, url, parameters):
         job_logger.info("="*60)
 
 
-def run_translation_job(job_id, srt_file_path, target_lang, source_lang='auto'):
-    """Run translation job for subtitle file"""
-    job_logger, log_file = setup_job_logging(job_id)
+# Translation and transcode jobs run on daemon threads but at most this many at once;
+# the rest wait (still 'queued') for a free slot. Each transcode is a multi-threaded
+# ffmpeg (or a hardware encoder session), so keep this small; set jobs.workers to change it.
+JOB_WORKERS = max(1, int(jobs_config.get('workers', 2)))
+_job_slots = threading.BoundedSemaphore(JOB_WORKERS)
 
-    try:
-        job_logger.info("="*60)
-        job_logger.info(f"TRANSLATION JOB STARTED: {job_id}")
-        job_logger.info(f"Source file: {srt_file_path}")
-        job_logger.info(f"Source language: {source_lang}")
-        job_logger.info(f"Target language: {target_lang}")
-        job_logger.info("="*60)
 
-        if not TRANSLATOR_AVAILABLE:
-            error_msg = "Translation library not installed"
-            job_logger.error(error_msg)
-            update_job_status(job_id, 'failed', 0, None, error_msg)
-            return
+def start_limited_job(job_id, target, *args):
+    """Start target(job_id, *args) in the background once a job slot is free"""
+    def run():
+        with _job_slots:
+            # Skip jobs that were cancelled while waiting for a slot
+            with db_pool.reader() as conn:
+                row = conn.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            if row and row[0] == 'cancelled':
+                app.logger.info(f"Job {job_id} was cancelled before it started")
+                return
+            target(job_id, *args)
 
-        # Normalize source language code
-        # "default" should be treated as auto-detect
-        if source_lang == 'default' or not source_lang or source_lang == '':
-            source_lang = 'auto'
-            job_logger.info(f"Normalized source language to 'auto'")
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
 
-        # Map common language codes to Google Translate codes
-        lang_map = {
-            'sr': 'sr',  # Serbian
-            'hr': 'hr',  # Croatian
-            'bs': 'bs',  # Bosnian
-            'en': 'en',  # English
-            'de': 'de',  # German
-            'fr': 'fr',  # French
-            'es': 'es',  # Spanish
-            'it': 'it',  # Italian
-            'pt': 'pt',  # Portuguese
-            'ru': 'ru',  # Russian
-            'pl': 'pl',  # Polish
-            'tr': 'tr',  # Turkish
-        }
 
-        # Validate source language if not auto
-        if source_lang != 'auto' and source_lang not in lang_map:
-            job_logger.warning(f"Unknown source language '{source_lang}', using auto-detect")
-            source_lang = 'auto'
+def _parse_srt_blocks(content):
+    """Minimal SRT parser used when pysrt is unavailable or finds nothing"""
+    segments = []
+    for block in content.strip().split('\n\n'):
+        lines = block.split('\n')
+        if len(lines) >= 3:
+            # Extract text (everything after the timestamp line)
+            segments.append({'index': lines[0], 'time': lines[1], 'text': '\n'.join(lines[2:])})
+    return segments
 
-        # Read SRT file with encoding detection
+
+def detect_encoding(path, sample=65536):
+    """Guess a text file's encoding from its first bytes; None if it can't be determined"""
+    if not CHARSET_NORMALIZER_AVAILABLE:
+        return None
+    with open(path, 'rb') as f:
+        raw = f.read(sample)
+    best = charset_normalizer.from_bytes(raw).best()
+    if best is None:
+        return None
+    # ASCII samples may still hold UTF-8 further on; utf-8-sig also drops a leading BOM
+    if codecs.lookup(best.encoding).name in ('utf-8', 'ascii'):
+        return 'utf-8-sig'
+    return best.encoding
+
+
+def read_srt_segments(path, encoding, job_logger):
+    """Parse an SRT file into segment dicts, streaming it through pysrt in a single read"""
+    with open(path, 'r', encoding=encoding) as f:
+        if PYSRT_AVAILABLE:
+            segments = [
+                {'index': sub.index, 'time': f"{sub.start} --> {sub.end}", 'text': sub.text}
+                for sub in pysrt.stream(f, error_handling=pysrt.SubRipFile.ERROR_PASS)
+            ]
+            if segments:
+                job_logger.info(f"Loaded {len(segments)} subtitle segments using pysrt")
+                return segments
+            job_logger.warning("pysrt found no segments, falling back to manual parsing")
+            f.seek(0)
+
+        # Manual SRT parsing
+        job_logger.info("Using manual SRT parsing")
+        segments = _parse_srt_blocks(f.read())
+    job_logger.info(f"Parsed {len(segments)} subtitle segments manually")
+    return segments
+
+
+# Google Translate requests in flight at once per translation job
+TRANSLATE_CONCURRENCY = 8
+# Segments are sent in batches joined by a separator line that the translator leaves alone
+TRANSLATE_BATCH_MAX_CHARS = 4000
+TRANSLATE_BATCH_MAX_SEGMENTS = 40
+_TRANSLATE_SEPARATOR = '\n%%\n'
+_TRANSLATE_SPLIT_RE = re.compile(r'\n\s*%%\s*\n')
+
+# Recent translations keyed by (text, src, dest) -> (translated_text, detected_src), shared by
+# all translation jobs; subtitles repeat short lines ("Yes.", "[laughs]") a lot
+TRANSLATION_CACHE_SIZE = 4096
+_translation_cache = LRUCache(TRANSLATION_CACHE_SIZE)
+
+
+# Idle googletrans Translators. Each keeps its own HTTP client, so reusing them keeps
+# connections alive; one is only ever used by one thread at a time.
+_translator_pool = queue.SimpleQueue()
+
+
+@contextmanager
+def borrow_translator():
+    """Take an idle Translator (creating one if none is free) and return it to the pool after use"""
+    try:
+        translator = _translator_pool.get_nowait()
+    except queue.Empty:
+        translator = Translator()
+    try:
+        yield translator
+    finally:
+        _translator_pool.put(translator)
+
+
+def _batch_texts(texts, max_chars, max_segments):
+    """Group texts into consecutive batches of at most max_segments / ~max_chars"""
+    batch, size = [], 0
+    for text in texts:
+        length = len(text) + len(_TRANSLATE_SEPARATOR)
+        if batch and (len(batch) >= max_segments or size + length > max_chars):
+            yield batch
+            batch, size = [], 0
+        batch.append(text)
+        size += length
+    if batch:
+        yield batch
+
+
+def translate_segments(segments, src, dest, job_logger, on_progress=None, concurrency=TRANSLATE_CONCURRENCY,
+                       max_chars=TRANSLATE_BATCH_MAX_CHARS, max_segments=TRANSLATE_BATCH_MAX_SEGMENTS):
+    """
+    Translate subtitle segments in concurrent batches, keeping the original text for any that fail.
+    Each distinct text is translated once, and recently translated texts come from the cache.
+    Returns (translated_segments, detected_src) with segments in input order; on_progress(done, total)
+    is called as each batch finishes.
+    """
+    total = len(segments)
+    translated = list(segments)
+    detected = [None] * total
+
+    def store(i, text, lang):
+        seg = segments[i]
+        translated[i] = {'index': seg['index'], 'time': seg['time'], 'text': text}
+        detected[i] = lang
+
+    # Segment indices waiting on each distinct text
+    pending = {}
+    for i, seg in enumerate(segments):
+        cached = _translation_cache.get((seg['text'], src, dest))
+        if cached is not None:
+            store(i, *cached)
+        else:
+            pending.setdefault(seg['text'], []).append(i)
+
+    def finish(text, translated_text, lang):
+        _translation_cache.put((text, src, dest), (translated_text, lang))
+        for i in pending[text]:
+            store(i, translated_text, lang)
+
+    def translate_batch(batch):
+        with borrow_translator() as translator:
+            if len(batch) > 1:
+                try:
+                    result = translator.translate(_TRANSLATE_SEPARATOR.join(batch), src=src, dest=dest)
+                except Exception as e:
+                    # A transient error shouldn't cost the whole batch; retry its segments singly
+                    job_logger.warning(
+                        f"Translation error for a batch of {len(batch)} segments: {e}, translating them one by one"
+                    )
+                else:
+                    parts = _TRANSLATE_SPLIT_RE.split(result.text.strip())
+                    if len(parts) == len(batch):
+                        for text, part in zip(batch, parts):
+                            finish(text, part.strip(), result.src)
+                        return
+                    job_logger.warning(
+                        f"Batch of {len(batch)} segments came back as {len(parts)} parts, translating them one by one"
+                    )
+
+            for text in batch:
+                try:
+                    result = translator.translate(text, src=src, dest=dest)
+                    finish(text, result.text, result.src)
+                except Exception as e:
+                    job_logger.warning(f"Translation error for segment {pending[text][0]+1}: {e}, keeping original")
+
+    done = total - sum(len(indices) for indices in pending.values())
+    batches = list(_batch_texts(list(pending), max_chars, max_segments))
+    job_logger.info(
+        f"Translating {len(pending)} distinct texts in {len(batches)} batch(es) "
+        f"({done}/{total} segments cached)"
+    )
+    if on_progress and done:
+        on_progress(done, total)
+
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as pool:
+            futures = {pool.submit(translate_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    future.result()
+                    # Log without including actual text to avoid encoding issues in logs
+                    job_logger.info(f"Batch of {len(batch)} segment text(s) translated")
+                except Exception as e:
+                    job_logger.warning(f"Translation error for a batch of {len(batch)} segments: {e}, keeping original")
+                done += sum(len(pending[text]) for text in batch)
+                if on_progress:
+                    on_progress(done, total)
+
+    # Source language is reported from the first segment that translated
+    detected_src = next((lang for lang in detected if lang), src)
+    return translated, detected_src
+
+
+# Source languages accepted as-is by translation jobs; anything else is auto-detected
+SUPPORTED_SOURCE_LANGS = frozenset({'sr', 'hr', 'bs', 'en', 'de', 'fr', 'es', 'it', 'pt', 'ru', 'pl', 'tr'})
+
+# Common 2/3-letter language codes stripped from a subtitle name before adding the target language
+COMMON_LANG_CODES = frozenset({
+    'en', 'eng', 'es', 'spa', 'fr', 'fra', 'fre', 'de', 'deu', 'ger',
+    'it', 'ita', 'pt', 'por', 'pl', 'pol', 'tr', 'tur', 'ru', 'rus',
+    'nl', 'nld', 'dut', 'cs', 'ces', 'cze', 'ar', 'ara', 'zh', 'zho',
+    'chi', 'ja', 'jpn', 'ko', 'kor', 'hi', 'hin', 'sv', 'swe', 'da',
+    'dan', 'no', 'nor', 'fi', 'fin', 'uk', 'ukr', 'el', 'ell', 'gre',
+    'ro', 'ron', 'rum', 'hu', 'hun', 'sr', 'srp', 'hr', 'hrv', 'bg',
+    'bul', 'sk', 'slk', 'slo', 'sl', 'slv', 'lt', 'lit', 'lv', 'lav',
+    'et', 'est', 'ga', 'gle', 'vi', 'vie', 'th', 'tha', 'id', 'ind',
+    'ms', 'msa', 'may', 'he', 'heb', 'fa', 'fas', 'per', 'ca', 'cat',
+})
+
+
+def run_translation_job(job_id, srt_file_path, target_lang, source_lang='auto'):
+    """Run translation job for subtitle file"""
+    job_logger, log_file = setup_job_logging(job_id)
+
+    try:
+        job_logger.info("="*60)
+        job_logger.info(f"TRANSLATION JOB STARTED: {job_id}")
+        job_logger.info(f"Source file: {srt_file_path}")
+        job_logger.info(f"Source language: {source_lang}")
+        job_logger.info(f"Target language: {target_lang}")
+        job_logger.info("="*60)
+
+        if not TRANSLATOR_AVAILABLE:
+            error_msg = "Translation library not installed"
+            job_logger.error(error_msg)
+            update_job_status(job_id, 'failed', 0, None, error_msg)
+            return
+
+        # Normalize source language code
+        # "default" should be treated as auto-detect
+        if source_lang == 'default' or not source_lang or source_lang == '':
+            source_lang = 'auto'
+            job_logger.info(f"Normalized source language to 'auto'")
+
+        # Validate source language if not auto
+        if source_lang != 'auto' and source_lang not in SUPPORTED_SOURCE_LANGS:
+            job_logger.warning(f"Unknown source language '{source_lang}', using auto-detect")
+            source_lang = 'auto'
+
+        # Read SRT file with encoding detection
         update_job_status(job_id, 'running', 10, '📖 Reading subtitle file...')
         job_logger.info("Reading SRT file...")
 
-        # Try different encodings
-        encodings_to_try = ['utf-8', 'utf-8-sig', 'cp1252', 'latin-1', 'iso-8859-1', 'cp1251']
-        srt_content = None
-        used_encoding = None
+        # Try the detected encoding first, then the usual suspects in case the sample guessed wrong;
+        # utf-8-sig also reads BOM-less UTF-8 and keeps a BOM out of the first index
+        encodings_to_try = ['utf-8-sig', 'cp1252', 'latin-1', 'iso-8859-1', 'cp1251']
+        detected_encoding = detect_encoding(srt_file_path)
+        if detected_encoding:
+            job_logger.info(f"Detected encoding: {detected_encoding}")
+            encodings_to_try = [detected_encoding] + [e for e in encodings_to_try if e != detected_encoding]
+        segments = None
 
         for encoding in encodings_to_try:
             try:
-                with open(srt_file_path, 'r', encoding=encoding) as f:
-                    srt_content = f.read()
-                used_encoding = encoding
+                segments = read_srt_segments(srt_file_path, encoding, job_logger)
                 job_logger.info(f"Successfully read file with encoding: {encoding}")
                 break
             except (UnicodeDecodeError, LookupError):
                 continue
 
-        if srt_content is None:
+        if segments is None:
             error_msg = "Failed to read subtitle file - unsupported encoding"
             job_logger.error(error_msg)
             update_job_status(job_id, 'failed', 0, None, error_msg)
             return
 
-        try:
-            import pysrt
-            # Try to parse with pysrt using detected encoding
-            try:
-                subs = pysrt.open(srt_file_path, encoding=used_encoding)
-                segments = []
-                for sub in subs:
-                    segments.append({
-                        'index': sub.index,
-                        'time': f"{sub.start} --> {sub.end}",
-                        'text': sub.text
-                    })
-                job_logger.info(f"Loaded {len(segments)} subtitle segments using pysrt")
-            except Exception as e:
-                job_logger.warning(f"pysrt parsing failed: {e}, falling back to manual parsing")
-                raise ImportError  # Fall back to manual parsing
-        except ImportError:
-            # Manual SRT parsing
-            job_logger.info("Using manual SRT parsing")
-
-            # Simple SRT parsing
-            segments = []
-            blocks = srt_content.strip().split('\n\n')
-            for block in blocks:
-                lines = block.split('\n')
-                if len(lines) >= 3:
-                    # Extract text (everything after the timestamp line)
-                    text = '\n'.join(lines[2:])
-                    segments.append({
-                        'index': lines[0],
-                        'time': lines[1],
-                        'text': text
-                    })
-
-            job_logger.info(f"Parsed {len(segments)} subtitle segments manually")
-
-        # Initialize translator
-        update_job_status(job_id, 'running', 15, '🌐 Initializing translator...')
-        translator = Translator()
-
         # Translate segments
-        translated_segments = []
-        total = len(segments)
-
-        for i, seg in enumerate(segments):
-            progress = 15 + int((i / total) * 80)  # 15% to 95%
-            percent_done = int((i / total) * 100)
+        update_job_status(job_id, 'running', 15, '🌐 Initializing translator...')
 
+        def report_progress(done, total):
+            progress = 15 + int((done / total) * 80)  # 15% to 95%
             update_job_status(
                 job_id, 'running', progress,
-                f'🌐 Translating segments: {i+1}/{total} ({percent_done}%)'
+                f'🌐 Translating segments: {done}/{total} ({int((done / total) * 100)}%)'
             )
 
-            try:
-                # Translate text
-                result = translator.translate(seg['text'], src=source_lang, dest=target_lang)
-                translated_text = result.text
-
-                # Detect source language from first segment if auto
-                if source_lang == 'auto' and i == 0:
-                    source_lang = result.src
-                    job_logger.info(f"Detected source language: {source_lang}")
-
-                translated_segments.append({
-                    'index': seg['index'],
-                    'time': seg['time'],
-                    'text': translated_text
-                })
-
-                # Log without including actual text to avoid encoding issues in logs
-                job_logger.info(f"[{i+1}/{total}] Segment translated successfully")
-
-            except Exception as e:
-                job_logger.warning(f"Translation error for segment {i+1}: {e}, keeping original")
-                translated_segments.append(seg)
+        detect_source = source_lang == 'auto'
+        translated_segments, source_lang = translate_segments(
+            segments, source_lang, target_lang, job_logger, on_progress=report_progress
+        )
+        if detect_source:
+            job_logger.info(f"Detected source language: {source_lang}")
 
         # Generate output filename with language suffix
         update_job_status(job_id, 'running', 95, '💾 Saving translated subtitle...')
@@ -1689,37 +2313,18 @@ def run_translation_job(job_id, srt_file_path, target_lang, source_lang='auto'):
 
         # Remove existing language suffix if present (both 2-letter and 3-letter codes)
         # e.g., "video.rus" -> "video", "video.sr" -> "video"
-        parts = base_name.split('.')
-        if len(parts) > 1:
-            last_part = parts[-1].lower()
-            # Check if last part is a language code (2 or 3 letters)
-            if len(last_part) in [2, 3] and last_part.isalpha():
-                # List of common language codes to detect
-                common_lang_codes = [
-                    'en', 'eng', 'es', 'spa', 'fr', 'fra', 'fre', 'de', 'deu', 'ger',
-                    'it', 'ita', 'pt', 'por', 'pl', 'pol', 'tr', 'tur', 'ru', 'rus',
-                    'nl', 'nld', 'dut', 'cs', 'ces', 'cze', 'ar', 'ara', 'zh', 'zho',
-                    'chi', 'ja', 'jpn', 'ko', 'kor', 'hi', 'hin', 'sv', 'swe', 'da',
-                    'dan', 'no', 'nor', 'fi', 'fin', 'uk', 'ukr', 'el', 'ell', 'gre',
-                    'ro', 'ron', 'rum', 'hu', 'hun', 'sr', 'srp', 'hr', 'hrv', 'bg',
-                    'bul', 'sk', 'slk', 'slo', 'sl', 'slv', 'lt', 'lit', 'lv', 'lav',
-                    'et', 'est', 'ga', 'gle', 'vi', 'vie', 'th', 'tha', 'id', 'ind',
-                    'ms', 'msa', 'may', 'he', 'heb', 'fa', 'fas', 'per', 'ca', 'cat'
-                ]
-                if last_part in common_lang_codes:
-                    base_name = '.'.join(parts[:-1])
-                    job_logger.info(f"Removed language suffix '{last_part}' from filename")
+        head, dot, last_part = base_name.rpartition('.')
+        if dot and last_part.lower() in COMMON_LANG_CODES:
+            base_name = head
+            job_logger.info(f"Removed language suffix '{last_part.lower()}' from filename")
 
         output_path = f"{base_name}.{target_lang}.srt"
 
         job_logger.info(f"Writing translated SRT to: {output_path}")
 
-        # Write translated SRT
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for seg in translated_segments:
-                f.write(f"{seg['index']}\n")
-                f.write(f"{seg['time']}\n")
-                f.write(f"{seg['text']}\n\n")
+        # Write translated SRT, one string per segment through a large buffer
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(f"{seg['index']}\n{seg['time']}\n{seg['text']}\n\n" for seg in translated_segments)
 
         # Complete
         lang_name = LANGUAGE_NAMES.get(target_lang, target_lang.upper())
@@ -1738,9 +2343,62 @@ def run_translation_job(job_id, srt_file_path, target_lang, source_lang='auto'):
         update_job_status(job_id, 'failed', 0, None, error_msg)
 
 
+# Minimum seconds between transcode progress writes (each is a DB update plus a job_update event)
+TRANSCODE_PROGRESS_INTERVAL = 0.5
+
+# Hardware H.264 encoders in order of preference, with arguments roughly matching libx264 -crf 23.
+# They only take 8-bit 4:2:0, so 10-bit (p010) decodes are converted first.
+_HW_H264_ENCODERS = (
+    ('h264_nvenc', ['-pix_fmt', 'yuv420p', '-c:v', 'h264_nvenc', '-preset', 'p5', '-rc', 'vbr', '-cq', '23', '-b:v', '0']),
+    ('h264_qsv', ['-pix_fmt', 'yuv420p', '-c:v', 'h264_qsv', '-global_quality', '23', '-preset', 'medium']),
+    ('h264_videotoolbox', ['-pix_fmt', 'yuv420p', '-c:v', 'h264_videotoolbox', '-q:v', '50']),
+    ('h264_amf', ['-pix_fmt', 'yuv420p', '-c:v', 'h264_amf', '-quality', 'balanced', '-rc', 'cqp', '-qp_i', '23', '-qp_p', '23']),
+)
+_SOFTWARE_H264_ENCODER = ('libx264', ['-c:v', 'libx264', '-preset', 'medium', '-crf', '23'])
+_h264_encoder = None
+_h264_encoder_lock = threading.Lock()
+
+
+def _probe_h264_encoder():
+    """Pick the first hardware H.264 encoder that actually works, else libx264"""
+    try:
+        listed = subprocess.run([FFMPEG_PATH, '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        app.logger.warning(f"Could not list FFmpeg encoders: {e}")
+        return _SOFTWARE_H264_ENCODER
+
+    for name, args in _HW_H264_ENCODERS:
+        if name not in listed:
+            continue
+        # FFmpeg builds list encoders whose GPU/driver isn't present, so try a one-frame encode
+        test_cmd = [FFMPEG_PATH, '-hide_banner', '-v', 'error', '-f', 'lavfi', '-i', 'color=size=320x240:duration=0.1',
+                    '-frames:v', '1', *args, '-f', 'null', '-']
+        try:
+            usable = subprocess.run(test_cmd, capture_output=True, timeout=15).returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            usable = False
+        if usable:
+            app.logger.info(f"🎬 Using hardware H.264 encoder: {name}")
+            return name, args
+        app.logger.info(f"H.264 encoder {name} is listed but not usable here")
+
+    return _SOFTWARE_H264_ENCODER
+
+
+def get_h264_encoder():
+    """(name, ffmpeg args) of the H.264 encoder for transcodes, probed on first use"""
+    global _h264_encoder
+    with _h264_encoder_lock:
+        if _h264_encoder is None:
+            _h264_encoder = _probe_h264_encoder()
+        return _h264_encoder
+
+
 def run_transcode_job(job_id, input_path, output_path):
     """Run video transcoding job to convert to MP4"""
     job_logger, log_file = setup_job_logging(job_id)
+    cancel_event = cancel_events.setdefault(job_id, threading.Event())
 
     try:
         job_logger.info("="*60)
@@ -1750,9 +2408,7 @@ def run_transcode_job(job_id, input_path, output_path):
         job_logger.info("="*60)
 
         # Check ffmpeg availability
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not FFMPEG_AVAILABLE:
             error_msg = "FFmpeg not found. Please install FFmpeg to use transcoding."
             job_logger.error(error_msg)
             update_job_status(job_id, 'failed', 0, None, error_msg)
@@ -1764,7 +2420,7 @@ def run_transcode_job(job_id, input_path, output_path):
         job_logger.info("Getting video duration...")
         try:
             probe_cmd = [
-                'ffprobe', '-v', 'error',
+                FFPROBE_PATH or 'ffprobe', '-v', 'error',
                 '-show_entries', 'format=duration',
                 '-of', 'default=noprint_wrappers=1:nokey=1',
                 input_path
@@ -1776,97 +2432,114 @@ def run_transcode_job(job_id, input_path, output_path):
             job_logger.warning(f"Could not get video duration: {e}, progress will be approximate")
             duration = None
 
-        # Transcode command using H.264 codec for maximum compatibility
-        cmd = [
-            'ffmpeg', '-y',  # Overwrite output
-            '-i', input_path,
-            '-c:v', 'libx264',  # H.264 video codec
-            '-preset', 'medium',  # Balance between speed and compression
-            '-crf', '23',  # Constant Rate Factor (quality: 0-51, lower is better)
-            '-c:a', 'aac',  # AAC audio codec
-            '-b:a', '128k',  # Audio bitrate
-            '-movflags', '+faststart',  # Enable streaming
-            '-progress', 'pipe:1',  # Output progress to stdout
-            output_path
-        ]
+        # Transcode command using H.264 codec for maximum compatibility, on a hardware
+        # encoder (and decoder) when one is available. Hardware encoders reject inputs the
+        # one-frame probe can't catch, so a failed hardware encode is retried with libx264.
+        encoder = get_h264_encoder()
+        attempts = [encoder] if encoder == _SOFTWARE_H264_ENCODER else [encoder, _SOFTWARE_H264_ENCODER]
+        for encoder_name, encoder_args in attempts:
+            job_logger.info(f"Video encoder: {encoder_name}")
+            cmd = [
+                FFMPEG_PATH, '-y',  # Overwrite output
+                *([] if encoder_name == 'libx264' else ['-hwaccel', 'auto']),
+                '-i', input_path,
+                *encoder_args,  # H.264 video codec
+                '-c:a', 'aac',  # AAC audio codec
+                '-b:a', '128k',  # Audio bitrate
+                '-movflags', '+faststart',  # Enable streaming
+                '-progress', 'pipe:1',  # Output progress to stdout
+                output_path
+            ]
 
-        job_logger.info(f"Running FFmpeg command: {' '.join(cmd)}")
-        update_job_status(job_id, 'running', 10, '🔄 Transcoding video...')
+            job_logger.info("Running FFmpeg: %s (+%d args)", cmd[0], len(cmd) - 1)
+            if job_logger.isEnabledFor(logging.DEBUG):
+                job_logger.debug("Running FFmpeg command: %s", shlex.join(cmd))
+            update_job_status(job_id, 'running', 10, '🔄 Transcoding video...')
 
-        # Start FFmpeg process
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1
-        )
+            # Start FFmpeg process
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                bufsize=1
+            )
 
-        # Register process for cancellation
-        if job_id in active_job_processes:
-            pass  # Already registered
-        else:
-            active_job_processes[job_id] = process
+            # Register process for cancellation
+            if job_id in active_job_processes:
+                pass  # Already registered
+            else:
+                active_job_processes[job_id] = process
+
+            # Parse FFmpeg progress output
+            ms_prefix, ms_prefix_len = _FFMPEG_TIME_MS_PREFIX, len(_FFMPEG_TIME_MS_PREFIX)
+            time_prefix, time_prefix_len = _FFMPEG_TIME_PREFIX, len(_FFMPEG_TIME_PREFIX)
+            last_progress = 10
+            last_update_time = 0
+            # Local bindings for the per-line loop
+            set_status = update_job_status
+            log_debug = job_logger.debug
+            now = time.monotonic
+            is_cancelled = cancel_event.is_set
 
-        # Parse FFmpeg progress output
-        import re
-        time_pattern = re.compile(r'out_time_ms=(\d+)')
-        time_pattern_alt = re.compile(r'out_time=(\d+):(\d+):(\d+)\.(\d+)')
-        last_progress = 10
-        last_update_time = 0
+            for line in process.stdout:
+                if is_cancelled():
+                    job_logger.info("Job cancelled by user, terminating FFmpeg")
+                    process.terminate()
+                    break
 
-        for line in process.stdout:
-            # Check if job was cancelled
-            conn = get_db()
-            cursor = conn.execute('SELECT status FROM jobs WHERE id = ?', (job_id,))
-            job_status = cursor.fetchone()
-            conn.close()
-
-            if job_status and job_status[0] == 'cancelled':
-                job_logger.info("Job cancelled by user, terminating FFmpeg")
-                process.terminate()
-                break
+                # Progress output is key=value lines; only the output timestamp matters.
+                # Either key can read N/A before the first frame is written.
+                if line.startswith(ms_prefix):
+                    try:
+                        time_seconds = int(line[ms_prefix_len:]) / 1000000.0
+                    except ValueError:
+                        continue
+                elif line.startswith(time_prefix):
+                    # HH:MM:SS.micro format
+                    try:
+                        hours, minutes, seconds = line[time_prefix_len:].split(':')
+                        time_seconds = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+                    except ValueError:
+                        continue
+                else:
+                    continue
 
-            # Parse time progress - try microseconds format first
-            time_seconds = None
-            match = time_pattern.search(line)
-            if match:
-                time_ms = int(match.group(1))
-                time_seconds = time_ms / 1000000.0
-            else:
-                # Try HH:MM:SS.mmm format
-                match_alt = time_pattern_alt.search(line)
-                if match_alt:
-                    hours = int(match_alt.group(1))
-                    minutes = int(match_alt.group(2))
-                    seconds = int(match_alt.group(3))
-                    time_seconds = hours * 3600 + minutes * 60 + seconds
-
-            if time_seconds is not None and duration:
-                progress_pct = min((time_seconds / duration) * 100, 99)
-                # Map to 10-95% range
-                progress = int(10 + (progress_pct * 0.85))
-
-                # Throttle updates to every 1% or every 2 seconds
-                import time
-                current_time = time.time()
-                if progress > last_progress or (current_time - last_update_time) > 2:
-                    update_job_status(
-                        job_id, 'running', progress,
-                        f'🔄 Transcoding: {time_seconds:.1f}s / {duration:.1f}s ({progress}%)'
-                    )
-                    last_progress = progress
-                    last_update_time = current_time
-                    job_logger.debug(f"Progress: {progress}% ({time_seconds:.1f}s / {duration:.1f}s)")
+                if duration:
+                    progress_pct = min((time_seconds / duration) * 100, 99)
+                    # Map to 10-95% range
+                    progress = int(10 + (progress_pct * 0.85))
+
+                    # Throttle updates to 1% steps at most every TRANSCODE_PROGRESS_INTERVAL, with a heartbeat every 2 seconds
+                    current_time = now()
+                    elapsed = current_time - last_update_time
+                    if (progress > last_progress and elapsed >= TRANSCODE_PROGRESS_INTERVAL) or elapsed > 2:
+                        set_status(
+                            job_id, 'running', progress,
+                            f'🔄 Transcoding: {time_seconds:.1f}s / {duration:.1f}s ({progress}%)'
+                        )
+                        last_progress = progress
+                        last_update_time = current_time
+                        log_debug("Progress: %d%% (%.1fs / %.1fs)", progress, time_seconds, duration)
 
-        # Wait for process to complete
-        process.wait()
+            # Wait for process to complete
+            process.wait()
 
-        # Remove from active processes
-        active_job_processes.pop(job_id, None)
+            # Remove from active processes
+            active_job_processes.pop(job_id, None)
+
+            if cancel_event.is_set() or process.returncode == 0 or encoder_name == _SOFTWARE_H264_ENCODER[0]:
+                break
+            stderr_output = process.stderr.read() if process.stderr else ""
+            job_logger.warning(f"{encoder_name} failed (exit code {process.returncode}), retrying with libx264")
+            job_logger.warning(f"FFmpeg stderr: {stderr_output[:500]}")
+            update_job_status(job_id, 'running', 10, '🔄 Retrying with software encoder...')
 
         # Check result
-        if process.returncode == 0:
+        if cancel_event.is_set():
+            # The cancel endpoint has already marked the job as cancelled
+            job_logger.info(f"TRANSCODE JOB CANCELLED: {job_id}")
+        elif process.returncode == 0:
             # Success
             file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
             result_msg = f"✅ Transcoding complete!\n\nOutput: {os.path.basename(output_path)}\nSize: {file_size:.2f} MB\n\nThe MP4 file is ready to play in your browser."
@@ -1888,16 +2561,16 @@ def run_transcode_job(job_id, input_path, output_path):
         error_msg = f"Transcoding failed: {str(e)}"
         job_logger.error(error_msg, exc_info=True)
         update_job_status(job_id, 'failed', 0, None, error_msg)
+    finally:
+        cancel_events.pop(job_id, None)
 
 
 def cleanup_wav_file(job_id):
     """Delete generated WAV file for a job if it exists"""
     try:
         # Get job URL from database
-        conn = get_db()
-        cursor = conn.execute('SELECT url FROM jobs WHERE id = ?', (job_id,))
-        job = cursor.fetchone()
-        conn.close()
+        with db_pool.reader() as conn:
+            job = conn.execute('SELECT url FROM jobs WHERE id = ?', (job_id,)).fetchone()
 
         if not job:
             return
@@ -1922,36 +2595,67 @@ def cleanup_wav_file(job_id):
         app.logger.warning(f"Error during WAV cleanup for job {job_id}: {e}")
 
 
+# Latest job_update payload per job, sent by a background task so bursts of progress
+# writes collapse into at most one event per job per interval
+JOB_UPDATE_FLUSH_INTERVAL = 0.1
+_pending_job_updates = {}
+_pending_job_updates_lock = threading.Lock()
+_job_update_flusher_started = False
+
+
+def _flush_job_updates():
+    """Background task: emit the most recent queued job_update for each job, forever"""
+    while True:
+        socketio.sleep(JOB_UPDATE_FLUSH_INTERVAL)
+        with _pending_job_updates_lock:
+            if not _pending_job_updates:
+                continue
+            updates = list(_pending_job_updates.values())
+            _pending_job_updates.clear()
+        for payload in updates:
+            try:
+                socketio.emit('job_update', payload)
+            except Exception as e:
+                app.logger.error(f"✗ Failed to emit SocketIO event for job {payload['job_id']}: {e}", exc_info=True)
+
+
+def start_job_update_flusher():
+    """Start coalescing job_update events (until then update_job_status emits directly)"""
+    global _job_update_flusher_started
+    if not _job_update_flusher_started:
+        _job_update_flusher_started = True
+        socketio.start_background_task(_flush_job_updates)
+
+
 def update_job_status(job_id, status, progress, result=None, error=None):
     """Update job status in database and notify clients"""
-    app.logger.debug(f"update_job_status called: job_id={job_id}, status={status}, progress={progress}")
+    app.logger.debug("update_job_status called: job_id=%s, status=%s, progress=%s", job_id, status, progress)
 
     try:
-        conn = get_db()
         now = datetime.now().isoformat()
 
-        app.logger.debug(f"Updating job {job_id} in database")
-        cursor = conn.execute('''UPDATE jobs SET status=?, progress=?, updated_at=?, result=?, error=?
-                        WHERE id=?''',
-                     (status, progress, now, result, error, job_id))
-
-        rows_affected = cursor.rowcount
-        conn.commit()
+        app.logger.debug("Updating job %s in database", job_id)
+        with db_pool.writer() as conn:
+            cursor = conn.execute('''UPDATE jobs SET status=?, progress=?, updated_at=?, result=?, error=?
+                            WHERE id=?''',
+                         (status, progress, now, result, error, job_id))
+            rows_affected = cursor.rowcount
 
         if rows_affected > 0:
-            app.logger.info(f"✓ Job {job_id} updated in DB: status={status}, progress={progress}")
-
-            # Verify update
-            verify_cursor = conn.execute('SELECT id, status, progress FROM jobs WHERE id = ?', (job_id,))
-            verify_row = verify_cursor.fetchone()
-            if verify_row:
-                app.logger.debug(f"   Verified in DB: {dict(verify_row)}")
-            else:
-                app.logger.error(f"✗ Job {job_id} NOT found after update!")
+            # Progress ticks of running jobs are frequent, so only log them at DEBUG
+            app.logger.log(logging.DEBUG if status == 'running' else logging.INFO,
+                           "✓ Job %s updated in DB: status=%s, progress=%s", job_id, status, progress)
+
+            # Verify update (extra read only worth doing when debugging)
+            if app.logger.isEnabledFor(logging.DEBUG):
+                with db_pool.reader() as conn:
+                    verify_row = conn.execute('SELECT id, status, progress FROM jobs WHERE id = ?', (job_id,)).fetchone()
+                if verify_row:
+                    app.logger.debug("   Verified in DB: %s", dict(verify_row))
+                else:
+                    app.logger.error(f"✗ Job {job_id} NOT found after update!")
         else:
             app.logger.warning(f"⚠ No rows affected when updating job {job_id}")
-
-        conn.close()
     except Exception as e:
         app.logger.error(f"✗ Failed to update job {job_id} in database: {e}", exc_info=True)
         return
@@ -1961,33 +2665,64 @@ def update_job_status(job_id, status, progress, result=None, error=None):
         cleanup_wav_file(job_id)
 
     # Emit socket event
+    payload = {
+        'job_id': job_id,
+        'status': status,
+        'progress': progress,
+        'result': result,
+        'error': error
+    }
+    if _job_update_flusher_started:
+        # Replaces any update for this job that hasn't gone out yet
+        with _pending_job_updates_lock:
+            _pending_job_updates[job_id] = payload
+        return
+
     try:
-        app.logger.debug(f"Emitting SocketIO 'job_update' event for job {job_id}")
-        socketio.emit('job_update', {
-            'job_id': job_id,
-            'status': status,
-            'progress': progress,
-            'result': result,
-            'error': error
-        })
-        app.logger.debug(f"✓ SocketIO event emitted for job {job_id}")
+        app.logger.debug("Emitting SocketIO 'job_update' event for job %s", job_id)
+        socketio.emit('job_update', payload)
+        app.logger.debug("✓ SocketIO event emitted for job %s", job_id)
     except Exception as e:
         app.logger.error(f"✗ Failed to emit SocketIO event for job {job_id}: {e}", exc_info=True)
 
 
-@app.route('/api/jobs')
-def get_jobs():
-    """Get all jobs"""
-    app.logger.debug("GET /api/jobs - Fetching all jobs")
-    conn = get_db()
-    jobs = conn.execute('SELECT * FROM jobs ORDER BY created_at DESC').fetchall()
-    conn.close()
+# The job list shows the last line of result (150 chars) and the start of error (100 chars);
+# the full text comes from /api/jobs/<id>
+_JOB_LIST_RESULT_CHARS = 150
+_JOB_LIST_ERROR_CHARS = 101
 
-    jobs_list = [dict(job) for job in jobs]
-    app.logger.debug(f"Returning {len(jobs_list)} jobs")
 
-    for job in jobs_list:
-        app.logger.debug(f"  Job: {job['id'][:8]}... | Status: {job['status']} | Progress: {job['progress']}%")
+@app.route('/api/jobs')
+def get_jobs():
+    """
+    Get jobs, newest first, with result/error trimmed to what the job list displays.
+    Optional query parameters: status, limit, offset.
+    """
+    status = request.args.get('status') or None
+    limit = request.args.get('limit', -1, type=int)  # SQLite treats a negative LIMIT as no limit
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    app.logger.debug("GET /api/jobs - status=%s limit=%s offset=%s", status, limit, offset)
+    # Separate WHERE clauses: "? IS NULL OR status = ?" would keep SQLite off the status index
+    where, args = ('WHERE status = ?', (status,)) if status else ('', ())
+    with db_pool.reader() as conn:
+        jobs = conn.execute(f'''SELECT id, url, status, progress, created_at, updated_at, parameters,
+                                       job_type, parent_job_id, video_path, result,
+                                       substr(error, 1, ?) AS error
+                                FROM jobs {where}
+                                ORDER BY created_at DESC LIMIT ? OFFSET ?''',
+                            (_JOB_LIST_ERROR_CHARS, *args, limit, offset)).fetchall()
+
+    jobs_list = []
+    for job in jobs:
+        job = dict(job)
+        if job['result']:
+            job['result'] = job['result'].rstrip().rsplit('\n', 1)[-1][:_JOB_LIST_RESULT_CHARS]
+        jobs_list.append(job)
+    app.logger.debug("Returning %d jobs", len(jobs_list))
+
+    if app.logger.isEnabledFor(logging.DEBUG):
+        for job in jobs_list:
+            app.logger.debug("  Job: %s | Status: %s | Progress: %s%%", job['id'], job['status'], job['progress'])
 
     return jsonify(jobs_list)
 
@@ -1995,9 +2730,8 @@ def get_jobs():
 @app.route('/api/jobs/<job_id>')
 def get_job(job_id):
     """Get specific job details"""
-    conn = get_db()
-    job = conn.execute('SELECT * FROM jobs WHERE id=?', (job_id,)).fetchone()
-    conn.close()
+    with db_pool.reader() as conn:
+        job = conn.execute('SELECT * FROM jobs WHERE id=?', (job_id,)).fetchone()
 
     if not job:
         return jsonify({'error': 'Job not found'}), 404
@@ -2005,6 +2739,12 @@ def get_job(job_id):
     return jsonify(dict(job))
 
 
+def _read_log_text(path):
+    """Read a whole job log; they are always written as UTF-8, so undecodable bytes are just replaced"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
 @app.route('/api/jobs/<job_id>/logs')
 def get_job_logs(job_id):
     """Get job logs from dedicated log file"""
@@ -2014,20 +2754,7 @@ def get_job_logs(job_id):
         return jsonify({'error': 'Log file not found', 'message': 'Logs may not have been generated yet'}), 404
 
     try:
-        # Try different encodings for log file
-        encodings = ['utf-8', 'utf-8-sig', 'cp1252', 'latin-1']
-        logs = None
-
-        for encoding in encodings:
-            try:
-                with open(log_file, 'r', encoding=encoding, errors='replace') as f:
-                    logs = f.read()
-                break
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        if logs is None:
-            logs = "Error: Could not read log file with supported encodings"
+        logs = run_blocking(_read_log_text, log_file)
 
         return jsonify({
             'job_id': job_id,
@@ -2040,133 +2767,211 @@ def get_job_logs(job_id):
         return jsonify({'error': f'Failed to read log file: {str(e)}'}), 500
 
 
+# (DOWNLOAD_FOLDER setting, its absolute path, same as a Path); recomputed if the
+# storage path changes
+_download_root = (None, None, None)
+
+
+def _current_download_root():
+    global _download_root
+    folder = app.config['DOWNLOAD_FOLDER']
+    if _download_root[0] != folder:
+        root = os.path.abspath(folder)
+        _download_root = (folder, root, Path(root))
+    return _download_root
+
+
+def download_root():
+    """Absolute path of the downloads folder"""
+    return _current_download_root()[1]
+
+
+def download_root_path():
+    """Absolute path of the downloads folder as a Path"""
+    return _current_download_root()[2]
+
+
+def safe_download_path(user_path, allow_root=True):
+    """Absolute path for a client-supplied path under the downloads folder.
+
+    Returns None if the path escapes the folder (or is the folder itself when
+    allow_root is False). The path is normalized lexically, so symlinks inside the
+    folder are left alone rather than followed.
+    """
+    root = download_root()
+    candidate = os.path.abspath(os.path.join(root, user_path.lstrip('/\\')))
+    try:
+        if os.path.commonpath([root, candidate]) != root:
+            return None
+    except ValueError:
+        # Different drives on Windows
+        return None
+    if candidate == root and not allow_root:
+        return None
+    return candidate
+
+
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.avi', '.webm', '.mov'})
+_SUBTITLE_EXTENSIONS = frozenset({'.srt', '.vtt', '.ass'})
+# Files the upload endpoint accepts
+_UPLOAD_EXTENSIONS = _VIDEO_EXTENSIONS | _SUBTITLE_EXTENSIONS
+# Containers the transcode endpoint converts to MP4
+_TRANSCODE_EXTENSIONS = frozenset({'.avi', '.mkv', '.webm', '.mov', '.flv', '.wmv', '.m4v'})
+
+# Per-directory (mtime_ns, videos, subtitles, subdirs) for folder counts in list_files.
+# A directory's mtime changes whenever an entry is added, removed or renamed in it, so
+# unchanged directories cost one stat; kept per directory because that doesn't bubble up.
+DIR_COUNT_CACHE_SIZE = 4096
+_dir_count_cache = LRUCache(DIR_COUNT_CACHE_SIZE)
+
+
+def _dir_media_counts(path):
+    """(videos, subtitles, subdirs) directly inside path, cached by the directory's mtime"""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _dir_count_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1:]
+
+    videos = subtitles = 0
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if is_pending_delete(entry.name):
+                continue
+            try:
+                # Don't follow directory symlinks: a link back up the tree would loop
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in _VIDEO_EXTENSIONS:
+                        videos += 1
+                    elif ext in _SUBTITLE_EXTENSIONS:
+                        subtitles += 1
+            except OSError:
+                continue
+
+    _dir_count_cache.put(path, (mtime, videos, subtitles, subdirs))
+    return videos, subtitles, subdirs
+
+
+def _count_media_files(root):
+    """Count (videos, subtitles) under root recursively"""
+    videos = subtitles = 0
+    stack = [root]
+    while stack:
+        try:
+            v, s, subdirs = _dir_media_counts(stack.pop())
+        except OSError:
+            continue
+        videos += v
+        subtitles += s
+        stack.extend(subdirs)
+    return videos, subtitles
+
+
 @app.route('/api/files')
 def list_files():
     """List downloaded files and folders (hierarchical structure)"""
-    download_dir = Path(app.config['DOWNLOAD_FOLDER'])
+    download_dir = download_root_path()
 
     # Get optional subdirectory parameter for navigation
     subdir = request.args.get('path', '')
-    current_dir = download_dir / subdir if subdir else download_dir
+    current_dir = safe_download_path(subdir)
+    if current_dir is None:
+        return jsonify({'error': 'Invalid path'}), 400
+    current_dir = Path(current_dir)
 
     if not current_dir.exists() or not current_dir.is_dir():
         return jsonify({'error': 'Directory not found'}), 404
 
-    video_extensions = ['.mp4', '.mkv', '.avi', '.webm', '.mov']
-    subtitle_extensions = ['.srt', '.vtt', '.ass']
-    allowed_extensions = video_extensions + subtitle_extensions
-
-    items = []
-
-    # Add folders
-    try:
-        for item in sorted(current_dir.iterdir(), key=lambda x: x.name.lower()):
-            if item.is_dir():
-                # Count video and subtitle files in this folder (recursive)
-                video_count = sum(1 for f in item.rglob('*') if f.is_file() and f.suffix.lower() in video_extensions)
-                subtitle_count = sum(1 for f in item.rglob('*') if f.is_file() and f.suffix.lower() in subtitle_extensions)
+    rel_dir = str(current_dir.relative_to(download_dir)).replace('\\', '/')
 
-                rel_path = item.relative_to(download_dir)
-                path_str = str(rel_path).replace('\\', '/')
-
-                folder_info = {
-                    'name': item.name,
-                    'path': path_str,
-                    'type': 'folder',
-                    'modified': datetime.fromtimestamp(item.stat().st_mtime).isoformat(),
-                    'video_count': video_count,
-                    'subtitle_count': subtitle_count
-                }
-                items.append(folder_info)
-    except PermissionError:
-        pass
+    def rel_path(name):
+        return name if rel_dir == '.' else f"{rel_dir}/{name}"
 
-    # Add files (only videos and subtitles)
-    # First pass: collect all video files
-    video_files = []
+    # One pass over the directory, bucketing entries and stat-ing each once
+    folders, videos, subtitles = [], [], []
+    # Subtitles indexed by name: "video.en.srt" -> srt_langs["video"] gets "en",
+    # and every SRT stem is kept for the legacy unsuffixed "video.srt" match
+    srt_langs = {}
+    srt_stems = set()
     try:
-        for item in sorted(current_dir.iterdir(), key=lambda x: x.name.lower()):
-            if item.is_file() and item.suffix.lower() in video_extensions:
-                video_files.append(item)
+        with os.scandir(current_dir) as it:
+            entries = sorted(it, key=lambda e: e.name.lower())
     except PermissionError:
-        pass
+        entries = []
 
-    # Build set of video base names (without extension) for SRT filtering
-    video_base_names = {item.stem for item in video_files}
+    for entry in entries:
+        if is_pending_delete(entry.name):
+            continue
+        try:
+            if entry.is_dir():
+                folders.append((entry, entry.stat()))
+                continue
+            if not entry.is_file():
+                continue
+            stem, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            if ext in _VIDEO_EXTENSIONS:
+                videos.append((entry, entry.stat(), stem, ext))
+            elif ext in _SUBTITLE_EXTENSIONS:
+                subtitles.append((entry, entry.stat(), stem, ext))
+                if ext == '.srt':
+                    srt_stems.add(stem)
+                    base, dot, lang = stem.rpartition('.')
+                    if dot:
+                        srt_langs.setdefault(base, []).append(lang)
+        except OSError:
+            continue
 
-    # Second pass: add video files with subtitle info
-    for item in video_files:
-        rel_path = item.relative_to(download_dir)
-        path_str = str(rel_path).replace('\\', '/')
+    items = []
 
-        file_info = {
-            'name': item.name,
-            'path': path_str,
-            'size': item.stat().st_size,
-            'modified': datetime.fromtimestamp(item.stat().st_mtime).isoformat(),
-            'type': item.suffix.lower()
-        }
+    # Add folders
+    for entry, st in folders:
+        # Count video and subtitle files in this folder (recursive)
+        video_count, subtitle_count = _count_media_files(entry.path)
+        items.append({
+            'name': entry.name,
+            'path': rel_path(entry.name),
+            'type': 'folder',
+            'modified': datetime.fromtimestamp(st.st_mtime).isoformat(),
+            'video_count': video_count,
+            'subtitle_count': subtitle_count
+        })
 
-        # Check if video has subtitles (with language suffixes)
-        # Look for: video.en.srt, video.es.srt, etc.
-        base_name = item.stem
-        parent_dir = item.parent
-        subtitle_languages = []
-
-        # Check for language-suffixed subtitles
-        for srt_file in parent_dir.glob(f"{base_name}.*.srt"):
-            # Extract language code from filename (e.g., "video.en.srt" -> "en")
-            parts = srt_file.stem.split('.')
-            if len(parts) >= 2:
-                lang_code = parts[-1]
-                subtitle_languages.append(lang_code)
-
-        # Also check for subtitle without suffix (legacy support)
-        legacy_srt = item.with_suffix('.srt')
-        if legacy_srt.exists():
+    # Add video files with subtitle info
+    # Look for: video.en.srt, video.es.srt, etc., plus video.srt (legacy support)
+    video_base_names = set()
+    for entry, st, stem, ext in videos:
+        video_base_names.add(stem)
+        subtitle_languages = list(srt_langs.get(stem, ()))
+        if stem in srt_stems:
             subtitle_languages.append('default')
 
-        file_info['has_subtitles'] = len(subtitle_languages) > 0
-        file_info['subtitle_languages'] = subtitle_languages
-
-        items.append(file_info)
-
-    # Third pass: add standalone subtitle files (only if no matching video exists)
-    try:
-        for item in sorted(current_dir.iterdir(), key=lambda x: x.name.lower()):
-            if item.is_file() and item.suffix.lower() in subtitle_extensions:
-                # Skip this SRT if there's a video with the same base name
-                # Also check for language-coded subtitles (e.g., video.sr.srt)
-                subtitle_stem = item.stem
-
-                # Check exact match first
-                if subtitle_stem in video_base_names:
-                    continue
-
-                # Check if this is a language-coded subtitle (e.g., video.en, video.sr)
-                # by removing the last part after the dot
-                parts = subtitle_stem.rsplit('.', 1)
-                if len(parts) == 2:
-                    # Check if base name (without language code) matches a video
-                    base_without_lang = parts[0]
-                    if base_without_lang in video_base_names:
-                        # This is a language-coded subtitle for an existing video, skip it
-                        continue
-
-                rel_path = item.relative_to(download_dir)
-                path_str = str(rel_path).replace('\\', '/')
+        items.append({
+            'name': entry.name,
+            'path': rel_path(entry.name),
+            'size': st.st_size,
+            'modified': datetime.fromtimestamp(st.st_mtime).isoformat(),
+            'type': ext,
+            'has_subtitles': len(subtitle_languages) > 0,
+            'subtitle_languages': subtitle_languages
+        })
 
-                file_info = {
-                    'name': item.name,
-                    'path': path_str,
-                    'size': item.stat().st_size,
-                    'modified': datetime.fromtimestamp(item.stat().st_mtime).isoformat(),
-                    'type': item.suffix.lower()
-                }
+    # Add standalone subtitle files (only if no matching video exists)
+    for entry, st, stem, ext in subtitles:
+        # Skip subtitles for an existing video, including language-coded ones (e.g., video.sr.srt)
+        if stem in video_base_names or stem.rpartition('.')[0] in video_base_names:
+            continue
 
-                items.append(file_info)
-    except PermissionError:
-        pass
+        items.append({
+            'name': entry.name,
+            'path': rel_path(entry.name),
+            'size': st.st_size,
+            'modified': datetime.fromtimestamp(st.st_mtime).isoformat(),
+            'type': ext
+        })
 
     return jsonify({
         'current_path': subdir,
@@ -2177,8 +2982,6 @@ def list_files():
 @app.route('/api/files/<path:filename>')
 def download_file(filename):
     """Download or stream a file"""
-    from urllib.parse import unquote
-    import os
 
     # Debug logging
     app.logger.debug(f"🔍 File request: {filename}")
@@ -2221,13 +3024,12 @@ def download_file(filename):
     force_download = request.args.get('download', 'false').lower() == 'true'
 
     # For video files, stream unless download is forced
-    video_extensions = ['.mp4', '.mkv', '.avi', '.webm', '.mov']
     file_ext = os.path.splitext(filename_decoded)[1].lower()
 
     app.logger.debug(f"   Sending file with path: {filename_for_send}")
     app.logger.debug(f"   Force download: {force_download}")
 
-    if file_ext in video_extensions and not force_download:
+    if file_ext in _VIDEO_EXTENSIONS and not force_download:
         # Stream video (no attachment) - use forward slash path
         return send_from_directory(app.config['DOWNLOAD_FOLDER'], filename_for_send, as_attachment=False)
     else:
@@ -2251,11 +3053,10 @@ def create_folder():
             return jsonify({'error': 'Invalid folder name'}), 400
 
         # Build full path
-        if parent_path:
-            parent_path = parent_path.replace('..', '').strip('/')
-            full_path = Path(app.config['DOWNLOAD_FOLDER']) / parent_path / folder_name
-        else:
-            full_path = Path(app.config['DOWNLOAD_FOLDER']) / folder_name
+        parent_dir = safe_download_path(parent_path)
+        if parent_dir is None:
+            return jsonify({'error': 'Invalid parent path'}), 400
+        full_path = Path(parent_dir) / folder_name
 
         # Check if folder already exists
         if full_path.exists():
@@ -2265,7 +3066,7 @@ def create_folder():
         full_path.mkdir(parents=True, exist_ok=False)
         app.logger.info(f"Created folder: {full_path}")
 
-        return jsonify({'success': True, 'path': str(full_path.relative_to(app.config['DOWNLOAD_FOLDER']))})
+        return jsonify({'success': True, 'path': str(full_path.relative_to(download_root()))})
 
     except Exception as e:
         app.logger.error(f"Error creating folder: {e}")
@@ -2276,7 +3077,7 @@ def create_folder():
 def list_folders():
     """List all folders in the download directory for move operations"""
     try:
-        download_dir = Path(app.config['DOWNLOAD_FOLDER'])
+        download_dir = download_root_path()
         folders = []
 
         # Recursively find all folders
@@ -2301,7 +3102,6 @@ def list_folders():
 @app.route('/api/browse-directories', methods=['GET'])
 def browse_directories():
     """Browse server filesystem directories"""
-    import platform
 
     path = request.args.get('path', '')
 
@@ -2311,7 +3111,6 @@ def browse_directories():
             system = platform.system()
             if system == 'Windows':
                 # Windows: show drives
-                import string
                 drives = []
                 for letter in string.ascii_uppercase:
                     drive = f"{letter}:\\"
@@ -2384,30 +3183,39 @@ def move_item():
             return jsonify({'error': 'Source path is required'}), 400
 
         # Security: prevent directory traversal
-        source_path = source_path.replace('..', '').strip('/')
-        destination_path = destination_path.replace('..', '').strip('/')
+        source_full = safe_download_path(source_path, allow_root=False)
+        dest_dir = safe_download_path(destination_path)
+        if source_full is None or dest_dir is None:
+            return jsonify({'error': 'Invalid path'}), 400
 
-        download_dir = Path(app.config['DOWNLOAD_FOLDER'])
-        source_full = download_dir / source_path
+        download_dir = download_root_path()
+        source_full = Path(source_full)
         item_name = source_full.name
 
         # Build destination path
-        if destination_path:
-            dest_full = download_dir / destination_path / item_name
-        else:
-            dest_full = download_dir / item_name
+        dest_full = Path(dest_dir) / item_name
 
         # Check if source exists
-        if not source_full.exists():
+        try:
+            os.stat(source_full)
+        except OSError:
             return jsonify({'error': 'Source does not exist'}), 404
 
         # Check if destination already exists
-        if dest_full.exists():
+        try:
+            os.lstat(dest_full)
+        except OSError:
+            pass
+        else:
             return jsonify({'error': f'An item with the name "{item_name}" already exists in the destination'}), 400
 
-        # Move the item
-        import shutil
-        shutil.move(str(source_full), str(dest_full))
+        # Move the item: a single rename on the same filesystem, copy+delete across devices
+        try:
+            os.replace(source_full, dest_full)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source_full), str(dest_full))
         app.logger.info(f"Moved {item_type}: {source_path} → {dest_full.relative_to(download_dir)}")
 
         return jsonify({'success': True, 'new_path': str(dest_full.relative_to(download_dir))})
@@ -2417,6 +3225,124 @@ def move_item():
         return jsonify({'error': str(e)}), 500
 
 
+def _fast_rmtree(path):
+    """Remove a directory tree without recursion.
+
+    Each directory is scanned once and its files unlinked in inode order before
+    moving on to subdirectories, using the DirEntry type info so no extra stat is
+    needed per entry. Directories are removed deepest first at the end.
+    """
+    stack = [os.fspath(path)]
+    visited = []
+    while stack:
+        current = stack.pop()
+        visited.append(current)
+        with os.scandir(current) as it:
+            entries = sorted(it, key=lambda e: e.inode())
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            else:
+                os.unlink(entry.path)
+    for directory in reversed(visited):
+        os.rmdir(directory)
+
+
+# Deleted items are first renamed aside (".<name>.deleting-<uuid hex>", hidden from
+# listings) and removed by a background thread, so requests don't wait on locks
+_PENDING_DELETE_TAG = '.deleting-'
+_PENDING_DELETE_RE = re.compile(r'\.(.+)' + re.escape(_PENDING_DELETE_TAG) + r'[0-9a-f]{32}', re.DOTALL)
+DELETE_RETRY_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8)
+_pending_deletes = deque()
+_pending_deletes_event = threading.Event()
+_delete_worker_lock = threading.Lock()
+_delete_worker_started = False
+
+
+def is_pending_delete(name):
+    """True if name is an item delete_item renamed aside for background removal"""
+    return _PENDING_DELETE_RE.fullmatch(name) is not None
+
+
+def _remove_path(path, is_dir):
+    """Remove a file or folder, retrying with backoff while it's locked"""
+    for delay in DELETE_RETRY_DELAYS:
+        try:
+            if is_dir:
+                _fast_rmtree(path)
+            else:
+                os.unlink(path)
+            return
+        except PermissionError:
+            app.logger.warning(f"File locked, retrying in {delay * 1000:.0f}ms: {path}")
+            time.sleep(delay)
+    if is_dir:
+        _fast_rmtree(path)
+    else:
+        os.unlink(path)
+
+
+def _delete_worker():
+    """Background thread: remove items that delete_item renamed aside"""
+    while True:
+        _pending_deletes_event.wait()
+        _pending_deletes_event.clear()
+        while _pending_deletes:
+            path, is_dir = _pending_deletes.popleft()
+            try:
+                _remove_path(path, is_dir)
+                app.logger.debug(f"Removed pending delete: {path}")
+            except Exception as e:
+                app.logger.error(f"✗ Failed to remove {path}: {e}")
+                _restore_pending_delete(path)
+
+
+def _restore_pending_delete(path):
+    """Give an item that couldn't be removed its name back so it shows up again"""
+    head, name = os.path.split(path)
+    match = _PENDING_DELETE_RE.fullmatch(name)
+    if not match:
+        return
+    original = os.path.join(head, match.group(1))
+    try:
+        if os.path.lexists(original):
+            raise FileExistsError(original)
+        os.rename(path, original)
+        app.logger.warning(f"⚠️ Restored {original} after its delete failed")
+    except OSError as e:
+        app.logger.error(f"✗ Could not restore {path}: {e}")
+
+
+def sweep_pending_deletes(root):
+    """Queue items renamed aside before a restart or crash, which nothing else will remove"""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_pending_delete(entry.name):
+                        _schedule_delete(entry.path, is_dir)
+                    elif is_dir:
+                        pending.append(entry.path)
+        except OSError:
+            continue
+
+
+def _schedule_delete(path, is_dir):
+    """Queue a renamed-aside item for removal, starting the worker on first use"""
+    global _delete_worker_started
+    with _delete_worker_lock:
+        if not _delete_worker_started:
+            _delete_worker_started = True
+            threading.Thread(target=_delete_worker, daemon=True, name='delete-worker').start()
+    _pending_deletes.append((path, is_dir))
+    _pending_deletes_event.set()
+
+
 @app.route('/api/files/delete', methods=['DELETE'])
 def delete_item():
     """Delete a file or folder"""
@@ -2429,42 +3355,30 @@ def delete_item():
             return jsonify({'error': 'Path is required'}), 400
 
         # Security: prevent directory traversal
-        item_path = item_path.replace('..', '').strip('/')
+        full_path = safe_download_path(item_path, allow_root=False)
+        if full_path is None:
+            return jsonify({'error': 'Invalid path'}), 400
+        full_path = Path(full_path)
 
-        download_dir = Path(app.config['DOWNLOAD_FOLDER'])
-        full_path = download_dir / item_path
-
-        # Check if item exists
-        if not full_path.exists():
+        # Check if item exists; lstat so a symlink is removed rather than followed
+        try:
+            is_dir = stat.S_ISDIR(os.lstat(full_path).st_mode)
+        except OSError:
             return jsonify({'error': 'Item does not exist'}), 404
 
-        # Delete the item with retry logic for Windows file locking
-        import shutil
-        import time
-        import gc
-
-        # Force garbage collection to release any file handles
-        gc.collect()
+        # Rename the item aside and let the background thread delete it; the rename
+        # usually works even while a reader holds the file open
+        aside_path = full_path.with_name(f".{full_path.name}{_PENDING_DELETE_TAG}{uuid.uuid4().hex}")
+        try:
+            os.replace(full_path, aside_path)
+        except PermissionError:
+            # Locked against renames too (Windows) - delete in place with backoff
+            _remove_path(full_path, is_dir)
+        else:
+            _schedule_delete(aside_path, is_dir)
 
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                if full_path.is_dir():
-                    shutil.rmtree(full_path)
-                    app.logger.info(f"Deleted folder: {item_path}")
-                else:
-                    full_path.unlink()
-                    app.logger.info(f"Deleted file: {item_path}")
-                return jsonify({'success': True})
-            except PermissionError as pe:
-                if attempt < max_retries - 1:
-                    # Wait a bit and retry
-                    app.logger.warning(f"File locked, retrying in 0.5s... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(0.5)
-                    gc.collect()  # Try to force cleanup again
-                else:
-                    # Final attempt failed
-                    raise pe
+        app.logger.info(f"Deleted {'folder' if is_dir else 'file'}: {item_path}")
+        return jsonify({'success': True})
 
     except PermissionError as pe:
         app.logger.error(f"Permission error deleting item (file may be in use): {pe}")
@@ -2477,44 +3391,26 @@ def delete_item():
 @app.route('/api/filters', methods=['GET'])
 def get_filters():
     """Get current hallucination filters from config.yaml"""
-    import yaml
-
-    config_path = 'config.yaml'
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                filters = config.get('hallucination_filters', {})
-
-                # Return only the user-editable fields
-                return jsonify({
-                    'bad_phrases': filters.get('bad_phrases', []),
-                    'bad_patterns': filters.get('bad_patterns', [])
-                })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+    try:
+        # Empty when config.yaml doesn't exist, which gives the defaults below
+        filters = load_config().get('hallucination_filters', {})
 
-    # Return defaults if config doesn't exist
-    return jsonify({
-        'bad_phrases': [],
-        'bad_patterns': []
-    })
+        # Return only the user-editable fields
+        return jsonify({
+            'bad_phrases': filters.get('bad_phrases', []),
+            'bad_patterns': filters.get('bad_patterns', [])
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/filters', methods=['POST'])
 def save_filters():
     """Save hallucination filters to config.yaml"""
-    import yaml
-
     data = request.get_json()
-    config_path = 'config.yaml'
-
     try:
-        # Load existing config
-        config = {}
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
+        # Load existing config (a copy, since the cached dict is shared)
+        config = copy.deepcopy(load_config())
 
         # Update filter sections
         if 'hallucination_filters' not in config:
@@ -2524,8 +3420,7 @@ def save_filters():
         config['hallucination_filters']['bad_patterns'] = data.get('bad_patterns', [])
 
         # Save updated config
-        with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        save_config(config)
 
         return jsonify({'status': 'success', 'message': 'Filters saved successfully'})
 
@@ -2536,9 +3431,6 @@ def save_filters():
 @app.route('/api/clean-subtitles', methods=['POST'])
 def clean_subtitles_endpoint():
     """Clean existing subtitle file with hallucination filters"""
-    import srt_cleanup
-    import shutil
-    from datetime import datetime
 
     data = request.get_json()
     file_path = data.get('file_path', '')
@@ -2546,50 +3438,38 @@ def clean_subtitles_endpoint():
     if not file_path:
         return jsonify({'error': 'file_path is required'}), 400
 
-    # Construct full path
-    full_path = os.path.join(app.config['DOWNLOAD_FOLDER'], file_path)
+    # Construct full path (None if it points outside the downloads folder)
+    full_path = safe_download_path(file_path, allow_root=False)
+    if full_path is None:
+        return jsonify({'error': 'Invalid file path'}), 400
 
-    # Validate file exists
-    if not os.path.exists(full_path):
+    # Validate file exists and is an SRT file
+    try:
+        st = os.stat(full_path)
+    except OSError:
         return jsonify({'error': 'File not found'}), 404
 
-    # Validate it's an SRT file
-    if not full_path.endswith('.srt'):
+    if not stat.S_ISREG(st.st_mode) or os.path.splitext(full_path)[1] != '.srt':
         return jsonify({'error': 'File must be an SRT file'}), 400
 
     try:
         # Create backup before cleaning
         backup_path = full_path.replace('.srt', f'.srt.backup.{datetime.now().strftime("%Y%m%d_%H%M%S")}')
-        shutil.copy2(full_path, backup_path)
+        # clean_one_file swaps a new file in rather than rewriting this one, so a hard link
+        # keeps the original content without copying; copy where links aren't supported
+        try:
+            os.link(full_path, backup_path)
+        except OSError:
+            shutil.copy2(full_path, backup_path)
 
         # Load filters from config
-        filters = srt_cleanup.load_custom_filters('config.yaml')
-
-        # Load and clean subtitles
-        segments = srt_cleanup.load_srt(full_path)
-
-        clean_segments = []
-        removed = 0
-        shortened = 0
-
-        for seg in segments:
-            import copy
-            seg_copy = copy.deepcopy(seg)
-            result_seg, action, reason = srt_cleanup.clean_segment_text(seg_copy, filters)
-
-            if action == 'kept':
-                clean_segments.append(seg_copy)
-            elif action == 'shortened':
-                clean_segments.append(result_seg)
-                shortened += 1
-            elif action == 'removed':
-                removed += 1
+        filters = srt_cleanup.filters_from_dict(load_config())
 
-        # Save cleaned version (overwrite original)
-        srt_cleanup.save_srt(clean_segments, full_path)
+        # Clean subtitles and save the cleaned version (overwrite original)
+        shortened, removed, kept = srt_cleanup.clean_one_file(full_path, filters)
 
         # Prepare result message
-        message = f"Shortened: {shortened}, Removed: {removed}, Kept: {len(clean_segments)}\nBackup: {os.path.basename(backup_path)}"
+        message = f"Shortened: {shortened}, Removed: {removed}, Kept: {kept}\nBackup: {os.path.basename(backup_path)}"
 
         return jsonify({
             'status': 'success',
@@ -2597,7 +3477,7 @@ def clean_subtitles_endpoint():
             'stats': {
                 'shortened': shortened,
                 'removed': removed,
-                'kept': len(clean_segments),
+                'kept': kept,
                 'backup_path': os.path.basename(backup_path)
             }
         })
@@ -2606,10 +3486,34 @@ def clean_subtitles_endpoint():
         return jsonify({'error': str(e)}), 500
 
 
+# (parsed config dict it was built from, parameters) - rebuilt only when config.yaml changes
+_transcription_defaults = (None, {})
+
+
+def transcription_defaults():
+    """Default job parameters for transcribing an existing file, from config.yaml"""
+    global _transcription_defaults
+    config = load_config()
+    if _transcription_defaults[0] is not config:
+        trans_config = config.get('transcription', {})
+        _transcription_defaults = (config, {
+            'model': trans_config.get('model', 'large-v3'),
+            'device': trans_config.get('device', 'cuda'),
+            'language': trans_config.get('language', 'sr'),
+            'beam_size': trans_config.get('beam_size', 12),
+            'workers': 1,
+            'vad_filter': trans_config.get('vad_filter', False),
+            'compute_type': trans_config.get('compute', 'float16'),
+            'temperature': trans_config.get('temperature', 0.2),
+            'source_type': 'upload',
+            'auto_cleanup': False
+        })
+    return _transcription_defaults[1]
+
+
 @app.route('/api/generate-subtitles', methods=['POST'])
 def generate_subtitles_endpoint():
     """Generate subtitles for existing video file"""
-    import uuid
 
     data = request.get_json()
     file_path = data.get('file_path', '')
@@ -2617,16 +3521,18 @@ def generate_subtitles_endpoint():
     if not file_path:
         return jsonify({'error': 'file_path is required'}), 400
 
-    # Construct full path
-    full_path = os.path.join(app.config['DOWNLOAD_FOLDER'], file_path)
+    # Construct full path (None if it points outside the downloads folder)
+    full_path = safe_download_path(file_path, allow_root=False)
+    if full_path is None:
+        return jsonify({'error': 'Invalid file path'}), 400
 
-    # Validate file exists
-    if not os.path.exists(full_path):
+    # Validate file exists and is a video file
+    try:
+        st = os.stat(full_path)
+    except OSError:
         return jsonify({'error': 'File not found'}), 404
 
-    # Validate it's a video file
-    video_extensions = ['.mp4', '.mkv', '.avi', '.webm', '.mov']
-    if not any(full_path.lower().endswith(ext) for ext in video_extensions):
+    if not stat.S_ISREG(st.st_mode) or os.path.splitext(full_path)[1].lower() not in _VIDEO_EXTENSIONS:
         return jsonify({'error': 'File must be a video file'}), 400
 
     # Check if SRT already exists
@@ -2635,62 +3541,23 @@ def generate_subtitles_endpoint():
         return jsonify({'error': 'Subtitles already exist for this file'}), 400
 
     try:
-        # Load config for default parameters
-        import yaml
-        config = {}
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
-
-        trans_config = config.get('transcription', {})
-
         # Create job parameters from config defaults
-        parameters = {
-            'model': trans_config.get('model', 'large-v3'),
-            'device': trans_config.get('device', 'cuda'),
-            'language': trans_config.get('language', 'sr'),
-            'beam_size': trans_config.get('beam_size', 12),
-            'workers': 1,
-            'vad_filter': trans_config.get('vad_filter', False),
-            'compute_type': trans_config.get('compute', 'float16'),
-            'temperature': trans_config.get('temperature', 0.2),
-            'source_type': 'upload',
-            'auto_cleanup': False
-        }
+        parameters = dict(transcription_defaults())
 
         # Create job ID
-        job_id = str(uuid.uuid4())
+        job_id = _new_job_id()
 
         # Create pseudo-URL for the file
         url = f'file://{full_path}'
 
-        # Save to database
-        conn = get_db()
-        now = datetime.now().isoformat()
-        conn.execute('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                     (job_id, url, 'queued', now, now, json.dumps(parameters), 'transcribe'))
-        conn.commit()
-        conn.close()
+        now = _now_iso()
+        params_json = dumps_json(parameters)
+
+        # Save to database before announcing or starting the job
+        insert_job((job_id, url, 'queued', now, now, params_json, 'transcribe', None, None))
 
         # Emit socket event for immediate UI update
-        try:
-            socketio.emit('job_created', {
-                'id': job_id,
-                'url': url,
-                'status': 'queued',
-                'progress': 0,
-                'created_at': now,
-                'updated_at': now,
-                'parameters': json.dumps(parameters),
-                'job_type': 'transcribe',
-                'parent_job_id': None,
-                'result': None,
-                'error': None
-            })
-            app.logger.debug(f"Emitted job_created event for generate-subtitles job {job_id}")
-        except Exception as e:
-            app.logger.warning(f"Failed to emit job creation event: {e}")
+        emit_job_created(job_id, url, now, params_json, 'transcribe')
 
         # Start background job
         threading.Thread(target=run_transcription_job, args=(job_id, url, parameters), daemon=True).start()
@@ -2724,6 +3591,13 @@ LANGUAGE_NAMES = {
 }
 
 
+def _translate_hint(text, source_lang, target_lang):
+    """Translate one text with a pooled Translator, returning (translated_text, detected_src)"""
+    with borrow_translator() as translator:
+        result = translator.translate(text, src=source_lang, dest=target_lang)
+    return result.text, result.src
+
+
 @app.route('/api/translate', methods=['POST'])
 def translate_text():
     """Translate text in real-time (for subtitle hints)"""
@@ -2739,14 +3613,20 @@ def translate_text():
         return jsonify({'error': 'text is required'}), 400
 
     try:
-        translator = Translator()
-        result = translator.translate(text, src=source_lang, dest=target_lang)
+        # Shares the translation jobs' cache, so repeated hints skip the round-trip
+        key = (text, source_lang, target_lang)
+        cached = _translation_cache.get(key)
+        if cached is None:
+            # The HTTP round-trip runs on a worker thread so it doesn't stall the event loop
+            cached = run_blocking(_translate_hint, text, source_lang, target_lang)
+            _translation_cache.put(key, cached)
+        translated_text, detected_src = cached
 
         return jsonify({
             'status': 'success',
             'original': text,
-            'translated': result.text,
-            'source_lang': result.src,
+            'translated': translated_text,
+            'source_lang': detected_src,
             'target_lang': target_lang
         })
 
@@ -2765,24 +3645,33 @@ def transcode_to_mp4():
         if not file_path:
             return jsonify({'error': 'file_path is required'}), 400
 
-        # Construct full path
-        full_path = os.path.join(app.config['DOWNLOAD_FOLDER'], file_path)
+        # Construct full path (None if it points outside the downloads folder)
+        full_path = safe_download_path(file_path, allow_root=False)
+        if full_path is None:
+            return jsonify({'error': 'Invalid file path'}), 400
 
-        if not os.path.exists(full_path):
+        # One stat for the source; the split is reused for the extension check and output name
+        base, ext = os.path.splitext(full_path)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             return jsonify({'error': 'File not found'}), 404
 
-        # Check if it's a video file
-        video_extensions = ['.avi', '.mkv', '.webm', '.mov', '.flv', '.wmv', '.m4v']
-        if not any(full_path.lower().endswith(ext) for ext in video_extensions):
+        if ext.lower() not in _TRANSCODE_EXTENSIONS:
             return jsonify({'error': 'File is not a transcodable video format'}), 400
 
         # Check if MP4 version already exists
-        output_path = os.path.splitext(full_path)[0] + '.mp4'
-        if os.path.exists(output_path):
+        output_path = base + '.mp4'
+        try:
+            os.stat(output_path)
             return jsonify({'error': 'MP4 version already exists'}), 400
+        except OSError:
+            pass
 
         # Create job ID
-        job_id = str(uuid.uuid4())
+        job_id = _new_job_id()
 
         # Create job parameters
         parameters = {
@@ -2791,42 +3680,18 @@ def transcode_to_mp4():
             'job_type': 'transcode'
         }
 
-        # Save to database
-        conn = get_db()
         now = datetime.now().isoformat()
         url = f'transcode://{file_path}'
-        conn.execute('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                     (job_id, url, 'queued', now, now, json.dumps(parameters), 'transcode'))
-        conn.commit()
-        conn.close()
+        params_json = dumps_json(parameters)
+
+        # Save to database before announcing or starting the job
+        insert_job((job_id, url, 'queued', now, now, params_json, 'transcode', None, None))
 
         # Emit socket event for immediate UI update
-        try:
-            socketio.emit('job_created', {
-                'id': job_id,
-                'url': url,
-                'status': 'queued',
-                'progress': 0,
-                'created_at': now,
-                'updated_at': now,
-                'parameters': json.dumps(parameters),
-                'job_type': 'transcode',
-                'parent_job_id': None,
-                'result': None,
-                'error': None
-            })
-            app.logger.debug(f"Emitted job_created event for transcode job {job_id}")
-        except Exception as e:
-            app.logger.warning(f"Failed to emit job creation event: {e}")
+        emit_job_created(job_id, url, now, params_json, 'transcode')
 
         # Start transcoding job in background
-        thread = threading.Thread(
-            target=run_transcode_job,
-            args=(job_id, full_path, output_path),
-            daemon=True
-        )
-        thread.start()
+        start_limited_job(job_id, run_transcode_job, full_path, output_path)
 
         return jsonify({
             'status': 'success',
@@ -2853,18 +3718,20 @@ def translate_subtitle():
     if not file_path:
         return jsonify({'error': 'file_path is required'}), 400
 
-    # Construct full path
-    full_path = os.path.join(app.config['DOWNLOAD_FOLDER'], file_path)
+    # Construct full path (None if it points outside the downloads folder)
+    full_path = safe_download_path(file_path, allow_root=False)
+    if full_path is None:
+        return jsonify({'error': 'Invalid file path'}), 400
 
     if not os.path.exists(full_path):
         return jsonify({'error': 'File not found'}), 404
 
-    if not full_path.endswith('.srt'):
+    if os.path.splitext(full_path)[1] != '.srt':
         return jsonify({'error': 'Only SRT files are supported'}), 400
 
     try:
         # Create job ID
-        job_id = str(uuid.uuid4())
+        job_id = _new_job_id()
 
         # Create job parameters
         parameters = {
@@ -2874,43 +3741,18 @@ def translate_subtitle():
             'job_type': 'translate'
         }
 
-        # Save to database
-        conn = get_db()
         now = datetime.now().isoformat()
         url = f'translate://{file_path}'
-        conn.execute('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                     (job_id, url, 'queued', now, now,
-                      json.dumps(parameters), 'translate'))
-        conn.commit()
-        conn.close()
+        params_json = dumps_json(parameters)
+
+        # Save to database before announcing or starting the job
+        insert_job((job_id, url, 'queued', now, now, params_json, 'translate', None, None))
 
         # Emit socket event for immediate UI update
-        try:
-            socketio.emit('job_created', {
-                'id': job_id,
-                'url': url,
-                'status': 'queued',
-                'progress': 0,
-                'created_at': now,
-                'updated_at': now,
-                'parameters': json.dumps(parameters),
-                'job_type': 'translate',
-                'parent_job_id': None,
-                'result': None,
-                'error': None
-            })
-            app.logger.debug(f"Emitted job_created event for translation job {job_id}")
-        except Exception as e:
-            app.logger.warning(f"Failed to emit job creation event: {e}")
+        emit_job_created(job_id, url, now, params_json, 'translate')
 
         # Start translation job in background
-        thread = threading.Thread(
-            target=run_translation_job,
-            args=(job_id, full_path, target_lang, source_lang),
-            daemon=True
-        )
-        thread.start()
+        start_limited_job(job_id, run_translation_job, full_path, target_lang, source_lang)
 
         return jsonify({
             'status': 'success',
@@ -2938,7 +3780,7 @@ def upload_temp():
         filename = secure_filename(file.filename)
         temp_path = os.path.join(app.config['UPLOAD_FOLDER'], f'temp_{filename}')
 
-        file.save(temp_path)
+        save_upload(file, temp_path)
 
         return jsonify({
             'status': 'success',
@@ -2953,9 +3795,6 @@ def upload_temp():
 @app.route('/api/detect-audio-streams', methods=['POST'])
 def detect_audio_streams():
     """Detect audio streams in uploaded file"""
-    import subprocess
-    import json as json_module
-
     data = request.get_json()
     temp_path = data.get('temp_path', '')
 
@@ -2963,24 +3802,11 @@ def detect_audio_streams():
         return jsonify({'error': 'File not found'}), 400
 
     try:
-        # Use ffprobe to detect audio streams
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'a',
-            '-show_entries', 'stream=index,codec_name,channels,channel_layout,sample_rate:stream_tags=language,title',
-            '-of', 'json',
-            temp_path
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
+        try:
+            streams = run_blocking(probe_audio_streams, temp_path)
+        except RuntimeError:
             return jsonify({'error': 'Failed to analyze file'}), 500
 
-        data = json_module.loads(result.stdout)
-        streams = data.get('streams', [])
-
         audio_tracks = []
         for i, stream in enumerate(streams):
             tags = stream.get('tags', {})
@@ -3003,40 +3829,26 @@ def detect_audio_streams():
 @app.route('/api/detect-audio-streams-existing', methods=['POST'])
 def detect_audio_streams_existing():
     """Detect audio streams in existing file"""
-    import subprocess
-    import json as json_module
-
     data = request.get_json()
     file_path = data.get('file_path', '')
 
     if not file_path:
         return jsonify({'error': 'File path is required'}), 400
 
-    # Construct full path
-    full_path = os.path.join(app.config['DOWNLOAD_FOLDER'], file_path)
+    # Construct full path (None if it points outside the downloads folder)
+    full_path = safe_download_path(file_path, allow_root=False)
+    if full_path is None:
+        return jsonify({'error': 'Invalid file path'}), 400
 
     if not os.path.exists(full_path):
         return jsonify({'error': 'File not found'}), 404
 
     try:
-        # Use ffprobe to detect audio streams
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'a',
-            '-show_entries', 'stream=index,codec_name,channels,channel_layout,sample_rate:stream_tags=language,title',
-            '-of', 'json',
-            full_path
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
+        try:
+            streams = run_blocking(probe_audio_streams, full_path)
+        except RuntimeError:
             return jsonify({'error': 'Failed to analyze file'}), 500
 
-        data = json_module.loads(result.stdout)
-        streams = data.get('streams', [])
-
         audio_tracks = []
         for i, stream in enumerate(streams):
             tags = stream.get('tags', {})
@@ -3076,18 +3888,15 @@ def upload_file():
             return jsonify({'error': 'Invalid filename'}), 400
 
         # Validate file extension (only allow videos and subtitles)
-        allowed_extensions = ['.mp4', '.mkv', '.avi', '.webm', '.mov', '.srt', '.vtt', '.ass']
         file_ext = os.path.splitext(filename)[1].lower()
-        if file_ext not in allowed_extensions:
+        if file_ext not in _UPLOAD_EXTENSIONS:
             return jsonify({'error': f'File type {file_ext} not allowed. Only video and subtitle files are permitted.'}), 400
 
         # Build target directory path
-        if target_folder:
-            # Security: prevent directory traversal
-            target_folder = target_folder.replace('..', '').strip('/')
-            target_dir = os.path.join(app.config['DOWNLOAD_FOLDER'], target_folder)
-        else:
-            target_dir = app.config['DOWNLOAD_FOLDER']
+        # Security: prevent directory traversal
+        target_dir = safe_download_path(target_folder)
+        if target_dir is None:
+            return jsonify({'error': 'Invalid target folder'}), 400
 
         # Create target directory if it doesn't exist
         os.makedirs(target_dir, exist_ok=True)
@@ -3104,14 +3913,13 @@ def upload_file():
             file_path = os.path.join(target_dir, filename)
 
         # Check available disk space (require at least 100MB free)
-        import shutil
-        stat = shutil.disk_usage(app.config['DOWNLOAD_FOLDER'])
-        free_space_mb = stat.free / (1024 * 1024)
+        usage = shutil.disk_usage(app.config['DOWNLOAD_FOLDER'])
+        free_space_mb = usage.free / (1024 * 1024)
         if free_space_mb < 100:
             return jsonify({'error': f'Insufficient disk space (only {free_space_mb:.0f}MB available)'}), 507
 
         # Save file
-        file.save(file_path)
+        save_upload(file, file_path)
 
         # Get relative path for response
         rel_path = os.path.relpath(file_path, app.config['DOWNLOAD_FOLDER']).replace('\\', '/')
@@ -3136,13 +3944,27 @@ def upload_file():
         return jsonify({'error': f'Upload failed: {str(e)}'}), 500
 
 
+# ((mtime_ns, size), status dict) for the last cookie file seen
+_cookie_status_cache = (None, None)
+
+
 @app.route('/api/cookie-status', methods=['GET'])
 def check_cookie_status():
     """Check if youtube_cookies.txt exists"""
+    global _cookie_status_cache
     cookie_path = 'youtube_cookies.txt'
 
-    if os.path.exists(cookie_path):
-        file_size = os.path.getsize(cookie_path)
+    try:
+        st = os.stat(cookie_path)
+    except FileNotFoundError:
+        return jsonify({
+            'exists': False
+        })
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached_key, status = _cookie_status_cache
+    if cached_key != key:
+        file_size = st.st_size
         # Format file size
         if file_size < 1024:
             size_str = f"{file_size} B"
@@ -3151,20 +3973,18 @@ def check_cookie_status():
         else:
             size_str = f"{file_size / (1024 * 1024):.1f} MB"
 
-        # Get last modified time
-        mtime = os.path.getmtime(cookie_path)
-        modified = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')
+        # Last modified time
+        modified = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M')
 
-        return jsonify({
+        status = {
             'exists': True,
             'filename': 'youtube_cookies.txt',
             'size': size_str,
             'modified': modified
-        })
-    else:
-        return jsonify({
-            'exists': False
-        })
+        }
+        _cookie_status_cache = (key, status)
+
+    return jsonify(status)
 
 
 @app.route('/api/jobs/clear', methods=['POST'])
@@ -3174,13 +3994,10 @@ def clear_jobs():
     statuses = data.get('statuses', ['completed', 'failed'])
 
     try:
-        conn = get_db()
         placeholders = ','.join('?' for _ in statuses)
         query = f'DELETE FROM jobs WHERE status IN ({placeholders})'
-        cursor = conn.execute(query, statuses)
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with db_pool.writer() as conn:
+            deleted_count = conn.execute(query, statuses).rowcount
 
         return jsonify({
             'status': 'success',
@@ -3193,23 +4010,21 @@ def clear_jobs():
 @app.route('/api/jobs/<job_id>/restart', methods=['POST'])
 def restart_job(job_id):
     """Restart a job with the same parameters"""
-    import uuid
 
     try:
         # Get the original job
-        conn = get_db()
-        cursor = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
-        job = cursor.fetchone()
+        with db_pool.reader() as conn:
+            job = conn.execute('SELECT url, parameters, job_type FROM jobs WHERE id = ?', (job_id,)).fetchone()
 
         if not job:
             return jsonify({'error': 'Job not found'}), 404
 
         # Create new job ID
-        new_job_id = str(uuid.uuid4())
+        new_job_id = _new_job_id()
 
         # Copy job data
-        url = job[1]  # url column
-        parameters = job[6]  # parameters column (index 6, not 5!)
+        url = job['url']
+        parameters = job['parameters']
         now = datetime.now().isoformat()
 
         # Debug: log parameters to see what we're working with
@@ -3219,7 +4034,7 @@ def restart_job(job_id):
         # Parse parameters to validate
         try:
             if isinstance(parameters, str):
-                params = json.loads(parameters)
+                params = loads_json(parameters)
             elif isinstance(parameters, dict):
                 params = parameters
             else:
@@ -3230,47 +4045,31 @@ def restart_job(job_id):
             return jsonify({'error': f'Invalid parameters format: {str(e)}', 'raw': str(parameters)[:200]}), 400
 
         # Ensure video_title is set (extract from URL if missing)
+        title_added = False
         if not params.get('video_title') or params.get('video_title') == 'Unknown Video':
             if url.startswith('file://'):
                 # Extract filename from file:// URL
                 file_path = url.replace('file://', '')
-                video_title = os.path.splitext(os.path.basename(file_path))[0]
+                video_title = Path(file_path).stem
                 # Remove YouTube ID pattern [xxx]
-                video_title = re.sub(r'\s*\[[a-zA-Z0-9_-]{11}\]$', '', video_title)
-                params['video_title'] = video_title.strip() or "Video"
+                params['video_title'] = _YT_ID_RE.sub('', video_title).strip() or "Video"
                 app.logger.info(f"Extracted video title: {params['video_title']}")
+                title_added = True
 
-        # Convert back to string for storage
-        parameters_str = json.dumps(params)
+        # Convert back to string for storage; unchanged parameters keep the stored string
+        if title_added or not isinstance(parameters, str):
+            parameters_str = dumps_json(params)
+        else:
+            parameters_str = parameters
 
         # Get job type from original job
-        job_type = job[9] if len(job) > 9 else 'transcribe'  # job_type column is index 9
+        job_type = job['job_type'] or 'transcribe'
 
-        # Insert new job with correct job_type
-        conn.execute('''INSERT INTO jobs (id, url, status, created_at, updated_at, parameters, job_type)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                     (new_job_id, url, 'queued', now, now, parameters_str, job_type))
-        conn.commit()
-        conn.close()
+        # Save to database before announcing or starting the job
+        insert_job((new_job_id, url, 'queued', now, now, parameters_str, job_type, None, None))
 
         # Emit socket event for immediate UI update
-        try:
-            socketio.emit('job_created', {
-                'id': new_job_id,
-                'url': url,
-                'status': 'queued',
-                'progress': 0,
-                'created_at': now,
-                'updated_at': now,
-                'parameters': parameters_str,
-                'job_type': job_type,
-                'parent_job_id': None,
-                'result': None,
-                'error': None
-            })
-            app.logger.debug(f"Emitted job_created event for restarted job {new_job_id}")
-        except Exception as e:
-            app.logger.warning(f"Failed to emit job creation event: {e}")
+        emit_job_created(new_job_id, url, now, parameters_str, job_type)
 
         # Start background job with correct handler based on job type
         app.logger.info(f"Restarting job {job_id} as new job {new_job_id} with type '{job_type}'")
@@ -3282,14 +4081,14 @@ def restart_job(job_id):
             srt_file = params.get('srt_file', '')
             target_lang = params.get('target_lang', 'en')
             source_lang = params.get('source_lang', 'auto')
-            threading.Thread(target=run_translation_job, args=(new_job_id, srt_file, target_lang, source_lang), daemon=True).start()
+            start_limited_job(new_job_id, run_translation_job, srt_file, target_lang, source_lang)
         elif job_type == 'transcode':
             # For transcode jobs, extract input and output paths
             source_file = params.get('source_file', '')
             output_file = params.get('output_file', '')
             input_path = os.path.join(app.config['DOWNLOAD_FOLDER'], source_file)
             output_path = os.path.join(app.config['DOWNLOAD_FOLDER'], os.path.dirname(source_file), output_file)
-            threading.Thread(target=run_transcode_job, args=(new_job_id, input_path, output_path), daemon=True).start()
+            start_limited_job(new_job_id, run_transcode_job, input_path, output_path)
         else:  # transcribe
             threading.Thread(target=run_transcription_job, args=(new_job_id, url, params), daemon=True).start()
 
@@ -3300,7 +4099,6 @@ def restart_job(job_id):
             'message': f'Job restarted successfully as {job_type} job'
         })
     except Exception as e:
-        import traceback
         error_details = traceback.format_exc()
         app.logger.error(f"Restart job error: {error_details}")
         return jsonify({'error': str(e), 'details': error_details}), 500
@@ -3311,20 +4109,22 @@ def cancel_job(job_id):
     """Cancel a running or queued job"""
     try:
         # Check if job exists and is in a cancellable state
-        conn = get_db()
-        cursor = conn.execute('SELECT status, url FROM jobs WHERE id = ?', (job_id,))
-        job = cursor.fetchone()
-        conn.close()
+        with db_pool.reader() as conn:
+            job = conn.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
 
         if not job:
             return jsonify({'error': 'Job not found'}), 404
 
-        status = job[0]
-        url = job[1]
+        status = job['status']
 
         if status not in ['queued', 'running']:
             return jsonify({'error': f'Cannot cancel job with status: {status}'}), 400
 
+        # Let job loops that poll for cancellation stop on their own
+        cancel_event = cancel_events.get(job_id)
+        if cancel_event:
+            cancel_event.set()
+
         # Kill associated ffmpeg process if it exists
         if job_id in active_job_processes:
             process = active_job_processes[job_id]
@@ -3334,20 +4134,24 @@ def cancel_job(job_id):
                 # Kill the process and all its children (Windows)
                 try:
                     parent = psutil.Process(process.pid)
-                    children = parent.children(recursive=True)
+                    procs = parent.children(recursive=True)
+                    procs.append(parent)
 
-                    # Kill children first
-                    for child in children:
+                    # Kill children first, then the parent, without waiting in between
+                    for proc in procs:
                         try:
-                            app.logger.info(f"Killing child process {child.pid}")
-                            child.kill()
+                            if proc is not parent:
+                                app.logger.info(f"Killing child process {proc.pid}")
+                            proc.kill()
                         except psutil.NoSuchProcess:
                             pass
 
-                    # Then kill parent
-                    parent.kill()
-                    parent.wait(timeout=3)
-                    app.logger.info(f"✓ Successfully killed process {process.pid}")
+                    # Reap the whole tree in one wait instead of one per process
+                    _, alive = psutil.wait_procs(procs, timeout=3)
+                    if alive:
+                        app.logger.warning(f"Processes still alive after kill: {[p.pid for p in alive]}")
+                    else:
+                        app.logger.info(f"✓ Successfully killed process {process.pid}")
                 except psutil.NoSuchProcess:
                     app.logger.warning(f"Process {process.pid} already terminated")
                 except Exception as e:
@@ -3360,10 +4164,7 @@ def cancel_job(job_id):
             except Exception as e:
                 app.logger.error(f"Error killing process for job {job_id}: {e}")
 
-        # Delete generated WAV file if it exists
-        cleanup_wav_file(job_id)
-
-        # Update job status to cancelled
+        # Update job status to cancelled (this also deletes any generated WAV file)
         update_job_status(job_id, 'cancelled', 0)
         app.logger.info(f"Job {job_id} cancelled by user")
 
@@ -3377,11 +4178,8 @@ def cancel_job(job_id):
 def delete_job(job_id):
     """Delete a job from the database"""
     try:
-        conn = get_db()
-        cursor = conn.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with db_pool.writer() as conn:
+            deleted = conn.execute('DELETE FROM jobs WHERE id = ?', (job_id,)).rowcount
 
         if deleted == 0:
             return jsonify({'error': 'Job not found'}), 404
@@ -3398,9 +4196,8 @@ def create_transcription_from_download(job_id):
     """Manually create transcription job(s) from a completed download job"""
     try:
         # Get the download job
-        conn = get_db()
-        job = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
-        conn.close()
+        with db_pool.reader() as conn:
+            job = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
 
         if not job:
             return jsonify({'error': 'Job not found'}), 404
@@ -3417,7 +4214,7 @@ def create_transcription_from_download(job_id):
 
         # Parse parameters
         try:
-            parameters = json.loads(job_dict['parameters'])
+            parameters = loads_json(job_dict['parameters'])
         except:
             parameters = {}
 
@@ -3427,25 +4224,18 @@ def create_transcription_from_download(job_id):
 
         app.logger.info(f"Scanning {download_dir} for video files...")
 
-        for root, dirs, files in os.walk(download_dir):
-            for file in files:
-                if file.endswith(('.mp4', '.mkv', '.webm', '.avi', '.mov')):
-                    file_path = os.path.join(root, file)
-                    # Check if file was modified in last hour (recently downloaded)
-                    import time
-                    if time.time() - os.path.getmtime(file_path) < 3600:
-                        video_files.append(file_path)
-                        app.logger.info(f"Found recent video: {file_path}")
+        # Files modified in the last hour (recently downloaded); one scandir pass using
+        # the cached DirEntry stat rather than os.walk plus a getmtime per file
+        cutoff = time.time() - 3600
+        for file_path in _walk_recent(download_dir, ('.mp4', '.mkv', '.webm', '.avi', '.mov'), cutoff):
+            video_files.append(file_path)
+            app.logger.info(f"Found recent video: {file_path}")
 
         if not video_files:
             return jsonify({'error': 'No video files found in download directory'}), 404
 
         # Create transcription jobs
-        transcription_jobs = []
-        for video_path in video_files:
-            transcribe_job_id = create_transcription_job(job_id, video_path, parameters)
-            if transcribe_job_id:
-                transcription_jobs.append(transcribe_job_id)
+        transcription_jobs = create_transcription_jobs(job_id, video_files, parameters)
 
         return jsonify({
             'status': 'success',
@@ -3458,121 +4248,215 @@ def create_transcription_from_download(job_id):
         return jsonify({'error': str(e)}), 500
 
 
+# cpu_percent(interval=None) reports usage since its previous call instead of sleeping to
+# sample; prime it here so the first /api/system-info gets a meaningful figure. The process
+# figure is tracked per Process object, so system-info keeps reusing this one.
+psutil.cpu_percent(interval=None)
+_current_process = psutil.Process()
+_current_process.cpu_percent(interval=None)
+
+# Host details don't change while the process runs (platform.processor() can even spawn
+# `uname -p`), so collect them once
+_STATIC_SYSTEM_INFO = {
+    'platform': platform.system(),
+    'platform_release': platform.release(),
+    'platform_version': platform.version(),
+    'architecture': platform.machine(),
+    'processor': platform.processor(),
+    'python_version': platform.python_version(),
+    'cpu_count_physical': psutil.cpu_count(logical=False),
+    'cpu_count_logical': psutil.cpu_count(logical=True)
+}
+
+
+def _dir_usage(root):
+    """Return (total_bytes, file_count) for regular files under root, not following symlinks"""
+    total_size = 0
+    file_count = 0
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            file_count += 1
+                    except OSError:
+                        # Removed while we were scanning
+                        continue
+        except OSError:
+            continue
+    return total_size, file_count
+
+
+_gpu_info = None
+_gpu_info_lock = threading.Lock()
+
+
+def _probe_gpu_info():
+    """Query PyTorch for the CUDA devices visible to this process"""
+    gpu_info = {'available': False}
+    try:
+        import torch
+        if torch.cuda.is_available():
+            gpu_count = torch.cuda.device_count()
+            gpu_devices = []
+            for i in range(gpu_count):
+                props = torch.cuda.get_device_properties(i)
+                gpu_devices.append({
+                    'id': i,
+                    'name': props.name,
+                    'total_memory_gb': round(props.total_memory / (1024**3), 2),
+                    'capability': f"{props.major}.{props.minor}",
+                    'multi_processor_count': props.multi_processor_count
+                })
+
+            gpu_info = {
+                'available': True,
+                'count': gpu_count,
+                'devices': gpu_devices,
+                'cuda_version': torch.version.cuda,
+                'cudnn_version': torch.backends.cudnn.version() if torch.backends.cudnn.is_available() else None
+            }
+    except ImportError:
+        gpu_info['message'] = 'PyTorch not installed'
+    except Exception as e:
+        gpu_info['error'] = str(e)
+    return gpu_info
+
+
+def get_gpu_info():
+    """GPU details for /api/system-info.
+
+    The device list can't change while the process runs, so torch is asked once, on
+    first use rather than at import, to keep CUDA out of startup and forked workers.
+    """
+    global _gpu_info
+    if _gpu_info is None:
+        with _gpu_info_lock:
+            if _gpu_info is None:
+                _gpu_info = _probe_gpu_info()
+    return _gpu_info
+
+
+# /api/system-info is polled by the dashboard; the slower figures are reused for a few
+# seconds instead of being recomputed on every poll
+DISK_USAGE_TTL = 2
+DB_HEALTH_TTL = 5
+DIR_SIZES_TTL = 30
+_ttl_cache = {}
+_ttl_cache_lock = threading.Lock()
+
+
+def _cached(key, ttl, fn, *args):
+    """Return fn(*args), reusing the value stored under key if it is under ttl seconds old"""
+    now = time.monotonic()
+    with _ttl_cache_lock:
+        entry = _ttl_cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    value = fn(*args)
+    with _ttl_cache_lock:
+        _ttl_cache[key] = (now, value)
+    return value
+
+
+def _db_health():
+    """Database file size and job count for /api/system-info"""
+    try:
+        db_size = os.stat(db_pool.db_path).st_size
+        db_exists = True
+    except OSError:
+        db_size = 0
+        db_exists = False
+    db_health = {
+        'exists': db_exists,
+        'size': db_size,
+        'size_mb': round(db_size / (1024*1024), 2)
+    }
+
+    # Try to count records
+    try:
+        with db_pool.reader() as conn:
+            job_count = conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+        db_health['job_count'] = job_count
+        db_health['accessible'] = True
+    except Exception as e:
+        db_health['accessible'] = False
+        db_health['error'] = str(e)
+    return db_health
+
+
+def _dir_sizes(download_folder):
+    """Size and file count of the app's data directories for /api/system-info"""
+    directories = {
+        'downloads': download_folder,
+        'uploads': 'uploads',
+        'logs': 'logs',
+        'backups': 'backups'
+    }
+
+    dir_sizes = {}
+    for name, path in directories.items():
+        if os.path.isdir(path):
+            total_size, file_count = _dir_usage(path)
+            dir_sizes[name] = {
+                'size_bytes': total_size,
+                'size_mb': round(total_size / (1024*1024), 2),
+                'size_gb': round(total_size / (1024*1024*1024), 2),
+                'file_count': file_count,
+                'exists': True
+            }
+        else:
+            dir_sizes[name] = {'exists': False, 'size_mb': 0, 'file_count': 0}
+    return dir_sizes
+
+
 @app.route('/api/system-info')
 def get_system_info():
     """Get comprehensive system information including health metrics"""
     try:
-        import platform
-        import shutil
 
         # System Status
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Usage since the previous request (non-blocking)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
 
         # Disk Usage
-        disk = psutil.disk_usage('.')
+        disk = _cached('disk_usage', DISK_USAGE_TTL, psutil.disk_usage, '.')
 
         # Database Health
-        db_path = 'whisper_jobs.db'
-        db_health = {
-            'exists': os.path.exists(db_path),
-            'size': os.path.getsize(db_path) if os.path.exists(db_path) else 0,
-            'size_mb': round(os.path.getsize(db_path) / (1024*1024), 2) if os.path.exists(db_path) else 0
-        }
-
-        # Try to count records
-        try:
-            conn = get_db()
-            job_count = conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
-            db_health['job_count'] = job_count
-            conn.close()
-            db_health['accessible'] = True
-        except Exception as e:
-            db_health['accessible'] = False
-            db_health['error'] = str(e)
+        db_health = _cached('db_health', DB_HEALTH_TTL, _db_health)
 
         # Directory Sizes
-        directories = {
-            'downloads': app.config['DOWNLOAD_FOLDER'],
-            'uploads': 'uploads',
-            'logs': 'logs',
-            'backups': 'backups'
-        }
-
-        dir_sizes = {}
-        for name, path in directories.items():
-            if os.path.exists(path):
-                total_size = 0
-                file_count = 0
-                for root, dirs, files in os.walk(path):
-                    for file in files:
-                        fp = os.path.join(root, file)
-                        if os.path.exists(fp):
-                            total_size += os.path.getsize(fp)
-                            file_count += 1
-                dir_sizes[name] = {
-                    'size_bytes': total_size,
-                    'size_mb': round(total_size / (1024*1024), 2),
-                    'size_gb': round(total_size / (1024*1024*1024), 2),
-                    'file_count': file_count,
-                    'exists': True
-                }
-            else:
-                dir_sizes[name] = {'exists': False, 'size_mb': 0, 'file_count': 0}
+        download_folder = app.config['DOWNLOAD_FOLDER']
+        # The walk is O(files), so a stale result runs off the event loop
+        dir_sizes = _cached(('dir_sizes', download_folder), DIR_SIZES_TTL, run_blocking, _dir_sizes, download_folder)
 
         # Process Information
-        current_process = psutil.Process()
-        process_info = {
-            'pid': current_process.pid,
-            'name': current_process.name(),
-            'status': current_process.status(),
-            'cpu_percent': current_process.cpu_percent(interval=0.1),
-            'memory_mb': round(current_process.memory_info().rss / (1024*1024), 2),
-            'memory_percent': round(current_process.memory_percent(), 2),
-            'threads': current_process.num_threads(),
-            'create_time': datetime.fromtimestamp(current_process.create_time()).isoformat()
-        }
+        current_process = _current_process
+        # oneshot() reads each /proc file once for all the getters below
+        with current_process.oneshot():
+            process_info = {
+                'pid': current_process.pid,
+                'name': current_process.name(),
+                'status': current_process.status(),
+                # Usage since the previous request (non-blocking)
+                'cpu_percent': current_process.cpu_percent(interval=None),
+                'memory_mb': round(current_process.memory_info().rss / (1024*1024), 2),
+                'memory_percent': round(current_process.memory_percent(), 2),
+                'threads': current_process.num_threads(),
+                'create_time': datetime.fromtimestamp(current_process.create_time()).isoformat()
+            }
 
         # CUDA/GPU Information
-        gpu_info = {'available': False}
-        try:
-            import torch
-            if torch.cuda.is_available():
-                gpu_count = torch.cuda.device_count()
-                gpu_devices = []
-                for i in range(gpu_count):
-                    props = torch.cuda.get_device_properties(i)
-                    gpu_devices.append({
-                        'id': i,
-                        'name': props.name,
-                        'total_memory_gb': round(props.total_memory / (1024**3), 2),
-                        'capability': f"{props.major}.{props.minor}",
-                        'multi_processor_count': props.multi_processor_count
-                    })
-
-                gpu_info = {
-                    'available': True,
-                    'count': gpu_count,
-                    'devices': gpu_devices,
-                    'cuda_version': torch.version.cuda,
-                    'cudnn_version': torch.backends.cudnn.version() if torch.backends.cudnn.is_available() else None
-                }
-        except ImportError:
-            gpu_info['message'] = 'PyTorch not installed'
-        except Exception as e:
-            gpu_info['error'] = str(e)
+        gpu_info = get_gpu_info()
 
         # System Information
-        system_info = {
-            'platform': platform.system(),
-            'platform_release': platform.release(),
-            'platform_version': platform.version(),
-            'architecture': platform.machine(),
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'cpu_count_physical': psutil.cpu_count(logical=False),
-            'cpu_count_logical': psutil.cpu_count(logical=True)
-        }
+        system_info = _STATIC_SYSTEM_INFO
 
         return jsonify({
             'status': 'success',
@@ -3603,54 +4487,41 @@ def get_system_info():
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
-    app.logger.info(f"✓ WebSocket client connected: {request.sid}")
+    app.logger.info("✓ WebSocket client connected: %s", request.sid)
 
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
-    app.logger.info(f"✗ WebSocket client disconnected: {request.sid}")
+    app.logger.info("✗ WebSocket client disconnected: %s", request.sid)
 
 
 if __name__ == '__main__':
     import argparse
-    import logging
-    import sys
 
     # Suppress socket connection reset errors (happens when browser closes connection)
+    _CONNECTION_NOISE_EXC = ('ConnectionResetError', 'BrokenPipeError', 'ConnectionAbortedError', 'OSError')
+    _CONNECTION_NOISE_RE = re.compile(
+        r'ConnectionResetError|WinError 1005[34]|BrokenPipeError|forcibly closed|Connection reset|Broken pipe'
+        r'|Traceback|File "'
+    )
+
     class ConnectionResetFilter(logging.Filter):
         def filter(self, record):
-            # Filter connection reset errors and broken pipe errors
-            msg = str(record.msg) if hasattr(record, 'msg') else str(record)
+            # The library loggers below are clamped to ERROR, so anything quieter is our own logging
+            if record.levelno < logging.ERROR:
+                return True
 
             # Check exception info
-            if hasattr(record, 'exc_info') and record.exc_info:
+            if record.exc_info:
                 exc_type = record.exc_info[0]
-                if exc_type and exc_type.__name__ in ['ConnectionResetError', 'BrokenPipeError',
-                                                       'ConnectionAbortedError', 'OSError']:
+                if exc_type and exc_type.__name__ in _CONNECTION_NOISE_EXC:
                     return False
 
-            # Check message content
-            if any(x in msg for x in [
-                'ConnectionResetError',
-                'WinError 10054',
-                'WinError 10053',
-                'BrokenPipeError',
-                'forcibly closed',
-                'Connection reset',
-                'Broken pipe'
-            ]):
-                return False
-
-            # Check if it's a traceback line
-            if 'Traceback' in msg or 'File "' in msg:
-                return False
-
-            return True
+            # Filter connection reset errors, broken pipe errors and stray traceback lines
+            return not _CONNECTION_NOISE_RE.search(str(record.msg))
 
     # Monkey-patch sys.excepthook to suppress connection errors in tracebacks
-    import sys
-    import io
     original_excepthook = sys.excepthook
 
     def silent_excepthook(exc_type, exc_value, exc_traceback):
@@ -3663,6 +4534,9 @@ if __name__ == '__main__':
     sys.excepthook = silent_excepthook
 
     # Wrap stderr to filter connection reset errors from eventlet tracebacks
+    _TRACEBACK_END_RE = re.compile(r'Error:|Exception:')
+    _CONNECTION_ERROR_RE = re.compile(r'ConnectionResetError|WinError 1005[34]|BrokenPipeError|forcibly closed')
+
     class FilteredStderr:
         def __init__(self, original_stderr):
             self.original_stderr = original_stderr
@@ -3681,16 +4555,10 @@ if __name__ == '__main__':
                 self.traceback_buffer.append(text)
 
                 # Check if this is the error line (end of traceback)
-                if any(err in text for err in ['Error:', 'Exception:']):
+                if _TRACEBACK_END_RE.search(text):
                     # Check if it's a connection error
                     traceback_text = ''.join(self.traceback_buffer)
-                    if any(x in traceback_text for x in [
-                        'ConnectionResetError',
-                        'WinError 10054',
-                        'WinError 10053',
-                        'BrokenPipeError',
-                        'forcibly closed'
-                    ]):
+                    if _CONNECTION_ERROR_RE.search(traceback_text):
                         # Drop the entire traceback
                         self.in_traceback = False
                         self.traceback_buffer = []
@@ -3715,18 +4583,16 @@ if __name__ == '__main__':
 
     sys.stderr = FilteredStderr(sys.stderr)
 
-    # Apply filter to multiple loggers
-    for logger_name in ['werkzeug', 'eventlet.wsgi.server', 'eventlet.wsgi', 'eventlet', 'socketio', 'root']:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(logging.ERROR)
-        logger.addFilter(ConnectionResetFilter())
-        for handler in logger.handlers:
-            handler.addFilter(ConnectionResetFilter())
-
-    # Also filter root logger and add handler
-    logging.root.addFilter(ConnectionResetFilter())
+    # Quiet the server libraries; their records propagate to the root handlers
+    for logger_name in ['werkzeug', 'eventlet.wsgi.server', 'eventlet.wsgi', 'eventlet', 'socketio']:
+        logging.getLogger(logger_name).setLevel(logging.ERROR)
     logging.root.setLevel(logging.ERROR)
 
+    # Their records all reach the root handlers, so one shared filter there covers them
+    connection_reset_filter = ConnectionResetFilter()
+    for handler in logging.root.handlers:
+        handler.addFilter(connection_reset_filter)
+
     parser = argparse.ArgumentParser()
     parser.add_argument('--port', type=int, default=5555, help='Port to run on (default: 5555)')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
@@ -3744,4 +4610,7 @@ if __name__ == '__main__':
     logger.info(f"🔧 Debug mode: {debug_mode}")
     logger.info("")
 
+    start_job_update_flusher()
+    threading.Thread(target=sweep_pending_deletes, args=(app.config['DOWNLOAD_FOLDER'],),
+                     daemon=True, name='pending-delete-sweep').start()
     socketio.run(app, host=args.host, port=args.port, debug=debug_mode)